@@ -5,7 +5,8 @@ Handles visual effects like line clears, combos, level ups, and floating text.
 
 import pygame
 import time
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Sequence
+from .particles import ParticleSystem
 
 class FloatingText:
     """Represents floating score text that moves upward and fades."""
@@ -219,14 +220,17 @@ class AnimationManager:
         self.screen_shake: Optional[ScreenShake] = None
         self.level_up: Optional[LevelUpAnimation] = None
         self.combo: Optional[ComboAnimation] = None
+        self.particles = ParticleSystem()
 
     def add_floating_text(self, text: str, x: int, y: int, color: Tuple[int, int, int] = (255, 255, 255)):
         """Add floating score text."""
         self.floating_texts.append(FloatingText(text, x, y, color))
 
-    def add_line_clear(self, lines: List[int], is_tetris: bool = False):
-        """Add line clear animation."""
+    def add_line_clear(self, lines: List[int], is_tetris: bool = False,
+                       colors: Optional[Sequence[Sequence]] = None, board_width: int = 10):
+        """Add line clear animation and burst particles from the cleared cells."""
         self.line_clear = LineClearAnimation(lines, is_tetris)
+        self.particles.emit_lines(lines, board_width, colors, is_tetris=is_tetris)
 
     def add_screen_shake(self, intensity: int = 8):
         """Add screen shake effect."""
@@ -261,10 +265,24 @@ class AnimationManager:
         if self.combo and not self.combo.update():
             self.combo = None
 
+        # Update particles
+        self.particles.update()
+
     def has_line_clear(self) -> bool:
         """Check if line clear animation is active."""
         return self.line_clear is not None
 
+    def is_active(self) -> bool:
+        """Check if any animation or particle is still running."""
+        return bool(
+            self.floating_texts
+            or self.line_clear
+            or self.screen_shake
+            or self.level_up
+            or self.combo
+            or self.particles.is_active()
+        )
+
     def get_screen_offset(self) -> Tuple[int, int]:
         """Get screen shake offset."""
         if self.screen_shake:
@@ -273,12 +291,24 @@ class AnimationManager:
 
     def draw(self, screen: pygame.Surface, board_offset: Tuple[int, int], block_size: int,
              board_width: int, font_title: pygame.font.Font, font_label: pygame.font.Font,
-             font_value: pygame.font.Font, text_color: Tuple[int, int, int]):
-        """Draw all animations."""
+             font_value: pygame.font.Font, text_color: Tuple[int, int, int],
+             clip: Optional[pygame.Rect] = None):
+        """
+        Draw all animations. board_offset is where the board's first cell
+        would be drawn, effects on the board are kept inside clip if given.
+        """
+        previous_clip = screen.get_clip()
+        if clip:
+            screen.set_clip(clip)
+
         # Draw line clear animation
         if self.line_clear:
             self.line_clear.draw(screen, board_offset, block_size, board_width)
 
+        # Draw particles
+        self.particles.draw(screen, board_offset, block_size)
+        screen.set_clip(previous_clip)
+
         # Draw floating texts
         for ft in self.floating_texts:
             ft.draw(screen, font_value)
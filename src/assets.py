@@ -0,0 +1,186 @@
+"""
+Asset archive module for Tetrix.
+Packs sounds, fonts and images into a single indexed file that is
+memory-mapped at runtime.
+
+WAV sounds are also packed as raw samples in the mixer's default format,
+which pygame.mixer.Sound(buffer=...) takes straight from the mapped view:
+no file object and no WAV decoding. pygame still copies the samples into
+the mixer's own memory, the one copy that cannot be avoided. Assets for
+loaders that only take files (other sounds, images, fonts) go through
+open(), which copies them out of the mapping.
+
+Build the archive with:
+    python -m src.assets
+"""
+
+import io
+import mmap
+import os
+import struct
+import sys
+import wave
+from array import array
+from typing import Dict, Optional, Tuple
+
+# Assets live next to the package, never relative to the working directory
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+ARCHIVE_PATH = os.path.join(ASSETS_DIR, 'assets.pak')
+
+PACKED_DIRS = ('sounds', 'fonts', 'images')
+
+# Format of the raw sound entries, pygame.mixer's default: 44.1 kHz, signed 16 bit, stereo
+PCM_FORMAT = (44100, -16, 2)
+
+
+def pcm_name(name: str) -> str:
+    """Archive name of the raw samples of a packed WAV, e.g. sounds/drop.pcm."""
+    return os.path.splitext(name)[0] + '.pcm'
+
+
+def to_pcm(path: str) -> Optional[bytes]:
+    """
+    A WAV file's samples in PCM_FORMAT, or None if it would need
+    resampling or another sample size.
+    """
+    frequency, size, channels = PCM_FORMAT
+    try:
+        with wave.open(path, 'rb') as w:
+            if (w.getframerate() != frequency or w.getsampwidth() != -size // 8
+                    or w.getnchannels() not in (1, channels)):
+                return None
+            mono = w.getnchannels() == 1
+            samples = array('h', w.readframes(w.getnframes()))
+    except (wave.Error, EOFError) as e:
+        print(f"Packing {path} as WAV only: {e}")
+        return None
+    if sys.byteorder == 'big':
+        samples.byteswap()  # WAV is little endian, the mixer native
+    if mono:
+        stereo = array('h', bytes(len(samples) * 4))
+        stereo[0::2] = samples
+        stereo[1::2] = samples
+        samples = stereo
+    return samples.tobytes()
+
+
+class AssetArchive:
+    """
+    Read-only view of a packed asset archive.
+
+    Layout (little endian):
+        header: magic b'TXPK', u16 version, u32 entry count
+        index:  per entry u16 name length, name (utf-8), u64 offset, u64 size
+        data:   entry payloads, offsets are absolute
+    """
+
+    MAGIC = b'TXPK'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHI')
+    ENTRY = struct.Struct('<QQ')
+    NAME_LEN = struct.Struct('<H')
+
+    def __init__(self, path: str):
+        self.path = path
+        # The single open of the archive, the mapping stays valid after close
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self.index = self._read_index()
+
+    def _read_index(self) -> Dict[str, Tuple[int, int]]:
+        """Parse the index into name -> (offset, size)."""
+        magic, version, count = self.HEADER.unpack_from(self._map, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(f"Not a Tetrix asset archive (v{self.VERSION}): {self.path}")
+
+        index = {}
+        pos = self.HEADER.size
+        for _ in range(count):
+            (name_len,) = self.NAME_LEN.unpack_from(self._map, pos)
+            pos += self.NAME_LEN.size
+            name = bytes(self._view[pos:pos + name_len]).decode('utf-8')
+            pos += name_len
+            offset, size = self.ENTRY.unpack_from(self._map, pos)
+            pos += self.ENTRY.size
+            index[name] = (offset, size)
+        return index
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def get(self, name: str) -> Optional[memoryview]:
+        """Get a zero-copy view of an asset's bytes, or None if missing."""
+        entry = self.index.get(name)
+        if entry is None:
+            return None
+        offset, size = entry
+        return self._view[offset:offset + size]
+
+    def open(self, name: str) -> Optional[io.BytesIO]:
+        """Get a copy of an asset as a file object, for loaders that need one."""
+        data = self.get(name)
+        return io.BytesIO(data) if data is not None else None
+
+
+def pack(assets_dir: str = ASSETS_DIR, out_path: str = ARCHIVE_PATH) -> int:
+    """
+    Pack every file of the asset directories into an archive, plus the raw
+    samples of the WAV sounds. Returns the file count.
+    """
+    files = []
+    for sub in PACKED_DIRS:
+        directory = os.path.join(assets_dir, sub)
+        if not os.path.isdir(directory):
+            continue
+        for filename in sorted(os.listdir(directory)):
+            path = os.path.join(directory, filename)
+            if filename.startswith('.') or not os.path.isfile(path):
+                continue
+            files.append((f"{sub}/{filename}", path))
+
+    entries = []
+    for name, path in files:
+        with open(path, 'rb') as f:
+            entries.append((name, f.read()))
+        if name.startswith('sounds/') and name.lower().endswith('.wav'):
+            pcm = to_pcm(path)
+            if pcm is not None:
+                entries.append((pcm_name(name), pcm))
+
+    names = [name.encode('utf-8') for name, _ in entries]
+    index_size = sum(AssetArchive.NAME_LEN.size + len(n) + AssetArchive.ENTRY.size for n in names)
+    offset = AssetArchive.HEADER.size + index_size
+
+    payloads = []
+    index = [AssetArchive.HEADER.pack(AssetArchive.MAGIC, AssetArchive.VERSION, len(entries))]
+    for encoded, (_, data) in zip(names, entries):
+        index.append(AssetArchive.NAME_LEN.pack(len(encoded)) + encoded + AssetArchive.ENTRY.pack(offset, len(data)))
+        payloads.append(data)
+        offset += len(data)
+
+    tmp_path = out_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.writelines(index)
+        f.writelines(payloads)
+    os.replace(tmp_path, out_path)
+    return len(files)
+
+
+_archive = None
+
+def get_archive() -> Optional[AssetArchive]:
+    """Get the shared archive, or None when it has not been built."""
+    global _archive
+    if _archive is None and os.path.exists(ARCHIVE_PATH):
+        try:
+            _archive = AssetArchive(ARCHIVE_PATH)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Ignoring asset archive: {e}")
+    return _archive
+
+
+if __name__ == '__main__':
+    out = sys.argv[1] if len(sys.argv) > 1 else ARCHIVE_PATH
+    count = pack(ASSETS_DIR, out)
+    print(f"Packed {count} assets into {out}")
@@ -5,69 +5,154 @@ Handles loading and playing sound effects.
 
 import pygame
 import os
+import threading
+from .assets import ASSETS_DIR, PCM_FORMAT, get_archive, pcm_name
+from .startup import timer
 
 class SoundManager:
     """
     Manages game sound effects.
+
+    Every sound belongs to a category with its own reserved mixer channels,
+    so spammy sounds like 'move' can never take the channels of important
+    cues. When a category is full, a new sound steals the voice playing the
+    lowest priority sound, or is dropped if everything playing is more
+    important.
     """
-    
-    def __init__(self):
+
+    # name: (file, volume, category, priority, minimum retrigger interval in ms)
+    SOUNDS = {
+        'move': ('move.wav', 0.4, 'move', 0, 60),
+        'hold': ('move.wav', 1.0, 'move', 1, 100),  # Reuse move sound for hold
+        'rotate': ('rotate.wav', 0.5, 'action', 1, 40),
+        'drop': ('drop.wav', 1.0, 'action', 2, 30),
+        'clear': ('clear.wav', 0.6, 'clear', 3, 0),
+        'combo': ('combo.wav', 0.7, 'clear', 3, 0),
+        'levelup': ('levelup.wav', 0.8, 'event', 4, 0),
+        'tetris': ('tetris.wav', 0.8, 'event', 5, 0),
+        'gameover': ('gameover.wav', 1.0, 'event', 5, 0)
+    }
+
+    # Reserved voices per category
+    CHANNELS = {
+        'move': 1,
+        'action': 2,
+        'clear': 2,
+        'event': 2
+    }
+
+    def __init__(self, background: bool = False):
         self.sounds = {}
         self.enabled = True
+        self.loaded = threading.Event()
+
+        self.pools = {}  # category -> list of channels
+        self.voices = {}  # channel -> priority of the sound it last played
+        self.last_played = {}  # sound name -> ticks of its last start
+
+        if background:
+            # Mixer init and WAV decoding happen off the render thread,
+            # play() is a no-op for sounds that are not loaded yet
+            threading.Thread(target=self._init_audio, name='tetrix-audio', daemon=True).start()
+        else:
+            self._init_audio()
+
+    def _init_audio(self):
+        """Initialize the mixer and load all sounds."""
         try:
             pygame.mixer.init()
+            self._setup_channels()
             self._load_sounds()
         except Exception as e:
             print(f"Warning: Audio system failed to initialize. {e}")
             self.enabled = False
+        finally:
+            timer.mark('sounds loaded')
+            self.loaded.set()
+
+    def _setup_channels(self):
+        """Reserve the mixer channels of every category."""
+        total = sum(self.CHANNELS.values())
+        pygame.mixer.set_num_channels(total)
+        # Reserved channels are never picked by a bare Sound.play()
+        pygame.mixer.set_reserved(total)
+
+        index = 0
+        pools = {}
+        for category, count in self.CHANNELS.items():
+            pools[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            index += count
+        self.pools = pools
 
     def _load_sounds(self):
-        """Load sound files from assets directory."""
-        sound_files = {
-            'move': 'move.wav',
-            'rotate': 'rotate.wav',
-            'drop': 'drop.wav',
-            'clear': 'clear.wav',
-            'gameover': 'gameover.wav',
-            'combo': 'combo.wav',
-            'levelup': 'levelup.wav',
-            'tetris': 'tetris.wav',
-            'hold': 'move.wav'  # Reuse move sound for hold
-        }
-        
-        base_path = os.path.join('assets', 'sounds')
-        
-        for name, filename in sound_files.items():
+        """
+        Load sounds from the asset archive, or the assets directory if not
+        packed. Raw samples in the mixer's format are used straight from the
+        mapped archive, anything else is decoded from the packed file.
+        """
+        archive = get_archive()
+        raw = archive is not None and pygame.mixer.get_init() == PCM_FORMAT
+        base_path = os.path.join(ASSETS_DIR, 'sounds')
+
+        for name, (filename, volume, _, _, _) in self.SOUNDS.items():
+            samples = archive.get(pcm_name(f"sounds/{filename}")) if raw else None
+            packed = archive.open(f"sounds/{filename}") if archive and samples is None else None
             path = os.path.join(base_path, filename)
-            if os.path.exists(path):
+            if samples is not None or packed or os.path.exists(path):
                 try:
-                    self.sounds[name] = pygame.mixer.Sound(path)
-                    # Adjust volumes
-                    if name == 'move':
-                        self.sounds[name].set_volume(0.4)
-                    elif name == 'rotate':
-                        self.sounds[name].set_volume(0.5)
-                    elif name == 'clear':
-                        self.sounds[name].set_volume(0.6)
-                    elif name == 'combo':
-                        self.sounds[name].set_volume(0.7)
-                    elif name == 'levelup':
-                        self.sounds[name].set_volume(0.8)
-                    elif name == 'tetris':
-                        self.sounds[name].set_volume(0.8)
+                    if samples is not None:
+                        sound = pygame.mixer.Sound(buffer=samples)
+                    else:
+                        sound = pygame.mixer.Sound(file=packed or path)
+                    sound.set_volume(volume)
+                    # Publish only once fully configured
+                    self.sounds[name] = sound
                 except Exception as e:
                     print(f"Failed to load sound {filename}: {e}")
             else:
                 print(f"Sound file not found: {path}")
 
+    def _pick_channel(self, category: str, priority: int):
+        """Get a free channel of the category, or steal the least important voice."""
+        pool = self.pools.get(category)
+        if not pool:
+            return None
+
+        victim = None
+        for channel in pool:
+            if not channel.get_busy():
+                return channel
+            if victim is None or self.voices.get(channel, 0) < self.voices.get(victim, 0):
+                victim = channel
+
+        if self.voices.get(victim, 0) <= priority:
+            return victim
+        return None
+
     def play(self, sound_name: str):
         """Play a sound effect by name."""
         if not self.enabled:
             return
-            
+
         sound = self.sounds.get(sound_name)
-        if sound:
-            try:
-                sound.play()
-            except:
-                pass
+        if not sound:
+            return
+
+        _, _, category, priority, min_interval = self.SOUNDS[sound_name]
+
+        # Rate limit retriggers, e.g. 'move' under key repeat
+        now = pygame.time.get_ticks()
+        last = self.last_played.get(sound_name)
+        if last is not None and now - last < min_interval:
+            return
+
+        channel = self._pick_channel(category, priority)
+        if channel is None:
+            return
+
+        try:
+            channel.play(sound)
+        except:
+            return
+        self.voices[channel] = priority
+        self.last_played[sound_name] = now
@@ -0,0 +1,244 @@
+"""
+Autoplay module for Tetrix.
+Headless games played by bots through the real Board, Piece and Scoring.
+
+A bot picks a placement for the current piece, a rotation and a column,
+and the simulation applies it the way Game applies a hard drop: drop
+bonus, lock, score, clear, spawn. No pygame is imported, so simulations
+run cheaply in worker processes.
+"""
+
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .board import Board
+from .piece import Piece
+from .rotation import RotationSystem, get_system
+from .scoring import Scoring
+from .score_db import ScoreDatabase
+
+SHAPES = list(Piece.SHAPES)
+
+# Board evaluation weights, per feature of the board after a placement
+DEFAULT_WEIGHTS = {
+    'height': -0.51,  # sum of column heights
+    'lines': 0.76,  # lines cleared by the placement
+    'holes': -0.36,  # empty cells with a filled cell above
+    'bumpiness': -0.18,  # sum of height differences between neighbouring columns
+    'wells': -0.10,  # depth of columns lower than both neighbours
+}
+FEATURES = tuple(DEFAULT_WEIGHTS)
+
+
+def spawn_position(board: Board) -> List[int]:
+    """Where Game spawns a piece."""
+    return board.spawn_position()
+
+
+def placements(board: Board, piece: Piece, system: Optional[RotationSystem] = None) -> List[Tuple[int, int]]:
+    """
+    Every (rotation, x) reachable by rotating at the spawn position with the
+    rotation system's kicks (Game's default one unless given), shifting along
+    the row it ends on and hard dropping. Rotations landing on the same
+    cells are listed once.
+    """
+    system = system or get_system(None)
+    shape = piece.shape_type
+    found = []
+    seen = set()
+    state, x, y = 0, *spawn_position(board)
+    for rotation in range(4):
+        if rotation:
+            # Each press turns from where the last one ended, as in Game
+            turned = system.try_rotate(board, shape, state, x, y)
+            if turned is None:
+                break
+            state, x, y = turned
+        cells = system.cells(shape, state)
+        if not board.fits(cells, x, y):
+            continue
+        # Shift each way until blocked
+        columns = [x]
+        for step in (-1, 1):
+            cx = x + step
+            while board.fits(cells, cx, y):
+                columns.append(cx)
+                cx += step
+        for cx in columns:
+            # Rotations that only move the shape inside its matrix land alike
+            top = min(r for _, r in cells)
+            landing = frozenset((c + cx, r - top) for c, r in cells)
+            if landing not in seen:
+                seen.add(landing)
+                found.append((rotation, cx))
+    return found
+
+
+def drop_cells(board: Board, piece: Piece, rotation: int, x: int) -> Tuple[List[Tuple[int, int]], int]:
+    """Cells of piece after rotating, moving to column x and hard dropping, and the drop distance."""
+    probe = Piece(piece.shape_type)
+    for _ in range(rotation):
+        probe.rotate()
+    probe.position = [x, 0]
+    distance = 0
+    while board.is_valid_position(probe, 0, distance + 1):
+        distance += 1
+    return [(cx, cy + distance) for cx, cy in probe.get_positions()], distance
+
+
+def evaluate(grid: List[List[int]], cells: List[Tuple[int, int]]) -> Dict[str, float]:
+    """Features of the board after locking cells into grid, without modifying it."""
+    height = len(grid)
+    rows = [row[:] for row in grid]
+    for x, y in cells:
+        if y >= 0:
+            rows[y][x] = 1
+    kept = [row for row in rows if not all(row)]
+    cleared = height - len(kept)
+
+    # Cleared rows leave the stack shorter, the empty rows on top don't matter
+    heights = []
+    holes = 0
+    for column in zip(*kept):
+        if 1 in column:
+            top = column.index(1)
+            column_height = len(kept) - top
+            heights.append(column_height)
+            holes += column_height - sum(column)
+        else:
+            heights.append(0)
+
+    bumpiness = sum(abs(a - b) for a, b in zip(heights, heights[1:]))
+    wells = 0
+    last = len(heights) - 1
+    for x, h in enumerate(heights):
+        left = heights[x - 1] if x > 0 else height
+        right = heights[x + 1] if x < last else height
+        if left > h and right > h:
+            wells += min(left, right) - h
+    return {
+        'height': sum(heights),
+        'lines': cleared,
+        'holes': holes,
+        'bumpiness': bumpiness,
+        'wells': wells,
+    }
+
+
+class HeuristicBot:
+    """
+    Places each piece where the weighted board features score highest.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None):
+        self.weights = dict(DEFAULT_WEIGHTS)
+        if weights:
+            self.weights.update(weights)
+
+    def score(self, board: Board, piece: Piece, rotation: int, x: int) -> float:
+        cells, _ = drop_cells(board, piece, rotation, x)
+        features = evaluate(board.grid, cells)
+        return sum(self.weights[name] * value for name, value in features.items())
+
+    def choose(self, board: Board, piece: Piece, next_piece: Optional[Piece] = None,
+               system: Optional[RotationSystem] = None) -> Optional[Tuple[int, int]]:
+        """The best (rotation, x) for piece, None if it cannot be placed."""
+        best = None
+        best_score = None
+        for rotation, x in placements(board, piece, system):
+            value = self.score(board, piece, rotation, x)
+            if best_score is None or value > best_score:
+                best, best_score = (rotation, x), value
+        return best
+
+
+class RandomBot:
+    """
+    Places each piece at a random reachable placement.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+
+    def choose(self, board: Board, piece: Piece, next_piece: Optional[Piece] = None,
+               system: Optional[RotationSystem] = None) -> Optional[Tuple[int, int]]:
+        options = placements(board, piece, system)
+        return self.rng.choice(options) if options else None
+
+
+def memory_scoring() -> Scoring:
+    """A Scoring whose history stays in memory, away from the player's data."""
+    return Scoring(db=ScoreDatabase(':memory:'), sketch_file=None)
+
+
+class Simulation:
+    """
+    One seeded game, advanced a placement at a time.
+
+    on_lock, if given, is called as on_lock(simulation, cleared_rows, score_info)
+    after each lock, before the rows are cleared, as Game starts its
+    line clear effects.
+    """
+
+    def __init__(self, seed: int, scoring: Optional[Scoring] = None, on_lock: Optional[Callable] = None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.board = Board()
+        self.scoring = scoring or memory_scoring()
+        # Records the previous game of a reused Scoring, as Game.start_game does
+        self.scoring.reset(seed=seed)
+        self.on_lock = on_lock
+        self.pieces = 0
+        self.over = False
+        self.current_piece = self._generate_piece()
+        self.next_piece = self._generate_piece()
+        self.current_piece.position = spawn_position(self.board)
+
+    def _generate_piece(self) -> Piece:
+        # Same draw as Game._generate_piece, so a seed plays the same sequence
+        return Piece(self.rng.choice(SHAPES))
+
+    def place(self, rotation: int, x: int) -> int:
+        """Hard drop the current piece at a placement, returns the lines cleared."""
+        board = self.board
+        piece = self.current_piece
+        for _ in range(rotation):
+            piece.rotate()
+        piece.position = [x, 0]
+        if not board.is_valid_position(piece):
+            self.over = True
+            return 0
+
+        distance = 0
+        while board.is_valid_position(piece, 0, 1):
+            piece.move(0, 1)
+            distance += 1
+        if distance:
+            self.scoring.add_drop_bonus(distance)
+
+        board.place_piece(piece)
+        self.pieces += 1
+        cleared = board.get_filled_lines()
+        score_info = self.scoring.add_score(len(cleared))
+        if self.on_lock:
+            self.on_lock(self, cleared, score_info)
+        if cleared:
+            board.clear_lines()
+        board.dirty_rows.clear()
+
+        self.current_piece = self.next_piece
+        self.next_piece = self._generate_piece()
+        self.current_piece.position = spawn_position(board)
+        if not board.is_valid_position(self.current_piece):
+            self.over = True
+        return len(cleared)
+
+    def play(self, bot, max_pieces: Optional[int] = None) -> 'Simulation':
+        """Let bot place pieces until the game is over or max_pieces were placed."""
+        while not self.over and (max_pieces is None or self.pieces < max_pieces):
+            choice = bot.choose(self.board, self.current_piece, self.next_piece)
+            if choice is None:
+                self.over = True
+                break
+            self.place(*choice)
+        return self
@@ -0,0 +1,301 @@
+"""
+Benchmark module for Tetrix.
+Microbenchmarks of the engine and renderer hot paths.
+
+Run `python -m src.bench --save data/bench/baseline.json` once, then
+`python -m src.bench --compare data/bench/baseline.json` after a change:
+every benchmark slower than the baseline by more than the threshold is
+flagged and the command exits with status 1.
+
+Each benchmark is timed over enough calls to fill a run, runs are
+repeated, and the fastest run is kept, the one least disturbed by the
+rest of the machine. Setup that a call would destroy (a board to place a
+piece on, lines to clear) is prepared per call outside the timed loop.
+"""
+
+import functools
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from .board import Board
+from .piece import Piece
+
+VERSION = 1
+THRESHOLD = 0.10  # fraction slower than the baseline that counts as a regression
+
+# Rows filled from the bottom, one hole per row, for each board case
+FILLS = {'empty': 0, 'half': 10, 'full': 18}
+
+_benchmarks: Dict[str, Callable] = {}
+
+
+def benchmark(name: str):
+    """Register a function returning (call, prepare) under name."""
+    def register(factory):
+        _benchmarks[name] = factory
+        return factory
+    return register
+
+
+def make_board(fill: str, seed: int = 0) -> Board:
+    """A board with FILLS[fill] rows of stack, each missing one cell."""
+    rng = random.Random(seed)
+    colors = list(Piece.COLORS.values())
+    board = Board()
+    for y in range(board.HEIGHT - FILLS[fill], board.HEIGHT):
+        hole = rng.randrange(board.WIDTH)
+        for x in range(board.WIDTH):
+            if x != hole:
+                board.grid[y][x] = 1
+                board.colors[y][x] = rng.choice(colors)
+    board.dirty_rows.clear()
+    return board
+
+
+def copy_board(board: Board) -> Board:
+    copy = Board()
+    copy.grid = [row[:] for row in board.grid]
+    copy.colors = [row[:] for row in board.colors]
+    return copy
+
+
+def spawn_piece(shape: str = 'T') -> Piece:
+    piece = Piece(shape)
+    piece.position = [Board.WIDTH // 2 - 2, 0]
+    return piece
+
+
+def _ghost(board: Board, piece: Piece) -> Piece:
+    from .game import Game
+    # The game's own ghost code, it only reads current_piece and board
+    holder = type('GhostHolder', (), {})()
+    holder.current_piece, holder.board = piece, board
+    return Game._get_ghost_piece(holder)
+
+
+def _valid_position(fill: str):
+    board, piece = make_board(fill), spawn_piece()
+    return (lambda: board.is_valid_position(piece, 0, 1)), None
+
+
+def _place_piece(fill: str):
+    board = make_board(fill)
+    piece = _ghost(board, spawn_piece())
+    return (lambda board: board.place_piece(piece)), (lambda: copy_board(board))
+
+
+def _clear_lines(fill: str):
+    board = make_board(fill)
+    # Complete the four bottom rows so every call clears a tetris
+    for y in range(board.HEIGHT - 4, board.HEIGHT):
+        board.grid[y] = [1] * board.WIDTH
+        board.colors[y] = [Piece.COLORS['I']] * board.WIDTH
+    return (lambda board: board.clear_lines()), (lambda: copy_board(board))
+
+
+def _ghost_piece(fill: str):
+    board, piece = make_board(fill), spawn_piece()
+    return (lambda: _ghost(board, piece)), None
+
+
+for _name, _factory in (('board.is_valid_position', _valid_position), ('board.place_piece', _place_piece),
+                        ('board.clear_lines', _clear_lines), ('game.ghost', _ghost_piece)):
+    for _fill in FILLS:
+        _benchmarks[f'{_name}[{_fill}]'] = functools.partial(_factory, _fill)
+
+
+@benchmark('piece.rotate')
+def rotate():
+    piece = spawn_piece('T')
+    return piece.rotate, None
+
+
+@benchmark('piece.get_positions')
+def get_positions():
+    piece = spawn_piece('T')
+    return piece.get_positions, None
+
+
+def _rotation(system: str):
+    from .rotation import SYSTEMS
+    board, piece = make_board('half'), spawn_piece('T')
+    rotation = SYSTEMS[system]
+    return (lambda: rotation.rotate(board, piece)), None
+
+
+for _system in ('simple', 'srs', 'ars'):
+    _benchmarks[f'rotation.rotate[{_system}]'] = functools.partial(_rotation, _system)
+
+
+def _scoring():
+    """A Scoring that keeps its history in memory, away from the player's data."""
+    from .scoring import Scoring
+    from .score_db import ScoreDatabase
+    return Scoring(db=ScoreDatabase(':memory:'),
+                   sketch_file=os.path.join(tempfile.gettempdir(), 'tetrix-bench-sketches.bin'))
+
+
+@benchmark('scoring.add_score')
+def add_score():
+    scoring = _scoring()
+    lines = [0, 1, 0, 2, 0, 3, 0, 4]
+    state = {'i': 0}
+
+    def call():
+        state['i'] += 1
+        scoring.add_score(lines[state['i'] & 7])
+    return call, None
+
+
+def _frame(board: Board) -> Callable:
+    """One game frame as Game.render draws it, without animations or flip."""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    from .renderer import Renderer
+    from .settings import Settings
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((600, 700))
+    renderer = Renderer(screen, Settings())
+    scoring = _scoring()
+    piece = spawn_piece('T')
+    next_piece = Piece('I')
+
+    def call():
+        screen.fill(renderer.COLOR_BG)
+        renderer.draw_board(board)
+        renderer.draw_piece(_ghost(board, piece), ghost=True)
+        renderer.draw_piece(piece)
+        renderer.draw_ui(scoring, next_piece, 'L')
+    return call
+
+
+for _fill in FILLS:
+    _benchmarks[f'renderer.frame[{_fill}]'] = functools.partial(lambda fill: (_frame(make_board(fill)), None), _fill)
+
+
+def measure(call: Callable, prepare: Optional[Callable] = None,
+            min_time: float = 0.05, repeat: int = 5) -> dict:
+    """Time call, per call in nanoseconds, as the fastest and median of repeat runs."""
+    def run(loops: int) -> float:
+        if prepare is None:
+            start = time.perf_counter()
+            for _ in range(loops):
+                call()
+            return time.perf_counter() - start
+        items = [prepare() for _ in range(loops)]
+        start = time.perf_counter()
+        for item in items:
+            call(item)
+        return time.perf_counter() - start
+
+    # Grow the loop count until one run takes min_time
+    loops = 1
+    while True:
+        elapsed = run(loops)
+        if elapsed >= min_time:
+            break
+        loops = max(loops * 2, int(loops * min_time / max(elapsed, 1e-9) * 1.2))
+
+    runs = sorted(run(loops) / loops * 1e9 for _ in range(repeat))
+    return {'ns': round(runs[0], 1), 'median_ns': round(runs[len(runs) // 2], 1), 'loops': loops}
+
+
+def run_benchmarks(match: str = '', min_time: float = 0.05, repeat: int = 5) -> dict:
+    """Run every benchmark whose name contains match."""
+    import pygame
+    results = {}
+    for name, factory in _benchmarks.items():
+        if match in name:
+            call, prepare = factory()
+            results[name] = measure(call, prepare, min_time, repeat)
+    return {
+        'version': VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'machine': platform.node(),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'results': results
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = THRESHOLD) -> List[dict]:
+    """Changes of every benchmark in both runs, regressions flagged."""
+    changes = []
+    for name, result in current['results'].items():
+        before = baseline['results'].get(name)
+        if not before:
+            continue
+        change = result['ns'] / before['ns'] - 1
+        changes.append({
+            'name': name,
+            'baseline_ns': before['ns'],
+            'ns': result['ns'],
+            'change': round(change, 4),
+            'regression': change > threshold
+        })
+    return changes
+
+
+def report(current: dict, changes: Optional[List[dict]] = None) -> str:
+    """Format results, with changes against a baseline when given, as a table."""
+    by_name = {c['name']: c for c in changes or []}
+    lines = [f"{'BENCHMARK':<34}{'NS/CALL':>12}{'MEDIAN':>12}{'CHANGE':>10}"]
+    for name, result in current['results'].items():
+        line = f"{name:<34}{result['ns']:>12.1f}{result['median_ns']:>12.1f}"
+        change = by_name.get(name)
+        if change:
+            line += f"{change['change'] * 100:>+9.1f}%"
+            if change['regression']:
+                line += "  REGRESSION"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main():
+    import argparse
+    import json
+    from .persistence import write_json_atomic
+
+    parser = argparse.ArgumentParser(description='Tetrix microbenchmarks')
+    parser.add_argument('-k', dest='match', default='', help='only run benchmarks whose name contains this')
+    parser.add_argument('--save', metavar='FILE', help='write the results as JSON')
+    parser.add_argument('--compare', metavar='FILE', help='compare with a saved run, exit 1 on regressions')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help=f'slowdown that counts as a regression (default {THRESHOLD})')
+    parser.add_argument('--quick', action='store_true', help='shorter runs, for a rough check')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare, 'r') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading baseline: {e}")
+            sys.exit(2)
+
+    if args.quick:
+        current = run_benchmarks(args.match, min_time=0.01, repeat=3)
+    else:
+        current = run_benchmarks(args.match)
+    changes = compare(baseline, current, args.threshold) if baseline else None
+    print(report(current, changes))
+
+    if args.save:
+        try:
+            write_json_atomic(args.save, current, indent=2)
+        except OSError as e:
+            print(f"Error saving results: {e}")
+    if changes and any(c['regression'] for c in changes):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -6,17 +6,47 @@ Contains the Board class representing the game grid.
 from typing import List, Tuple, Optional
 from .piece import Piece
 
+def parse_size(text: str) -> Tuple[int, int]:
+    """Parse a board size given as WIDTHxHEIGHT, e.g. 40x400."""
+    width, sep, height = text.lower().partition('x')
+    if not sep:
+        raise ValueError(f"Board size must look like 10x20, not {text!r}")
+    width, height = int(width), int(height)
+    # Pieces spawn 4 cells wide and tall
+    if width < 4 or height < 4:
+        raise ValueError("Boards must be at least 4x4")
+    return width, height
+
+
 class Board:
     """
     Represents the game board/grid.
+
+    Boards can be any size, WIDTH and HEIGHT are set per board and the
+    class values are the standard 10x20. Rows stay plain lists, but scans
+    for full rows stop at the first empty cell, so tall boards that are
+    mostly empty cost little more than their stack.
     """
 
     WIDTH = 10
     HEIGHT = 20
+    GARBAGE_COLOR = (128, 128, 128)
+
+    def __init__(self, width: int = WIDTH, height: int = HEIGHT):
+        self.WIDTH = width
+        self.HEIGHT = height
+        self.grid = [[0] * width for _ in range(height)]
+        self.colors = [[None] * width for _ in range(height)]
+        # Rows changed since the last sync, consumers clear it
+        self.dirty_rows = set()
+        # Bumped on every change, each row keeps the version it last changed
+        # in, so any number of readers can ask what changed since they looked
+        self.version = 0
+        self.row_versions = [0] * height
 
-    def __init__(self):
-        self.grid = [[0 for _ in range(self.WIDTH)] for _ in range(self.HEIGHT)]
-        self.colors = [[None for _ in range(self.WIDTH)] for _ in range(self.HEIGHT)]
+    def spawn_position(self) -> List[int]:
+        """Where new pieces appear, top center."""
+        return [self.WIDTH // 2 - 2, 0]
 
     def is_valid_position(self, piece: Piece, offset_x: int = 0, offset_y: int = 0) -> bool:
         """Check if a piece can be placed at the given position."""
@@ -29,22 +59,53 @@ class Board:
                 return False
         return True
 
+    def fits(self, cells, x: int, y: int) -> bool:
+        """Check if cells, offsets from (x, y), are on the board and free, as is_valid_position."""
+        grid = self.grid
+        for cx, cy in cells:
+            cx += x
+            cy += y
+            if cx < 0 or cx >= self.WIDTH or cy >= self.HEIGHT:
+                return False
+            if cy >= 0 and grid[cy][cx]:
+                return False
+        return True
+
+    def drop_distance(self, piece: Piece) -> int:
+        """
+        How far piece falls before landing. Scans the column under each
+        of its lowest cells, on a tall board a fraction of stepping the
+        whole piece down a row at a time.
+        """
+        bottoms = {}
+        for x, y in piece.get_positions():
+            if y >= bottoms.get(x, y):
+                bottoms[x] = y
+        grid = self.grid
+        distance = self.HEIGHT
+        for x, bottom in bottoms.items():
+            y = max(bottom + 1, 0)
+            while y < self.HEIGHT and not grid[y][x]:
+                y += 1
+            distance = min(distance, y - bottom - 1)
+        return distance
+
     def place_piece(self, piece: Piece) -> bool:
         """Place a piece on the board if valid."""
         if not self.is_valid_position(piece):
             return False
+        self.version += 1
         for x, y in piece.get_positions():
             if y >= 0:
                 self.grid[y][x] = 1
                 self.colors[y][x] = piece.color
+                self.dirty_rows.add(y)
+                self.row_versions[y] = self.version
         return True
 
     def clear_lines(self) -> int:
         """Clear completed lines and return the number of lines cleared."""
-        lines_to_clear = []
-        for y in range(self.HEIGHT):
-            if all(self.grid[y]):
-                lines_to_clear.append(y)
+        lines_to_clear = self.get_filled_lines()
 
         # Remove lines from bottom to top
         for y in reversed(lines_to_clear):
@@ -54,15 +115,36 @@ class Board:
             self.grid.insert(0, [0] * self.WIDTH)
             self.colors.insert(0, [None] * self.WIDTH)
 
+        if lines_to_clear:
+            # Every row above the lowest cleared line moved
+            moved = lines_to_clear[-1] + 1
+            self.dirty_rows.update(range(moved))
+            self.version += 1
+            self.row_versions[:moved] = [self.version] * moved
         return len(lines_to_clear)
 
+    def add_garbage(self, lines: int, hole: int) -> bool:
+        """
+        Push garbage lines with one hole column in from the bottom.
+        Returns False if blocks were pushed out of the top.
+        """
+        lines = min(lines, self.HEIGHT)
+        overflow = any(any(row) for row in self.grid[:lines])
+        for _ in range(lines):
+            del self.grid[0]
+            del self.colors[0]
+            row = [1] * self.WIDTH
+            row[hole] = 0
+            self.grid.append(row)
+            self.colors.append([None if x == hole else self.GARBAGE_COLOR for x in range(self.WIDTH)])
+        self.dirty_rows.update(range(self.HEIGHT))
+        self.version += 1
+        self.row_versions = [self.version] * self.HEIGHT
+        return not overflow
+
     def get_filled_lines(self) -> List[int]:
         """Get indices of filled lines."""
-        filled = []
-        for y in range(self.HEIGHT):
-            if all(self.grid[y]):
-                filled.append(y)
-        return filled
+        return [y for y, row in enumerate(self.grid) if 0 not in row]
 
     def draw(self, screen, block_size: int, offset_x: int, offset_y: int):
         """Draw the board on the screen."""
@@ -0,0 +1,237 @@
+"""
+Control module for Tetrix.
+Programmatic play: a controller registered with Game receives an
+Observation every tick and answers with actions or a target placement.
+
+Actions are Action trigger counts, the same ones InputHandler reports for
+the keyboard, and go through the same Game._handle_* code, so a controller
+plays exactly the game a player plays. A Placement is turned into those
+actions: rotate, then shift and hard drop on the next tick.
+
+    python -m src.control --bot heuristic --games 10 --max-pieces 1000
+
+Games run uncapped and unrendered unless asked otherwise, a tick takes
+as long as the controller and the game logic need and game time still
+advances one frame per tick, so gravity behaves as at 60 fps.
+"""
+
+import os
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from .input_handler import Action
+
+
+class Observation:
+    """
+    What a controller sees of the game on one tick. The grid is a copy,
+    1 for a filled cell, top row first. rotation_system names the game's
+    rotation system, see rotation.py.
+    """
+
+    def __init__(self, grid: List[List[int]], piece: str, rotation: int, position: Tuple[int, int],
+                 cells: List[Tuple[int, int]], next_piece: str, held_piece: Optional[str],
+                 can_hold: bool, pieces: int, score: int, level: int, lines: int, combo: int,
+                 rotation_system: str = 'simple'):
+        self.grid = grid
+        self.width = len(grid[0])
+        self.height = len(grid)
+        self.piece = piece
+        self.rotation = rotation
+        self.x, self.y = position
+        self.cells = cells
+        self.next_piece = next_piece
+        self.held_piece = held_piece
+        self.can_hold = can_hold
+        self.pieces = pieces  # pieces locked so far this game
+        self.score = score
+        self.level = level
+        self.lines = lines
+        self.combo = combo
+        self.rotation_system = rotation_system
+
+
+def observe(game) -> Observation:
+    """The Observation of a game in progress."""
+    piece = game.current_piece
+    scoring = game.scoring
+    return Observation(
+        [row[:] for row in game.board.grid], piece.shape_type, piece.rotation % 4,
+        tuple(piece.position), piece.get_positions(), game.next_piece.shape_type,
+        game.held_piece, game.can_hold, game.pieces, scoring.score, scoring.level,
+        scoring.lines_cleared, scoring.combo, game.rotation.name
+    )
+
+
+class Placement:
+    """
+    Where the current piece should go: rotations from spawn and the
+    column of its shape matrix, as autoplay bots choose them, optionally
+    after holding it.
+    """
+
+    def __init__(self, rotation: int, x: int, hold: bool = False):
+        self.rotation = rotation % 4
+        self.x = x
+        self.hold = hold
+
+    def __eq__(self, other):
+        return (isinstance(other, Placement) and
+                (self.rotation, self.x, self.hold) == (other.rotation, other.x, other.hold))
+
+    def __repr__(self):
+        return f"Placement({self.rotation}, {self.x}, hold={self.hold})"
+
+
+def placement_actions(observation: Observation, placement: Placement, rotated: bool = False) -> Dict[Action, int]:
+    """
+    This tick's actions towards a placement. Rotation comes first, on a
+    tick of its own since Game moves before it rotates, unless the piece
+    was already rotated for this placement.
+    """
+    if placement.hold and observation.can_hold:
+        return {Action.HOLD: 1}
+    turns = (placement.rotation - observation.rotation) % 4
+    if turns and not rotated:
+        return {Action.ROTATE: turns}
+    actions = {Action.DROP: 1}
+    dx = placement.x - observation.x
+    if dx:
+        actions[Action.MOVE_RIGHT if dx > 0 else Action.MOVE_LEFT] = abs(dx)
+    return actions
+
+
+def to_actions(result) -> Dict[Action, int]:
+    """A controller's answer as trigger counts: a dict, a list of Actions or None."""
+    if not result:
+        return {}
+    if isinstance(result, dict):
+        return {action: count for action, count in result.items() if count}
+    if isinstance(result, Action):
+        return {result: 1}
+    return dict(Counter(result))
+
+
+class Controller:
+    """
+    Base for controllers. act() gets each tick's Observation and returns
+    {Action: count}, a list of Actions, a Placement or None for no input.
+    """
+
+    def act(self, observation: Observation):
+        return None
+
+
+class BotController(Controller):
+    """
+    Plays an autoplay bot, anything with
+    choose(board, piece, next_piece, system), asking it once per piece.
+    system is the game's RotationSystem, the one its placements must
+    be reached with.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._piece = None
+        self._placement = None
+
+    def act(self, observation: Observation):
+        key = (observation.pieces, observation.can_hold)
+        if key != self._piece:
+            self._piece = key
+            self._placement = self._choose(observation)
+        # No placement left, the piece drops where it is and the game ends
+        return self._placement or {Action.DROP: 1}
+
+    def _choose(self, observation: Observation) -> Optional[Placement]:
+        from .board import Board
+        from .piece import Piece
+        from .rotation import get_system
+        board = Board(observation.width, observation.height)
+        board.grid = observation.grid
+        choice = self.bot.choose(board, Piece(observation.piece), Piece(observation.next_piece),
+                                 system=get_system(observation.rotation_system))
+        return Placement(*choice) if choice else None
+
+
+def play(controller: Controller, games: int = 1, max_pieces: Optional[int] = None,
+         seed: Optional[int] = None, uncapped: bool = True, render: bool = False,
+         board_size: Optional[Tuple[int, int]] = None,
+         rotation_system: Optional[str] = None) -> List[dict]:
+    """
+    Play games with a controller and return a summary of each. Without
+    rendering no window is opened. Stops early if the window is closed.
+    """
+    if not render:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    from .game import Game, GameState
+
+    from .board import Board
+    width, height = board_size or (Board.WIDTH, Board.HEIGHT)
+    game = Game(controller=controller, uncapped=uncapped, render=render,
+                board_width=width, board_height=height, rotation_system=rotation_system)
+    results = []
+    try:
+        for i in range(games):
+            game.start_game(None if seed is None else seed + i)
+            start = time.perf_counter()
+            ticks = 0
+            running = True
+            while game.state == GameState.PLAYING and (max_pieces is None or game.pieces < max_pieces):
+                running = game.tick()
+                ticks += 1
+                if not running:
+                    break
+            results.append({
+                'seed': game.seed,
+                'pieces': game.pieces,
+                'lines': game.scoring.lines_cleared,
+                'score': game.scoring.score,
+                'level': game.scoring.level,
+                'ticks': ticks,
+                'seconds': time.perf_counter() - start,
+            })
+            if not running:
+                break
+    finally:
+        game.close()
+    return results
+
+
+def main():
+    import argparse
+    from .board import parse_size
+    from .rotation import SYSTEMS
+    from .soak import BOTS
+    # Game checks answers against src.control's classes, not __main__'s
+    from .control import BotController, play
+
+    parser = argparse.ArgumentParser(description='Let a bot play Tetrix through the game loop')
+    parser.add_argument('--bot', choices=sorted(BOTS), default='heuristic')
+    parser.add_argument('--games', type=int, default=3)
+    parser.add_argument('--max-pieces', type=int, default=1000,
+                        help='end a game after this many pieces, 0 plays until top out')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first game')
+    parser.add_argument('--render', action='store_true', help='show the game while the bot plays')
+    parser.add_argument('--capped', action='store_true', help='tick at the normal frame rate')
+    parser.add_argument('--board', type=parse_size, metavar='WxH', help='board size, e.g. 40x400')
+    parser.add_argument('--rotation', choices=sorted(SYSTEMS), help='rotation system, the setting by default')
+    args = parser.parse_args()
+
+    bot = BOTS[args.bot]()
+    try:
+        results = play(BotController(bot), args.games, args.max_pieces or None, args.seed,
+                       uncapped=not args.capped, render=args.render, board_size=args.board,
+                       rotation_system=args.rotation)
+    finally:
+        if hasattr(bot, 'close'):
+            bot.close()
+    for r in results:
+        rate = r['pieces'] / r['seconds'] if r['seconds'] else 0.0
+        print(f"seed {r['seed']}: {r['pieces']} pieces, {r['lines']} lines, score {r['score']}, "
+              f"{r['ticks']} ticks, {rate:.0f} pieces/s")
+
+if __name__ == '__main__':
+    main()
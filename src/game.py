@@ -5,15 +5,21 @@ Contains the main Game class that orchestrates the game loop.
 
 import pygame
 import random
+import struct
 import sys
+import time
+from typing import Optional
 from .board import Board
 from .piece import Piece
 from .scoring import Scoring
 from .renderer import Renderer
 from .input_handler import InputHandler, Action
+from .rotation import get_system
 from .audio import SoundManager
 from .menu import MainMenu
 from .settings import Settings
+from .startup import timer
+from .persistence import PersistenceService
 
 class GameState:
     MENU = 0
@@ -25,29 +31,100 @@ class Game:
     Main game class handling the game loop and state.
     """
 
-    def __init__(self, width: int = 600, height: int = 700):
-        pygame.init()
+    VERSUS_PANEL = 220  # extra window width for the opponent's board
+
+    def __init__(self, width: int = 600, height: int = 700, measure_latency: bool = False,
+                 startup_report: bool = False, versus=None, broadcast=None,
+                 controller=None, uncapped: bool = False, render: bool = True,
+                 board_width: int = Board.WIDTH, board_height: int = Board.HEIGHT,
+                 rotation_system: Optional[str] = None, isolated: bool = False,
+                 resume: bool = False):
+        # Only the subsystems the game uses, the mixer is opened by the audio loader
+        pygame.display.init()
+        pygame.font.init()
+        timer.mark('pygame initialized')
         self.screen = pygame.display.set_mode((width, height))
-        pygame.display.set_caption('Tetrix')
+        pygame.display.set_caption('Tetrix Versus' if versus else 'Tetrix')
+        timer.mark('display created')
         self.clock = pygame.time.Clock()
+        self.clock.tick()  # Starts the SDL timer that pygame.init() would have
+
+        # Online versus, with a VersusConnection to the other player
+        self.versus = versus
+        if versus:
+            from .versus import RemoteBoard
+            width += self.VERSUS_PANEL
+            self.remote = RemoteBoard()
+            self.incoming_garbage = 0
+            self._sent_piece = None
+            self._versus_started = False
+            self._garbage_rng = random.Random()  # hole columns, apart from the seeded pieces
         self.fps = 60
-
-        self.settings = Settings()
-        self.board = Board()
-        self.scoring = Scoring()
+        # Optional controller playing instead of the keyboard, see control.py.
+        # Uncapped ticks don't wait for the frame rate, game time still
+        # advances a frame per tick; without rendering effects are skipped
+        # and line clears don't wait for their animation.
+        self.controller = controller
+        # Bot and benchmark games stay out of the player's scores, leaderboard,
+        # telemetry and suspended game
+        self.isolated = isolated or controller is not None
+        self.uncapped = uncapped
+        self.render_enabled = render
+        self.IDLE_TIMEOUT = 250  # max ms to block waiting for events when idle
+
+        # Disk writes happen on a background thread, never during a frame
+        self.persistence = PersistenceService()
+        self.settings = Settings(self.persistence)
+        timer.mark('settings loaded')
+        # Custom board sizes apply to every game, the renderer scrolls large ones
+        self.board_width = board_width
+        self.board_height = board_height
+        self.board = Board(board_width, board_height)
+        if self.isolated:
+            from .autoplay import memory_scoring
+            self.scoring = memory_scoring()
+        else:
+            self.scoring = Scoring(persistence=self.persistence)
+        timer.mark('scores loaded')
+        self.leaderboard = None
+        if self.settings.get('leaderboard_host') and not self.isolated:
+            from .leaderboard import LeaderboardClient
+            self.leaderboard = LeaderboardClient(
+                self.settings.get('leaderboard_host'),
+                self.settings.get('leaderboard_port'),
+                source=self.settings.get('kiosk_name')
+            )
+            self.scoring.leaderboard = self.leaderboard
+        self.telemetry = None
+        if self.settings.get('telemetry') and not self.isolated:
+            from .telemetry import TelemetryLog
+            self.telemetry = TelemetryLog(machine=self.settings.get('kiosk_name'), persistence=self.persistence)
         self.renderer = Renderer(self.screen, self.settings)
-        self.input_handler = InputHandler()
-        self.audio = SoundManager()
+        timer.mark('renderer created')
+        self.input_handler = InputHandler(InputHandler.parse_bindings(self.settings.get('key_bindings')))
+        # Given by a bot run, or the player's setting
+        self.rotation = get_system(rotation_system or self.settings.get('rotation_system'))
+        self.audio = SoundManager(background=True)
+        if not render:
+            self.audio.enabled = False
         
         # Menu System
         self.menu = MainMenu(self.screen, self.renderer, self.scoring, self.audio)
+        timer.mark('subsystems created')
         self.state = GameState.MENU
 
+        # Per-game piece generator, seeded so a game can be reproduced
+        self.seed = random.randrange(2 ** 31)
+        self.rng = random.Random(self.seed)
+
         self.current_piece = self._generate_piece()
         self.next_piece = self._generate_piece()
+        self.current_piece.position = self.board.spawn_position()
         self.held_piece = None
         self.can_hold = True
         self.paused = False
+        self.pieces = 0  # pieces locked this game
+        self._rotated_piece = None  # piece a controller placement already rotated
 
         # Game statistics tracking
         self.game_start_time = 0
@@ -59,26 +136,66 @@ class Game:
         self.drop_timer = 0
         self.drop_interval = 1000  # milliseconds
 
-        # Movement timers for controlled input
-        self.move_left_timer = 0
-        self.move_right_timer = 0
-        self.move_down_timer = 0
-        self.rotate_timer = 0
-        self.MOVE_DELAY = 200  # initial delay in ms
-        self.MOVE_REPEAT = 50  # repeat rate in ms
-        self.ROTATE_DELAY = 150  # delay between rotations
+        # Input-to-display latency histograms, only when measuring
+        self.latency = None
+        if measure_latency:
+            from .latency import LatencyTracker
+            self.latency = LatencyTracker()
+        self._was_idle = False
+
+        # Print the startup timeline once the first frame is presented
+        self.startup_report = startup_report
+        self._first_frame = True
+
+        # Optional BroadcastServer streaming every frame to spectators
+        self.broadcast = broadcast
+
+        # Continue the game that was in progress when the game last quit,
+        # only when asked: taking the snapshot deletes it
+        self._snapshot_saved = False
+        if resume and not versus and not self.isolated:
+            self._resume()
+
+    def _resume(self):
+        """Restore the snapshot left by the previous run, paused."""
+        from .snapshot import restore_game, take_snapshot
+        data = take_snapshot()
+        if data is None:
+            return
+        try:
+            restore_game(self, data)
+        except (ValueError, struct.error, IndexError, KeyError) as e:
+            print(f"Error restoring snapshot: {e}")
+            return
+
+        self.state = GameState.PLAYING
+        self.paused = True
+        self.game_start_time = pygame.time.get_ticks() - int(self.game_time * 1000)
+        if self.telemetry:
+            # Its GAME_START is in the previous run's log
+            self.telemetry.game_resume(self.seed, int(self.game_time * 1000))
+        if self._pending_clear:
+            self._complete_line_clear()
+        timer.mark('game resumed')
+
+    def _suspend(self):
+        """Pause and snapshot the game in progress."""
+        self.paused = True
+        self._snapshot_saved = True
+        from .snapshot import dump_game, save_snapshot
+        self.persistence.submit(save_snapshot, dump_game(self))
 
     def _generate_piece(self) -> Piece:
         """Generate a random new piece."""
         shapes = list(Piece.SHAPES.keys())
-        return Piece(random.choice(shapes))
+        return Piece(self.rng.choice(shapes))
 
     def _spawn_piece(self):
         """Spawn the next piece."""
         self.current_piece = self.next_piece
         self.next_piece = self._generate_piece()
         # Reset position to top center
-        self.current_piece.position = [Board.WIDTH // 2 - 2, 0]
+        self.current_piece.position = self.board.spawn_position()
         # Allow hold again for the new piece
         self.can_hold = True
 
@@ -86,28 +203,60 @@ class Game:
         if not self.board.is_valid_position(self.current_piece):
             self.state = GameState.GAME_OVER
             self.audio.play('gameover')
-
-    def start_game(self):
-        """Reset and start a new game."""
-        self.board = Board()
-        self.scoring.reset()
+            self._end_game()
+
+    def _end_game(self):
+        """Record the end of the current game in the telemetry log."""
+        if self._snapshot_saved:
+            # The game can no longer be resumed
+            self._snapshot_saved = False
+            from .snapshot import discard_snapshot
+            self.persistence.submit(discard_snapshot)
+        if self.versus:
+            self.versus.send_game_over()
+        if self.telemetry:
+            self.telemetry.game_end(self.scoring.score, self.scoring.lines_cleared)
+
+    def start_game(self, seed: Optional[int] = None):
+        """Reset and start a new game, with a random seed unless one is given."""
+        self.board = Board(self.board_width, self.board_height)
+        self.seed = random.randrange(2 ** 31) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.scoring.reset(seed=self.seed)
         self.current_piece = self._generate_piece()
         self.next_piece = self._generate_piece()
+        self.current_piece.position = self.board.spawn_position()
         self.held_piece = None
         self.can_hold = True
         self.state = GameState.PLAYING
         self.paused = False
+        self.pieces = 0
         self.drop_timer = 0
         self.game_start_time = pygame.time.get_ticks()
         self.game_time = 0
         self._pending_clear = False
+        self.input_handler.reset()
+        if self.telemetry:
+            self.telemetry.game_start(self.seed)
+        if self.versus:
+            self.incoming_garbage = 0
+            self._sent_piece = None
+            self.versus.send_start()
         # Clear any existing animations
         self.renderer.anim_manager = self.renderer.anim_manager.__class__()
 
     def update(self, dt: float):
         """Update game state."""
 
+        if self.versus:
+            self._sync_versus()
+
         if self.state == GameState.MENU:
+            if self.versus and not self._versus_started and self.versus.connected.is_set():
+                # The first round starts as soon as both players are in
+                self._versus_started = True
+                self.start_game()
+                return
             self.menu.update()
             return
 
@@ -117,27 +266,36 @@ class Game:
             return
 
         if self.paused:
+            # Drop input buffered while paused
+            self.input_handler.update()
             return
 
         # Update animations
         self.renderer.anim_manager.update()
 
         # Check if line clear animation finished
-        if self._pending_clear and not self.renderer.anim_manager.has_line_clear():
+        if self._pending_clear and not self._clearing():
             self._complete_line_clear()
 
+        self.input_handler.update()
+
         # Don't process input during line clear animation
-        if self.renderer.anim_manager.has_line_clear():
+        if self._clearing():
             return
 
-        self.input_handler.update()
-        actions = self.input_handler.get_actions()
+        if self.controller:
+            actions = self._controller_actions()
+        else:
+            actions = self.input_handler.get_actions()
 
-        # Handle input with controlled timing
-        self._handle_movement(actions, dt)
-        self._handle_rotation(actions, dt)
+        # Apply every trigger of this frame, repeats are timed by the input handler
+        self._handle_movement(actions)
+        self._handle_rotation(actions)
         self._handle_drop(actions, dt)
 
+        if self.latency:
+            self.latency.applied(self.input_handler.get_arrivals())
+
         # Update drop speed based on level
         self.drop_interval = int(self.scoring.get_speed() * 1000)
 
@@ -145,80 +303,108 @@ class Game:
         if self.state == GameState.PLAYING:
             self.game_time = (pygame.time.get_ticks() - self.game_start_time) / 1000
 
-    def _handle_movement(self, actions, dt: float):
+    def _clearing(self) -> bool:
+        """Check if a line clear animation holds the game."""
+        return self.render_enabled and self.renderer.anim_manager.has_line_clear()
+
+    def _controller_actions(self) -> dict:
+        """Ask the controller for this tick's actions."""
+        from .control import Placement, observe, placement_actions, to_actions
+        observation = observe(self)
+        result = self.controller.act(observation)
+        if isinstance(result, Placement):
+            # A rotation that stays blocked is given up on, the piece drops where it is
+            rotated = self._rotated_piece == (self.pieces, self.can_hold)
+            actions = placement_actions(observation, result, rotated)
+            if Action.ROTATE in actions:
+                self._rotated_piece = (self.pieces, self.can_hold)
+            return actions
+        return to_actions(result)
+
+    def _sync_versus(self):
+        """Apply messages from the other player and send our board changes."""
+        from .versus import MSG_START, MSG_BOARD, MSG_GARBAGE, MSG_GAME_OVER, MSG_DISCONNECT
+
+        for msg_type, payload in self.versus.poll():
+            if msg_type == MSG_START:
+                self.remote.reset()
+            elif msg_type == MSG_BOARD:
+                self.remote.apply_delta(payload)
+            elif msg_type == MSG_GARBAGE:
+                if self.state == GameState.PLAYING:
+                    self.incoming_garbage += self.versus.garbage_lines(payload)
+            elif msg_type in (MSG_GAME_OVER, MSG_DISCONNECT):
+                self.remote.alive = False
+                if self.state == GameState.PLAYING:
+                    # The round is over, we won
+                    self.state = GameState.GAME_OVER
+                    self._end_game()
+
+        if self.state != GameState.PLAYING:
+            return
+        piece = self.current_piece
+        piece_state = (piece.shape_type, piece.rotation, piece.position[0], piece.position[1])
+        if self.board.dirty_rows or piece_state != self._sent_piece:
+            self._sent_piece = piece_state
+            self.versus.send_board(self.board, piece, self.scoring.score, self.scoring.lines_cleared)
+
+    def _exchange_garbage(self, lines: int):
+        """Send garbage for a clear, or take queued garbage on a lock without one."""
+        if lines > 0:
+            from .versus import GARBAGE_SENT
+            sent = GARBAGE_SENT[lines]
+            # Clears first cancel garbage that is waiting for us
+            cancelled = min(sent, self.incoming_garbage)
+            self.incoming_garbage -= cancelled
+            if sent - cancelled:
+                self.versus.send_garbage(sent - cancelled)
+        elif self.incoming_garbage:
+            hole = self._garbage_rng.randrange(self.board.WIDTH)
+            fits = self.board.add_garbage(self.incoming_garbage, hole)
+            self.incoming_garbage = 0
+            if not fits:
+                self.state = GameState.GAME_OVER
+                self.audio.play('gameover')
+                self._end_game()
+
+    def _handle_movement(self, actions):
         """Handle horizontal and vertical movement input."""
-        if Action.MOVE_LEFT in actions:
-            if self.move_left_timer <= 0:
-                if self.board.is_valid_position(self.current_piece, -1, 0):
-                    self.current_piece.move(-1, 0)
-                    self.audio.play('move')
-                self.move_left_timer = self.MOVE_DELAY if self.move_left_timer == 0 else self.MOVE_REPEAT
-            self.move_left_timer -= dt
-        else:
-            self.move_left_timer = 0
-
-        if Action.MOVE_RIGHT in actions:
-            if self.move_right_timer <= 0:
-                if self.board.is_valid_position(self.current_piece, 1, 0):
-                    self.current_piece.move(1, 0)
-                    self.audio.play('move')
-                self.move_right_timer = self.MOVE_DELAY if self.move_right_timer == 0 else self.MOVE_REPEAT
-            self.move_right_timer -= dt
-        else:
-            self.move_right_timer = 0
-
-        if Action.MOVE_DOWN in actions:
-            if self.move_down_timer <= 0:
-                if self.board.is_valid_position(self.current_piece, 0, 1):
-                    self.current_piece.move(0, 1)
-                    self.drop_timer = max(0, self.drop_timer - 200)  # accelerate drop
-                self.move_down_timer = self.MOVE_REPEAT
-            self.move_down_timer -= dt
-        else:
-            self.move_down_timer = 0
-
-    def _handle_rotation(self, actions, dt: float):
-        """Handle piece rotation with wall kicks."""
-        if Action.ROTATE in actions and self.rotate_timer <= 0:
-            # Try rotation with wall kicks
-            original_shape = [row[:] for row in self.current_piece.shape]
-            original_pos = self.current_piece.position[:]
-            self.current_piece.rotate()
-            if not self.board.is_valid_position(self.current_piece):
-                # Try wall kick left
-                self.current_piece.move(-1, 0)
-                if not self.board.is_valid_position(self.current_piece):
-                    # Try wall kick right
-                    self.current_piece.move(2, 0)  # back to original +1
-                    if not self.board.is_valid_position(self.current_piece):
-                        # Revert
-                        self.current_piece.position = original_pos
-                        self.current_piece.shape = original_shape
-                        self.current_piece.rotation = (self.current_piece.rotation - 1) % 4
-                    else:
-                        self.audio.play('rotate')
-                else:
-                    self.audio.play('rotate')
-            else:
+        moved = False
+        for action, dx in ((Action.MOVE_LEFT, -1), (Action.MOVE_RIGHT, 1)):
+            # Several shifts can be due in one frame, a 0 ms ARR moves to the wall
+            for _ in range(actions.get(action, 0)):
+                if not self.board.is_valid_position(self.current_piece, dx, 0):
+                    break
+                self.current_piece.move(dx, 0)
+                moved = True
+        if moved:
+            self.audio.play('move')
+
+        for _ in range(actions.get(Action.MOVE_DOWN, 0)):
+            if not self.board.is_valid_position(self.current_piece, 0, 1):
+                break
+            self.current_piece.move(0, 1)
+            self.drop_timer = max(0, self.drop_timer - 200)  # accelerate drop
+
+    def _handle_rotation(self, actions):
+        """Handle piece rotation with the rotation system's wall kicks."""
+        for _ in range(actions.get(Action.ROTATE, 0)):
+            # The rotation system's kick table decides where the piece ends up
+            if self.rotation.rotate(self.board, self.current_piece):
                 self.audio.play('rotate')
-            self.rotate_timer = self.ROTATE_DELAY
-
-        self.rotate_timer -= dt
 
     def _handle_drop(self, actions, dt: float):
         """Handle hard drop, hold piece, and automatic drop."""
         if Action.DROP in actions:
             # Hard drop - count distance
-            drop_distance = 0
-            while self.board.is_valid_position(self.current_piece, 0, 1):
-                self.current_piece.move(0, 1)
-                drop_distance += 1
+            drop_distance = self.board.drop_distance(self.current_piece)
+            self.current_piece.move(0, drop_distance)
 
             if drop_distance > 0:
                 # Add drop bonus points
                 bonus_points = self.scoring.add_drop_bonus(drop_distance)
                 # Show floating text for drop bonus
-                if bonus_points > 0:
+                if bonus_points > 0 and self.render_enabled:
                     self.renderer.anim_manager.add_floating_text(
                         f"+{bonus_points}",
                         self.screen.get_width() // 2,
@@ -250,6 +436,8 @@ class Game:
 
         self.audio.play('hold')  # Play hold sound
         self.can_hold = False
+        if self.telemetry:
+            self.telemetry.hold(self.current_piece.shape_type)
 
         if self.held_piece is None:
             # First time holding
@@ -263,60 +451,34 @@ class Game:
             self.current_piece = Piece(temp)
 
         # Reset position to top center
-        self.current_piece.position = [Board.WIDTH // 2 - 2, 0]
+        self.current_piece.position = self.board.spawn_position()
 
     def _place_piece(self):
         """Place the current piece and handle line clearing."""
         if self.board.place_piece(self.current_piece):
             # Get lines to clear for animation
-            lines_to_clear = []
-            for y in range(len(self.board.grid)):
-                if all(self.board.grid[y]):
-                    lines_to_clear.append(y)
+            lines_to_clear = self.board.get_filled_lines()
 
             lines = len(lines_to_clear)
+            self.pieces += 1
 
             # Add score and get info about combo/level up
             score_info = self.scoring.add_score(lines)
 
-            if lines > 0:
-                # Start line clear animation
-                is_tetris = score_info['is_tetris']
-                self.renderer.anim_manager.add_line_clear(lines_to_clear, is_tetris)
-
-                # Play appropriate sound
-                if is_tetris:
-                    self.audio.play('tetris')
-                    # Screen shake for Tetris
-                    self.renderer.anim_manager.add_screen_shake(intensity=10)
-                else:
-                    self.audio.play('clear')
-
-                # Show combo if active
-                if score_info['combo'] > 1:
-                    self.renderer.anim_manager.add_combo(
-                        score_info['combo'],
-                        self.screen.get_width() // 2,
-                        250
-                    )
-                    self.audio.play('combo')
-
-                # Show score earned
-                if score_info['points'] > 0:
-                    color = (255, 255, 100) if is_tetris else (255, 255, 255)
-                    self.renderer.anim_manager.add_floating_text(
-                        f"+{score_info['points']}",
-                        self.screen.get_width() // 2,
-                        300,
-                        color
-                    )
+            if self.versus:
+                self._exchange_garbage(lines)
+                if self.state == GameState.GAME_OVER:
+                    return
 
-                # Check for level up
+            if self.telemetry:
+                self.telemetry.piece_lock(self.current_piece.shape_type)
+                if lines > 0:
+                    self.telemetry.line_clear(lines, score_info['combo'])
                 if score_info['leveled_up']:
-                    self.renderer.anim_manager.add_level_up(self.scoring.level)
-                    self.audio.play('levelup')
-            else:
-                self.audio.play('drop')  # Regular drop sound if no lines cleared
+                    self.telemetry.level_up(self.scoring.level)
+
+            if self.render_enabled:
+                self._lock_effects(lines_to_clear, score_info)
 
             # Wait for line clear animation before clearing and spawning
             if lines > 0:
@@ -325,6 +487,52 @@ class Game:
             else:
                 self._spawn_piece()
 
+    def _lock_effects(self, lines_to_clear, score_info):
+        """Start the animations and sounds of a lock."""
+        if lines_to_clear:
+            # Start line clear animation
+            is_tetris = score_info['is_tetris']
+            self.renderer.anim_manager.add_line_clear(
+                lines_to_clear,
+                is_tetris,
+                colors=[self.board.colors[y] for y in lines_to_clear],
+                board_width=self.board.WIDTH
+            )
+
+            # Play appropriate sound
+            if is_tetris:
+                self.audio.play('tetris')
+                # Screen shake for Tetris
+                self.renderer.anim_manager.add_screen_shake(intensity=10)
+            else:
+                self.audio.play('clear')
+
+            # Show combo if active
+            if score_info['combo'] > 1:
+                self.renderer.anim_manager.add_combo(
+                    score_info['combo'],
+                    self.screen.get_width() // 2,
+                    250
+                )
+                self.audio.play('combo')
+
+            # Show score earned
+            if score_info['points'] > 0:
+                color = (255, 255, 100) if is_tetris else (255, 255, 255)
+                self.renderer.anim_manager.add_floating_text(
+                    f"+{score_info['points']}",
+                    self.screen.get_width() // 2,
+                    300,
+                    color
+                )
+
+            # Check for level up
+            if score_info['leveled_up']:
+                self.renderer.anim_manager.add_level_up(self.scoring.level)
+                self.audio.play('levelup')
+        else:
+            self.audio.play('drop')  # Regular drop sound if no lines cleared
+
     def _complete_line_clear(self):
         """Complete the line clear after animation finishes."""
         self.board.clear_lines()
@@ -334,8 +542,7 @@ class Game:
     def _get_ghost_piece(self):
         """Calculate the ghost piece position."""
         ghost = self.current_piece.clone()
-        while self.board.is_valid_position(ghost, 0, 1):
-            ghost.move(0, 1)
+        ghost.move(0, self.board.drop_distance(ghost))
         return ghost
 
     def render(self):
@@ -343,7 +550,7 @@ class Game:
 
         if self.state == GameState.MENU:
             self.menu.draw()
-            pygame.display.flip()
+            self._present()
             return
 
         # Game Rendering
@@ -352,13 +559,15 @@ class Game:
         # Get screen shake offset
         shake_offset = self.renderer.anim_manager.get_screen_offset()
 
+        # Boards larger than the board area scroll with the active piece
+        ghost = self._get_ghost_piece() if self.state == GameState.PLAYING else None
+        self.renderer.follow(self.board, self.current_piece, ghost)
         self.renderer.draw_board(self.board, shake_offset=shake_offset)
 
         if self.state == GameState.PLAYING or self.state == GameState.GAME_OVER:
             # Don't draw active piece in game over if needed, but usually fine
             if self.state == GameState.PLAYING:
                  # Draw ghost piece
-                ghost = self._get_ghost_piece()
                 self.renderer.draw_piece(ghost, ghost=True, shake_offset=shake_offset)
                 self.renderer.draw_piece(self.current_piece, shake_offset=shake_offset)
 
@@ -367,29 +576,72 @@ class Game:
             # Draw animations
             self.renderer.anim_manager.draw(
                 self.screen,
-                self.renderer.board_offset,
+                self.renderer.board_origin(),
                 self.renderer.block_size,
                 self.board.WIDTH,
                 self.renderer.font_title,
                 self.renderer.font_label,
                 self.renderer.font_value,
-                self.renderer.COLOR_TEXT
+                self.renderer.COLOR_TEXT,
+                clip=self.renderer.board_rect()
             )
 
             if self.paused:
                 self.renderer.draw_pause()
 
+            if self.versus:
+                self.renderer.draw_opponent(self.remote, self.screen.get_width() - self.VERSUS_PANEL + 20, 60)
+
             if self.state == GameState.GAME_OVER:
                 self.renderer.draw_game_over(self.scoring, self.game_time)
 
-        pygame.display.flip()
+        self._present()
 
-    def handle_events(self):
+    def _present(self):
+        """Flip the display and close pending latency samples."""
+        pygame.display.flip()
+        if self.latency:
+            self.latency.presented()
+        if self._first_frame:
+            self._first_frame = False
+            timer.mark('first frame')
+            if self.startup_report:
+                print(timer.report())
+
+    def _is_idle(self) -> bool:
+        """Check if nothing on screen changes without user input."""
+        if self.versus and self.state != GameState.MENU:
+            return False  # The opponent's board keeps changing
+        if self.state == GameState.MENU:
+            return True
+        if self.state == GameState.PLAYING and self.paused:
+            return True  # Animations do not age while paused, the screen is frozen
+        if self.renderer.anim_manager.is_active():
+            return False
+        if self.state == GameState.GAME_OVER:
+            # The new high score message pulses, keep drawing it
+            return self.renderer.get_high_score_rank(self.scoring) is None
+        return False
+
+    def _wait_for_events(self) -> list:
+        """Block until an event arrives or the idle timeout expires."""
+        event = pygame.event.wait(self.IDLE_TIMEOUT)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def handle_events(self, events=None):
         """Handle pygame events."""
-        events = pygame.event.get()
-        
+        if events is None:
+            events = pygame.event.get()
+        arrival = time.perf_counter()
+
+        # Gameplay keys are timed by the input handler
+        if self.state == GameState.PLAYING:
+            self.input_handler.handle_events(events, arrival=arrival)
+
         # Pass events to menu if in menu state
-        if self.state == GameState.MENU:
+        elif self.state == GameState.MENU:
             action = self.menu.handle_input(events)
             if action == "START":
                 self.start_game()
@@ -399,15 +651,29 @@ class Game:
             
         for event in events:
             if event.type == pygame.QUIT:
-                self.scoring.save_high_score()
+                if self.state == GameState.PLAYING and not self.versus and not self.isolated:
+                    # Resumed on the next launch, recorded once it is finished
+                    self._suspend()
+                else:
+                    if self.state == GameState.PLAYING:
+                        self._end_game()
+                    self.scoring.save_high_score()
+                if self.telemetry:
+                    self.telemetry.flush()
+                self.persistence.flush()
                 return False
             
+            elif event.type == pygame.WINDOWMINIMIZED:
+                if self.state == GameState.PLAYING and not self.versus and not self.isolated:
+                    self._suspend()
+
             elif event.type == pygame.KEYDOWN:
                 if self.state == GameState.PLAYING:
-                    if event.key == pygame.K_p:
+                    if event.key == pygame.K_p and not self.versus:
                         self.paused = not self.paused
                     elif event.key == pygame.K_ESCAPE:
                         # Return to menu
+                        self._end_game()
                         self.scoring.save_high_score()
                         self.state = GameState.MENU
                         
@@ -420,14 +686,57 @@ class Game:
 
         return True
 
+    def tick(self) -> bool:
+        """Run one iteration of the main loop. Returns False to quit."""
+        idle = not self.uncapped and self._is_idle()
+        if self.uncapped:
+            self.clock.tick()
+            dt = 1000 / self.fps
+            events = pygame.event.get()
+        elif idle:
+            # Sleep until something happens instead of ticking at full rate
+            events = self._wait_for_events()
+            self.clock.tick()
+            dt = 0
+        else:
+            dt = self.clock.tick(self.fps)
+            events = pygame.event.get()
+
+        running = self.handle_events(events)
+        self.update(dt)
+        if self.broadcast:
+            self.broadcast.publish(self)
+
+        # Idle frames only redraw on input, plus once when going idle
+        if self.render_enabled and (not idle or events or not self._was_idle):
+            self.render()
+        self._was_idle = idle
+        return running
+
     def run(self):
         """Main game loop."""
         running = True
         while running:
-            dt = self.clock.tick(self.fps)
-            running = self.handle_events()
-            self.update(dt)
-            self.render()
-
+            running = self.tick()
+
+        if self.latency:
+            print(self.latency.report())
+
+        self.close()
+        sys.exit()
+
+    def close(self):
+        """Write pending data and shut down pygame."""
+        if self.telemetry:
+            self.telemetry.flush()
+        self.persistence.close()
+        if self.leaderboard:
+            self.leaderboard.close()
+        if self.versus:
+            self.versus.close()
+        if self.broadcast:
+            self.broadcast.close()
+
+        # Don't tear down the mixer under a loader that is still running
+        self.audio.loaded.wait(timeout=2)
         pygame.quit()
-        sys.exit()
\ No newline at end of file
@@ -5,6 +5,7 @@ Manages keyboard input and maps to game actions.
 
 import pygame
 from enum import Enum
+from typing import Dict, Optional
 
 class Action(Enum):
     MOVE_LEFT = 0
@@ -19,9 +20,13 @@ class Action(Enum):
 class InputHandler:
     """
     Handles keyboard input and converts to game actions.
+
+    Consumes KEYDOWN/KEYUP events and computes auto-repeat (DAS/ARR) from
+    the time each key went down, so repeats do not depend on the frame rate
+    and taps shorter than a frame are never lost.
     """
 
-    KEY_MAPPING = {
+    DEFAULT_BINDINGS = {
         pygame.K_LEFT: Action.MOVE_LEFT,
         pygame.K_RIGHT: Action.MOVE_RIGHT,
         pygame.K_DOWN: Action.MOVE_DOWN,
@@ -34,21 +39,188 @@ class InputHandler:
         pygame.K_RSHIFT: Action.HOLD,
     }
 
-    def __init__(self):
-        self.pressed_keys = set()
+    DAS = 200  # initial delay before horizontal repeat, in ms
+    ARR = 50  # horizontal repeat rate in ms, 0 shifts straight to the wall
+    SOFT_DROP_REPEAT = 50  # soft drop repeat rate in ms
+    ROTATE_REPEAT = 150  # delay between rotations while held
+
+    # Trigger count reported for a 0 ms repeat rate, "as many as possible"
+    INSTANT = 1000
+
+    def __init__(self, bindings: Optional[Dict[int, Action]] = None,
+                 das: Optional[int] = None, arr: Optional[int] = None):
+        self.bindings = dict(self.DEFAULT_BINDINGS if bindings is None else bindings)
+        das = self.DAS if das is None else das
+        arr = self.ARR if arr is None else arr
+
+        # Actions that repeat while held: (delay, interval) in ms
+        self.repeat_rates = {
+            Action.MOVE_LEFT: (das, arr),
+            Action.MOVE_RIGHT: (das, arr),
+            Action.MOVE_DOWN: (self.SOFT_DROP_REPEAT, self.SOFT_DROP_REPEAT),
+            Action.ROTATE: (self.ROTATE_REPEAT, self.ROTATE_REPEAT),
+        }
+
+        self.pressed_keys = {}  # key -> time it went down
+        self.held = {}  # action -> [press time, triggers already reported]
+        self.pending = {}  # action -> triggers not yet reported
+        self.counts = {}  # action -> triggers for the current frame
+        self.last_horizontal = None
+
+        # Arrival times (time.perf_counter) of presses, for latency tracking
+        self.pending_arrivals = {}
+        self.arrivals = {}
+
+    @staticmethod
+    def parse_bindings(config: Optional[dict]) -> Dict[int, Action]:
+        """
+        Build a key binding map from a settings dict of
+        action name -> list of pygame key names, e.g. {"ROTATE": ["up", "x"]}.
+        Actions missing from the config keep their default keys.
+        """
+        bindings = dict(InputHandler.DEFAULT_BINDINGS)
+        if not config:
+            return bindings
+
+        for action_name, key_names in config.items():
+            try:
+                action = Action[action_name]
+                keys = [pygame.key.key_code(name) for name in key_names]
+            except (KeyError, ValueError) as e:
+                print(f"Ignoring invalid key binding {action_name}: {e}")
+                continue
+            bindings = {k: a for k, a in bindings.items() if a != action}
+            for key in keys:
+                bindings[key] = action
+        return bindings
+
+    def bind(self, key: int, action: Action):
+        """Bind a key to an action, replacing any previous binding of that key."""
+        self.release_all()
+        self.bindings[key] = action
+
+    def unbind(self, key: int):
+        """Remove the binding of a key."""
+        self.release_all()
+        self.bindings.pop(key, None)
+
+    def _due(self, action: Action, press_time: int, now: int) -> Optional[int]:
+        """
+        Total triggers an action held since press_time has produced by now,
+        None once a 0 ms repeat rate has kicked in and there is no limit.
+        """
+        rate = self.repeat_rates.get(action)
+        if rate is None:
+            return 1
+        delay, interval = rate
+        elapsed = now - press_time
+        if elapsed < delay:
+            return 1
+        if interval <= 0:
+            return None
+        return 2 + (elapsed - delay) // interval
+
+    def _press(self, action: Action, now: int):
+        """Start tracking a held action."""
+        if action in (Action.MOVE_LEFT, Action.MOVE_RIGHT):
+            self.last_horizontal = action
+        self.held[action] = [now, 0]
+
+    def _release(self, action: Action, now: int):
+        """Stop tracking an action, keeping the triggers due up to release."""
+        state = self.held.pop(action, None)
+        if state is None:
+            return
+        self.pending[action] = self.pending.get(action, 0) + self._collect(action, state, now)
+
+    def _collect(self, action: Action, state: list, now: int) -> int:
+        """Return the triggers produced since the last report."""
+        press_time, reported = state
+        due = self._due(action, press_time, now)
+        if due is None:
+            # 0 ms repeat keeps pushing every frame while held
+            return self.INSTANT
+        state[1] = due
+        return max(0, due - reported)
+
+    def handle_events(self, events, now: Optional[int] = None, arrival: Optional[float] = None):
+        """
+        Consume KEYDOWN/KEYUP events for bound keys.
+        arrival tags new presses with the time the events were received.
+        """
+        if now is None:
+            now = pygame.time.get_ticks()
+
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                action = self.bindings.get(event.key)
+                if action is None or event.key in self.pressed_keys:
+                    continue
+                self.pressed_keys[event.key] = now
+                if arrival is not None:
+                    self.pending_arrivals.setdefault(action, arrival)
+                if action not in self.held:
+                    self._press(action, now)
+            elif event.type == pygame.KEYUP:
+                action = self.bindings.get(event.key)
+                if self.pressed_keys.pop(event.key, None) is None:
+                    continue
+                # Another key bound to the same action may still be down
+                if action not in [self.bindings.get(k) for k in self.pressed_keys]:
+                    self._release(action, now)
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                self.release_all(now)
+
+    def release_all(self, now: Optional[int] = None):
+        """Release every held key, e.g. when focus is lost and KEYUPs never arrive."""
+        if now is None:
+            now = pygame.time.get_ticks()
+        for action in list(self.held):
+            self._release(action, now)
+        self.pressed_keys.clear()
+
+    def update(self, now: Optional[int] = None):
+        """Compute the action triggers for this frame."""
+        if now is None:
+            now = pygame.time.get_ticks()
+
+        counts = self.pending
+        self.pending = {}
+        for action, state in self.held.items():
+            count = self._collect(action, state, now)
+            if count:
+                counts[action] = counts.get(action, 0) + count
+
+        # Only the most recently pressed direction repeats while both are held
+        if Action.MOVE_LEFT in self.held and Action.MOVE_RIGHT in self.held:
+            older = Action.MOVE_RIGHT if self.last_horizontal == Action.MOVE_LEFT else Action.MOVE_LEFT
+            counts.pop(older, None)
+
+        self.counts = {a: min(c, self.INSTANT) for a, c in counts.items()}
+        self.arrivals = self.pending_arrivals
+        self.pending_arrivals = {}
+
+    def reset(self):
+        """Forget all held keys and buffered triggers."""
+        self.pressed_keys.clear()
+        self.held.clear()
+        self.pending.clear()
+        self.counts = {}
+        self.pending_arrivals = {}
+        self.arrivals = {}
+
+    def get_actions(self) -> Dict[Action, int]:
+        """Get the actions triggered this frame with their trigger counts."""
+        return dict(self.counts)
 
-    def update(self):
-        """Update the set of currently pressed keys."""
-        self.pressed_keys = set()
-        keys = pygame.key.get_pressed()
-        for key, action in self.KEY_MAPPING.items():
-            if keys[key]:
-                self.pressed_keys.add(action)
+    def get_arrivals(self) -> Dict[Action, float]:
+        """Get the arrival times of the presses triggered this frame."""
+        return dict(self.arrivals)
 
-    def get_actions(self):
-        """Get the set of actions based on current key presses."""
-        return self.pressed_keys.copy()
+    def get_count(self, action: Action) -> int:
+        """Get how many times an action triggered this frame."""
+        return self.counts.get(action, 0)
 
     def is_action_pressed(self, action: Action) -> bool:
-        """Check if a specific action is currently pressed."""
-        return action in self.pressed_keys
\ No newline at end of file
+        """Check if a specific action is currently held."""
+        return action in self.held
@@ -0,0 +1,126 @@
+"""
+Latency instrumentation for Tetrix.
+Measures the time from a key event leaving pygame.event.get() until the
+frame showing its effect is presented by pygame.display.flip().
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .input_handler import Action
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram in milliseconds.
+    """
+
+    BUCKET_MS = 0.5
+    MAX_MS = 250.0
+
+    def __init__(self):
+        self.buckets = [0] * (int(self.MAX_MS / self.BUCKET_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, latency_ms: float):
+        """Record one latency sample."""
+        index = min(int(latency_ms / self.BUCKET_MS), len(self.buckets) - 1)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += latency_ms
+        self.max = max(self.max, latency_ms)
+
+    def percentile(self, p: float) -> float:
+        """Get the upper bound of the bucket holding the p-th percentile."""
+        if self.count == 0:
+            return 0.0
+        target = self.count * p / 100
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return round(min((i + 1) * self.BUCKET_MS, self.max), 3)
+        return self.max
+
+    def summary(self) -> dict:
+        """Get count, mean and percentile latencies."""
+        return {
+            'count': self.count,
+            'mean': round(self.total / self.count, 3) if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': round(self.max, 3)
+        }
+
+
+class LatencyTracker:
+    """
+    Collects input-to-display latency histograms per action type.
+    """
+
+    def __init__(self):
+        self.histograms: Dict[Action, LatencyHistogram] = {}
+        self._applied: List[Tuple[Action, float]] = []
+
+    def applied(self, arrivals: Dict[Action, float]):
+        """Register actions applied to the game this frame with their arrival times."""
+        self._applied.extend(arrivals.items())
+
+    def presented(self, now: Optional[float] = None):
+        """Close the samples of every action applied since the last presented frame."""
+        if not self._applied:
+            return
+        if now is None:
+            now = time.perf_counter()
+        for action, arrival in self._applied:
+            histogram = self.histograms.get(action)
+            if histogram is None:
+                histogram = self.histograms[action] = LatencyHistogram()
+            histogram.add((now - arrival) * 1000)
+        self._applied.clear()
+
+    def summary(self) -> dict:
+        """Get the latency summary of every action type."""
+        return {action.name: h.summary() for action, h in self.histograms.items()}
+
+    def report(self) -> str:
+        """Format the latency summary as a table."""
+        lines = [f"{'ACTION':<12}{'COUNT':>7}{'MEAN':>9}{'P50':>9}{'P95':>9}{'P99':>9}{'MAX':>9}"]
+        for name, s in sorted(self.summary().items()):
+            lines.append(
+                f"{name:<12}{s['count']:>7}{s['mean']:>9.2f}{s['p50']:>9.2f}"
+                f"{s['p95']:>9.2f}{s['p99']:>9.2f}{s['max']:>9.2f}"
+            )
+        return "\n".join(lines)
+
+
+def run_synthetic_benchmark(frames: int = 600, interval: int = 5) -> dict:
+    """
+    Play a game with synthetic key presses injected into the event queue
+    every interval frames and return the latency summary. The game is
+    isolated, nothing it plays reaches the player's scores or logs.
+    """
+    import pygame
+    from .game import Game, GameState
+
+    game = Game(measure_latency=True, isolated=True)
+    try:
+        game.start_game()
+
+        keys = [pygame.K_LEFT, pygame.K_UP, pygame.K_RIGHT, pygame.K_DOWN, pygame.K_SPACE]
+        for frame in range(frames):
+            if game.state == GameState.GAME_OVER:
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r))
+            elif frame % interval == 0:
+                key = keys[(frame // interval) % len(keys)]
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+                pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key))
+            if not game.tick():
+                break
+
+        return game.latency.summary()
+    finally:
+        game.close()
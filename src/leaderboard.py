@@ -0,0 +1,339 @@
+"""
+Shared leaderboard for Tetrix.
+An asyncio server that collects scores from many kiosks, and the client
+the game uses to submit them without blocking the game loop.
+
+Protocol: one JSON object per line in each direction.
+    {"op": "submit", "score": 1200, "level": 3, "lines": 25, "source": "kiosk-1",
+     "date": "2024-05-01 18:30", "id": "3f2a..."}
+        -> {"ok": true, "rank": 4}
+    {"op": "top", "n": 10}      -> {"ok": true, "scores": [...]}
+    {"op": "rank", "score": 900} -> {"ok": true, "rank": 7, "total": 120}
+
+Run a server with:
+    python -m src.leaderboard --port 8765
+"""
+
+import os
+import json
+import asyncio
+import bisect
+import itertools
+import threading
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import List, Optional
+
+from .score_db import ScoreDatabase
+from .persistence import write_json_atomic
+
+
+class LeaderboardServer:
+    """
+    Serves submissions and queries from an in-memory sorted index, writing
+    submissions to the store in batches.
+    """
+
+    DB_FILE = os.path.join('data', 'leaderboard.db')
+    BATCH_SIZE = 256
+    BATCH_INTERVAL = 0.25  # seconds
+    BACKLOG = 4096
+    MAX_TOP = 100
+
+    def __init__(self, db_path: str = DB_FILE, host: str = '127.0.0.1', port: int = 8765):
+        self.db = ScoreDatabase(db_path)
+        self.host = host
+        self.port = port
+        self.server = None
+
+        # Sorted ascending by (-score, arrival), so index 0 is the best game
+        self._keys = []
+        self._entries = []
+        self._arrival = itertools.count()
+        self._seen = set()  # ids of the submissions already stored
+
+        self._batch = []
+        self._batch_ready = None
+        self._flusher = None
+
+    def _insert(self, entry: dict) -> int:
+        """Add an entry to the index and return its rank."""
+        key = (-entry['score'], next(self._arrival))
+        pos = bisect.bisect_right(self._keys, key)
+        self._keys.insert(pos, key)
+        self._entries.insert(pos, entry)
+        return self.rank_of(entry['score'])
+
+    def rank_of(self, score: int) -> int:
+        """Rank a score would have: 1 + number of strictly better games."""
+        return bisect.bisect_left(self._keys, (-score,)) + 1
+
+    def top(self, n: int = 10) -> List[dict]:
+        """Get the n best games."""
+        return self._entries[:max(0, min(n, self.MAX_TOP))]
+
+    def _load_index(self):
+        """Build the index from the games already in the store."""
+        self._seen.update(self.db.submission_ids())
+        for score, level, lines, played_at, source in self.db.iter_games():
+            self._keys.append((-score, next(self._arrival)))
+            self._entries.append(self._entry(score, level, lines, played_at, source))
+
+    @staticmethod
+    def _entry(score, level, lines, played_at: datetime, source) -> dict:
+        return {
+            'score': score,
+            'level': level,
+            'lines': lines,
+            'date': played_at.strftime("%Y-%m-%d %H:%M"),
+            'source': source
+        }
+
+    async def start(self):
+        """Load the index and start listening."""
+        await asyncio.get_running_loop().run_in_executor(None, self._load_index)
+        self._batch_ready = asyncio.Event()
+        self._flusher = asyncio.create_task(self._flush_loop())
+        self.server = await asyncio.start_server(self._handle, self.host, self.port, backlog=self.BACKLOG)
+        # Pick up the real port when started on port 0
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Start and serve until cancelled."""
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        """Stop listening and write out the pending batch."""
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        if self._flusher:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self._flush()
+
+    async def _flush_loop(self):
+        """Write batches when full or every BATCH_INTERVAL."""
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), self.BATCH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            await self._flush()
+
+    async def _flush(self):
+        """Insert the pending batch in one transaction off the event loop."""
+        if not self._batch:
+            return
+        batch, self._batch = self._batch, []
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self.db.add_games, batch)
+        except Exception as e:
+            print(f"Error writing leaderboard batch: {e}")
+
+    @staticmethod
+    def _played_at(request: dict) -> datetime:
+        """
+        When the game was played, as the client says: a queued score can
+        arrive long after. Now if missing, unreadable or in the future.
+        """
+        now = datetime.now()
+        for field, layout in (('played_at', "%Y-%m-%d %H:%M:%S"), ('date', "%Y-%m-%d %H:%M")):
+            if field in request:
+                try:
+                    return min(datetime.strptime(str(request[field]), layout), now)
+                except ValueError:
+                    pass
+        return now
+
+    def _submit(self, request: dict) -> dict:
+        score = int(request['score'])
+        level = int(request.get('level', 1))
+        lines = int(request.get('lines', 0))
+        source = request.get('source')
+        played_at = self._played_at(request)
+
+        # A client that lost our reply sends the game again
+        submission = request.get('id')
+        if submission is not None:
+            submission = str(submission)
+            if submission in self._seen:
+                return {'ok': True, 'rank': self.rank_of(score), 'duplicate': True}
+            self._seen.add(submission)
+
+        self._batch.append((score, level, lines, float(request.get('duration', 0.0)),
+                            request.get('seed'), played_at, source, submission))
+        if len(self._batch) >= self.BATCH_SIZE:
+            self._batch_ready.set()
+
+        rank = self._insert(self._entry(score, level, lines, played_at, source))
+        return {'ok': True, 'rank': rank}
+
+    def _dispatch(self, request) -> dict:
+        if not isinstance(request, dict):
+            return {'ok': False, 'error': "request must be a JSON object"}
+        op = request.get('op')
+        if op == 'submit':
+            return self._submit(request)
+        if op == 'top':
+            return {'ok': True, 'scores': self.top(int(request.get('n', 10)))}
+        if op == 'rank':
+            return {'ok': True, 'rank': self.rank_of(int(request['score'])), 'total': len(self._keys)}
+        return {'ok': False, 'error': f"unknown op {op!r}"}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve one connection, any number of requests."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # Longer than the reader's limit, the rest of the stream can't be trusted
+                    writer.write(json.dumps({'ok': False, 'error': "request too long"}).encode() + b'\n')
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                try:
+                    response = self._dispatch(json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    response = {'ok': False, 'error': str(e)}
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+class LeaderboardClient:
+    """
+    Submits scores from a background thread with an offline queue.
+
+    submit() only hands the entry to the client's event loop. Entries that
+    cannot be delivered stay queued on disk and are retried.
+    """
+
+    QUEUE_FILE = os.path.join('data', 'leaderboard_queue.json')
+    RETRY_INTERVAL = 5.0  # seconds
+    TIMEOUT = 3.0
+
+    def __init__(self, host: str, port: int, source: Optional[str] = None, queue_file: str = QUEUE_FILE):
+        self.host = host
+        self.port = port
+        self.source = source
+        self.queue_file = queue_file
+        self.queue = deque(self._load_queue())
+
+        self._loop = asyncio.new_event_loop()
+        self._wakeup = asyncio.Event()
+        self._sender_task = self._loop.create_task(self._sender())
+        self._thread = threading.Thread(target=self._run, name='tetrix-leaderboard', daemon=True)
+        self._thread.start()
+
+    def _load_queue(self) -> list:
+        """Load entries left over from a previous run."""
+        if not os.path.exists(self.queue_file):
+            return []
+        try:
+            with open(self.queue_file, 'r') as f:
+                return json.load(f)
+        except (ValueError, OSError) as e:
+            print(f"Error reading leaderboard queue: {e}")
+            return []
+
+    def _save_queue(self):
+        try:
+            write_json_atomic(self.queue_file, list(self.queue))
+        except OSError as e:
+            print(f"Error saving leaderboard queue: {e}")
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def submit(self, entry: dict):
+        """Queue a finished game for submission. Never blocks."""
+        # The id lets the server drop a resend whose first reply was lost
+        entry = dict(entry, op='submit', source=self.source, id=uuid.uuid4().hex)
+        self._loop.call_soon_threadsafe(self._enqueue, entry)
+
+    def _enqueue(self, entry: dict):
+        self.queue.append(entry)
+        self._save_queue()
+        self._wakeup.set()
+
+    async def _sender(self):
+        """Deliver queued entries, retrying while the server is unreachable."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.RETRY_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if not self.queue:
+                continue
+            try:
+                await asyncio.wait_for(self._send_queued(), self.TIMEOUT)
+            except (OSError, asyncio.TimeoutError, ValueError):
+                pass  # Offline, keep the queue for the next retry
+            self._save_queue()
+
+    async def _send_queued(self):
+        """Send every queued entry over one connection."""
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            while self.queue:
+                writer.write(json.dumps(self.queue[0]).encode() + b'\n')
+                await writer.drain()
+                response = json.loads(await reader.readline())
+                if not response.get('ok'):
+                    print(f"Leaderboard rejected a score: {response.get('error')}")
+                self.queue.popleft()
+        finally:
+            writer.close()
+
+    def close(self):
+        """Stop the client thread, keeping undelivered entries on disk."""
+        async def shutdown():
+            self._sender_task.cancel()
+            try:
+                await self._sender_task
+            except asyncio.CancelledError:
+                pass
+            self._loop.stop()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop)
+        self._thread.join(timeout=2)
+        if not self._thread.is_alive():
+            self._loop.close()
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Tetrix leaderboard server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--db', default=LeaderboardServer.DB_FILE)
+    args = parser.parse_args()
+
+    server = LeaderboardServer(args.db, args.host, args.port)
+    print(f"Leaderboard listening on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -2,12 +2,85 @@
 Main entry point for Tetrix game.
 """
 
-from .game import Game
+import argparse
+import json
+
+from .startup import timer, ImportProfiler
 
 def main():
     """Start the game."""
-    game = Game()
+    parser = argparse.ArgumentParser(description='Tetrix')
+    parser.add_argument('--measure-latency', action='store_true',
+                        help='print input-to-display latency histograms on exit')
+    parser.add_argument('--latency-benchmark', type=int, metavar='FRAMES',
+                        help='play FRAMES frames of synthetic input and print latency as JSON')
+    parser.add_argument('--startup-report', action='store_true',
+                        help='print the startup timeline after the first frame')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='print import and init times up to the first frame, then exit')
+    parser.add_argument('--host', type=int, metavar='PORT',
+                        help='host an online versus game on PORT')
+    parser.add_argument('--join', metavar='HOST:PORT',
+                        help='join an online versus game')
+    parser.add_argument('--broadcast', type=int, metavar='PORT',
+                        help='stream the game to spectators on PORT')
+    parser.add_argument('--board', metavar='WxH',
+                        help='play on a custom board size, e.g. 40x400')
+    args = parser.parse_args()
+
+    profiler = None
+    if args.profile_startup:
+        profiler = ImportProfiler()
+        profiler.install()
+
+    # Imported late so --help stays fast and the profiler sees every import
+    from .game import Game
+    timer.mark('game modules imported')
+
+    board = {}
+    if args.board:
+        from .board import parse_size
+        try:
+            board['board_width'], board['board_height'] = parse_size(args.board)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.latency_benchmark:
+        from .latency import run_synthetic_benchmark
+        print(json.dumps(run_synthetic_benchmark(args.latency_benchmark), indent=2))
+        return
+
+    if profiler:
+        game = Game(startup_report=True)
+        game.render()  # First frame prints the init timeline
+        profiler.uninstall()
+        print()
+        print(profiler.report())
+        game.close()
+        return
+
+    versus = None
+    if args.board and (args.host is not None or args.join):
+        print("Error: online versus is played on the standard board")
+        return
+    if args.host is not None or args.join:
+        from .versus import VersusConnection
+        if args.join:
+            host, _, port = args.join.rpartition(':')
+            versus = VersusConnection.join(host or '127.0.0.1', int(port))
+        else:
+            versus = VersusConnection.host(args.host)
+            print(f"Waiting for the other player on port {versus.port}")
+
+    broadcast = None
+    if args.broadcast is not None:
+        from .spectate import BroadcastServer
+        broadcast = BroadcastServer(port=args.broadcast)
+        print(f"Broadcasting to spectators on port {broadcast.port}")
+
+    game = Game(measure_latency=args.measure_latency, startup_report=args.startup_report,
+                versus=versus, broadcast=broadcast, resume=True, **board)
     game.run()
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
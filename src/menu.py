@@ -11,6 +11,7 @@ class MainMenu:
     """
     
     OPTIONS = ["START GAME", "HIGH SCORES", "THEMES", "EXIT"]
+    OPTIONS_START_Y = 300
     THEME_OPTIONS = ["NEON", "PASTEL", "RETRO"]
 
     def __init__(self, screen, renderer, scoring, sound_manager):
@@ -25,6 +26,11 @@ class MainMenu:
         self.font_large = pygame.font.SysFont('Arial', 80, bold=True)
         self.font_option = pygame.font.SysFont('Arial', 40)
         self.font_small = pygame.font.SysFont('Arial', 24)
+        self.font_header = pygame.font.SysFont('Arial', 24, bold=True)
+
+        # Cached screen surfaces: name -> (key, surface), and rendered labels
+        self._layers = {}
+        self._text_cache = {}
         
         # State: MAIN, SCORES, THEMES
         self.menu_state = 'MAIN'
@@ -109,11 +115,32 @@ class MainMenu:
         elif selection == "EXIT":
             return "EXIT"
             
+    def _get_layer(self, name, key, build):
+        """
+        Get the cached full screen surface for a menu screen.
+        The surface is rebuilt only when its key changes.
+        """
+        cached = self._layers.get(name)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        surface = pygame.Surface(self.screen.get_size()).convert()
+        surface.fill(self.renderer.COLOR_BG)
+        build(surface)
+        self._layers[name] = (key, surface)
+        return surface
+
+    def _render_text(self, font, text, color):
+        """Render text through the label cache."""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+        return surf
+
     def draw(self):
         """Render the menu."""
-        # Draw background (using current theme bg)
-        self.screen.fill(self.renderer.COLOR_BG)
-        
         if self.menu_state == 'SCORES':
             self._draw_high_scores()
         elif self.menu_state == 'THEMES':
@@ -122,47 +149,57 @@ class MainMenu:
             self._draw_main_menu()
 
     def _draw_main_menu(self):
+        """Draw the cached main menu and highlight the selected option."""
+        key = (self.renderer.current_theme_name, self.scoring.high_score)
+        layer = self._get_layer('MAIN', key, self._build_main_menu)
+        self.screen.blit(layer, (0, 0))
+
+        # Cover the plain label of the selected option with its highlighted version
+        option = self.OPTIONS[self.selected_index]
+        center = (self.screen.get_width() // 2, self.OPTIONS_START_Y + self.selected_index * 60)
+        plain_rect = self._render_text(self.font_option, option, self.renderer.COLOR_TEXT_WHITE).get_rect(center=center)
+        selected_surf = self._render_text(self.font_option, f"> {option} <", self.renderer.COLOR_TEXT)
+        selected_rect = selected_surf.get_rect(center=center)
+        self.screen.fill(self.renderer.COLOR_BG, plain_rect.union(selected_rect))
+        self.screen.blit(selected_surf, selected_rect)
+
+    def _build_main_menu(self, surface):
+        """Compose the static part of the main menu."""
         # Title
         title_surf = self.font_large.render("TETRIX", True, self.renderer.COLOR_TEXT)
-        title_rect = title_surf.get_rect(center=(self.screen.get_width() // 2, 150))
-        
-        # Simple pulsing effect for title
-        scale = 1.0 + 0.05 * abs(pygame.math.Vector2(0, 0).distance_to((0, 0.5 * self.pulse_timer % 10))) 
-        
-        self.screen.blit(title_surf, title_rect)
+        title_rect = title_surf.get_rect(center=(surface.get_width() // 2, 150))
+        surface.blit(title_surf, title_rect)
 
         # High Score Mini Display
         score_text = self.font_small.render(f"BEST: {self.scoring.high_score}", True, self.renderer.COLOR_TEXT_WHITE)
-        score_rect = score_text.get_rect(center=(self.screen.get_width() // 2, 220))
-        self.screen.blit(score_text, score_rect)
+        score_rect = score_text.get_rect(center=(surface.get_width() // 2, 220))
+        surface.blit(score_text, score_rect)
 
-        # Options
-        start_y = 300
+        # Options, all unselected
         for i, option in enumerate(self.OPTIONS):
-            color = self.renderer.COLOR_TEXT if i == self.selected_index else self.renderer.COLOR_TEXT_WHITE
-            
-            # Highlight selected
-            if i == self.selected_index:
-                option = f"> {option} <"
-            
-            text_surf = self.font_option.render(option, True, color)
-            text_rect = text_surf.get_rect(center=(self.screen.get_width() // 2, start_y + i * 60))
-            self.screen.blit(text_surf, text_rect)
+            text_surf = self._render_text(self.font_option, option, self.renderer.COLOR_TEXT_WHITE)
+            text_rect = text_surf.get_rect(center=(surface.get_width() // 2, self.OPTIONS_START_Y + i * 60))
+            surface.blit(text_surf, text_rect)
 
         # Footer
         footer_text = self.font_small.render("Use ARROW KEYS and ENTER", True, (100, 100, 100))
-        footer_rect = footer_text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 30))
-        self.screen.blit(footer_text, footer_rect)
+        footer_rect = footer_text.get_rect(center=(surface.get_width() // 2, surface.get_height() - 30))
+        surface.blit(footer_text, footer_rect)
 
     def _draw_themes(self):
         """Draw the theme selection screen."""
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        key = (self.renderer.current_theme_name, self.selected_theme_index)
+        self.screen.blit(self._get_layer('THEMES', key, self._build_themes), (0, 0))
+
+    def _build_themes(self, surface):
+        """Compose the theme selection screen."""
+        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 100)) # Slight darken on top of new bg color
-        self.screen.blit(overlay, (0, 0))
+        surface.blit(overlay, (0, 0))
         
         title_surf = self.font_large.render("SELECT THEME", True, self.renderer.COLOR_TEXT)
-        title_rect = title_surf.get_rect(center=(self.screen.get_width() // 2, 100))
-        self.screen.blit(title_surf, title_rect)
+        title_rect = title_surf.get_rect(center=(surface.get_width() // 2, 100))
+        surface.blit(title_surf, title_rect)
 
         start_y = 200
         for i, theme in enumerate(self.THEME_OPTIONS):
@@ -170,55 +207,59 @@ class MainMenu:
             color = self.renderer.COLOR_TEXT if is_selected else self.renderer.COLOR_TEXT_WHITE
             
             label = f"> {theme} <" if is_selected else theme
-            text_surf = self.font_option.render(label, True, color)
-            text_rect = text_surf.get_rect(center=(self.screen.get_width() // 2, start_y + i * 120))
-            self.screen.blit(text_surf, text_rect)
+            text_surf = self._render_text(self.font_option, label, color)
+            text_rect = text_surf.get_rect(center=(surface.get_width() // 2, start_y + i * 120))
+            surface.blit(text_surf, text_rect)
             
             # Draw Color Preview Palettes
             if is_selected:
-                self._draw_theme_preview(start_y + i * 120 + 40, theme)
+                self._draw_theme_preview(surface, start_y + i * 120 + 40, theme)
 
         back_text = self.font_option.render("Press ENTER to Confirm", True, (150, 150, 150))
-        back_rect = back_text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 60))
-        self.screen.blit(back_text, back_rect)
+        back_rect = back_text.get_rect(center=(surface.get_width() // 2, surface.get_height() - 60))
+        surface.blit(back_text, back_rect)
 
-    def _draw_theme_preview(self, y_pos, theme_name):
+    def _draw_theme_preview(self, surface, y_pos, theme_name):
         """Draws small blocks showing the theme's palette."""
         theme = self.renderer.THEMES[theme_name]
         pieces = ['I', 'O', 'T', 'S', 'Z']
         
         total_w = len(pieces) * 40
-        start_x = (self.screen.get_width() - total_w) // 2
+        start_x = (surface.get_width() - total_w) // 2
         
         for i, p_type in enumerate(pieces):
             color = theme['PIECES'][p_type]
             rect = pygame.Rect(start_x + i * 40, y_pos, 30, 30)
-            pygame.draw.rect(self.screen, color, rect)
-            pygame.draw.rect(self.screen, (255, 255, 255), rect, 1)
+            pygame.draw.rect(surface, color, rect)
+            pygame.draw.rect(surface, (255, 255, 255), rect, 1)
 
     def _draw_high_scores(self):
-        """Draw the high scores screen with a list of top scores."""
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        """Draw the high scores screen, rebuilt only when the scores change."""
+        key = (self.renderer.current_theme_name, self.scoring.scores_version)
+        self.screen.blit(self._get_layer('SCORES', key, self._build_high_scores), (0, 0))
+
+    def _build_high_scores(self, surface):
+        """Compose the high scores screen with a list of top scores."""
+        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
         overlay.fill((10, 10, 20, 230))
-        self.screen.blit(overlay, (0, 0))
+        surface.blit(overlay, (0, 0))
         
         # Title
         title_surf = self.font_large.render("TOP SCORES", True, self.renderer.COLOR_TEXT)
-        title_rect = title_surf.get_rect(center=(self.screen.get_width() // 2, 80))
-        self.screen.blit(title_surf, title_rect)
+        title_rect = title_surf.get_rect(center=(surface.get_width() // 2, 80))
+        surface.blit(title_surf, title_rect)
 
         # Table Header
         header_y = 160
-        header_font = pygame.font.SysFont('Arial', 24, bold=True)
-        col1 = header_font.render("RANK", True, self.renderer.COLOR_TEXT)
-        col2 = header_font.render("SCORE", True, self.renderer.COLOR_TEXT)
-        col3 = header_font.render("LVL", True, self.renderer.COLOR_TEXT)
-        col4 = header_font.render("DATE", True, self.renderer.COLOR_TEXT)
+        col1 = self.font_header.render("RANK", True, self.renderer.COLOR_TEXT)
+        col2 = self.font_header.render("SCORE", True, self.renderer.COLOR_TEXT)
+        col3 = self.font_header.render("LVL", True, self.renderer.COLOR_TEXT)
+        col4 = self.font_header.render("DATE", True, self.renderer.COLOR_TEXT)
         
-        self.screen.blit(col1, (80, header_y))
-        self.screen.blit(col2, (180, header_y))
-        self.screen.blit(col3, (320, header_y))
-        self.screen.blit(col4, (400, header_y))
+        surface.blit(col1, (80, header_y))
+        surface.blit(col2, (180, header_y))
+        surface.blit(col3, (320, header_y))
+        surface.blit(col4, (400, header_y))
 
         # List Scores
         start_y = 200
@@ -231,16 +272,16 @@ class MainMenu:
             level = self.font_small.render(str(entry.get('level', '-')), True, color)
             date = self.font_small.render(str(entry.get('date', '-')), True, color)
             
-            self.screen.blit(rank, (80, y))
-            self.screen.blit(score, (180, y))
-            self.screen.blit(level, (320, y))
-            self.screen.blit(date, (400, y))
+            surface.blit(rank, (80, y))
+            surface.blit(score, (180, y))
+            surface.blit(level, (320, y))
+            surface.blit(date, (400, y))
 
         if not self.scoring.scores_list:
             empty_surf = self.font_option.render("NO SCORES YET", True, (100, 100, 100))
-            empty_rect = empty_surf.get_rect(center=(self.screen.get_width() // 2, 300))
-            self.screen.blit(empty_surf, empty_rect)
+            empty_rect = empty_surf.get_rect(center=(surface.get_width() // 2, 300))
+            surface.blit(empty_surf, empty_rect)
         
         back_text = self.font_option.render("Press ENTER to Return", True, self.renderer.COLOR_TEXT)
-        back_rect = back_text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 60))
-        self.screen.blit(back_text, back_rect)
\ No newline at end of file
+        back_rect = back_text.get_rect(center=(surface.get_width() // 2, surface.get_height() - 60))
+        surface.blit(back_text, back_rect)
@@ -0,0 +1,172 @@
+"""
+Particle system for Tetrix game.
+Array-backed burst particles for line clear and tetris effects.
+"""
+
+import pygame
+import random
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Particles are purely cosmetic, run without them
+    np = None
+
+
+class ParticleSystem:
+    """
+    Stores particles as structure-of-arrays NumPy buffers.
+
+    Positions and velocities are kept in board cell units so the system does
+    not need to know the board geometry until it is drawn.
+    """
+
+    MAX_PARTICLES = 4096
+    GRAVITY = 18.0  # cells per second^2
+    ALPHA_LEVELS = 8
+    PARTICLE_SIZE = 4  # pixels
+
+    def __init__(self, capacity: int = MAX_PARTICLES):
+        self.capacity = capacity
+        self.count = 0
+        self.enabled = np is not None
+
+        # Palette of colors, particles store an index into it
+        self.palette: List[Tuple[int, int, int]] = []
+        self._palette_index: Dict[Tuple[int, int, int], int] = {}
+        self._sprites: Dict[Tuple[int, int], pygame.Surface] = {}
+
+        self.last_update = time.time()
+
+        # Buffers are allocated by the first burst, numpy.random is slow to import
+        self.pos = None
+
+    def _allocate(self):
+        """Allocate the particle buffers."""
+        capacity = self.capacity
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.int16)
+        self._rng = np.random.default_rng(random.getrandbits(32))
+
+    def _color_id(self, color: Tuple[int, int, int]) -> int:
+        """Return the palette index for a color, registering it if needed."""
+        color = tuple(color)
+        idx = self._palette_index.get(color)
+        if idx is None:
+            idx = len(self.palette)
+            self.palette.append(color)
+            self._palette_index[color] = idx
+        return idx
+
+    def emit_lines(self, lines: Sequence[int], board_width: int,
+                   colors: Optional[Sequence[Sequence]] = None,
+                   per_cell: int = 6, is_tetris: bool = False):
+        """
+        Emit a burst of particles from every cell of the cleared lines.
+        colors holds one row of cell colors per cleared line.
+        """
+        if not self.enabled or not lines:
+            return
+        if self.pos is None:
+            self._allocate()
+
+        if is_tetris:
+            per_cell *= 3
+
+        free = self.capacity - self.count
+        total = min(len(lines) * board_width * per_cell, free)
+        if total <= 0:
+            return
+
+        # Origin cell of every particle, row-major over the cleared cells
+        cells_x = np.tile(np.arange(board_width), len(lines))
+        cells_y = np.repeat(np.asarray(lines), board_width)
+        cell_ids = np.repeat(np.arange(len(cells_x)), per_cell)[:total]
+
+        white = self._color_id((255, 255, 255))
+        cell_colors = np.full(len(cells_x), white, dtype=np.int16)
+        if colors:
+            for row, row_colors in enumerate(colors):
+                for x, c in enumerate(row_colors[:board_width]):
+                    if c:
+                        cell_colors[row * board_width + x] = self._color_id(c)
+
+        rng = self._rng
+        speed = 8.0 if is_tetris else 5.0
+
+        s = slice(self.count, self.count + total)
+        self.pos[s, 0] = cells_x[cell_ids] + rng.random(total, dtype=np.float32)
+        self.pos[s, 1] = cells_y[cell_ids] + rng.random(total, dtype=np.float32)
+        angle = rng.uniform(0, 2 * np.pi, total)
+        magnitude = rng.uniform(0.3, 1.0, total) * speed
+        self.vel[s, 0] = np.cos(angle) * magnitude
+        self.vel[s, 1] = np.sin(angle) * magnitude - speed * 0.5
+        lifetime = rng.uniform(0.4, 1.0 if is_tetris else 0.7, total)
+        self.life[s] = lifetime
+        self.max_life[s] = lifetime
+        self.color[s] = cell_colors[cell_ids]
+        self.count += total
+
+    def update(self):
+        """Advance all live particles and drop the expired ones."""
+        now = time.time()
+        dt = min(now - self.last_update, 0.1)
+        self.last_update = now
+
+        if not self.enabled or self.count == 0:
+            return
+
+        n = self.count
+        self.vel[:n, 1] += self.GRAVITY * dt
+        self.pos[:n] += self.vel[:n] * dt
+        self.life[:n] -= dt
+
+        alive = self.life[:n] > 0
+        live = int(alive.sum())
+        if live < n:
+            # Compact survivors to the front of the buffers
+            for buf in (self.pos, self.vel, self.life, self.max_life, self.color):
+                buf[:live] = buf[:n][alive]
+            self.count = live
+
+    def is_active(self) -> bool:
+        """Check if any particle is alive."""
+        return self.count > 0
+
+    def _get_sprite(self, color_id: int, alpha_level: int) -> pygame.Surface:
+        """Get the cached square sprite for a color and alpha level."""
+        key = (color_id, alpha_level)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((self.PARTICLE_SIZE, self.PARTICLE_SIZE))
+            sprite.fill(self.palette[color_id])
+            sprite.set_alpha(int(255 * (alpha_level + 1) / self.ALPHA_LEVELS))
+            self._sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen: pygame.Surface, board_offset: Tuple[int, int], block_size: int):
+        """Draw all particles with a single batched blit."""
+        if not self.enabled or self.count == 0:
+            return
+
+        n = self.count
+        half = self.PARTICLE_SIZE // 2
+        xs = (board_offset[0] + self.pos[:n, 0] * block_size - half).astype(np.int32)
+        ys = (board_offset[1] + self.pos[:n, 1] * block_size - half).astype(np.int32)
+        levels = (self.life[:n] / self.max_life[:n] * self.ALPHA_LEVELS).astype(np.int32)
+        np.clip(levels, 0, self.ALPHA_LEVELS - 1, out=levels)
+
+        get_sprite = self._get_sprite
+        screen.blits(
+            [(get_sprite(c, a), (x, y)) for c, a, x, y in
+             zip(self.color[:n].tolist(), levels.tolist(), xs.tolist(), ys.tolist())],
+            doreturn=False
+        )
+
+    def clear(self):
+        """Remove all particles."""
+        self.count = 0
@@ -0,0 +1,107 @@
+"""
+Persistence module for Tetrix.
+Write-behind service that keeps disk I/O off the render thread.
+"""
+
+import os
+import json
+import threading
+import time
+
+def write_json_atomic(path: str, data, **json_args):
+    """Write JSON through a temp file and rename, so readers never see a partial file."""
+    write_bytes_atomic(path, json.dumps(data, **json_args).encode('utf-8'))
+
+
+def write_bytes_atomic(path: str, data: bytes):
+    """Write bytes through a temp file and rename, so readers never see a partial file."""
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class PersistenceService:
+    """
+    Runs write jobs on a background thread.
+
+    Jobs scheduled under the same key within the debounce window are
+    coalesced, only the latest one runs. flush() runs everything pending
+    right away, e.g. on QUIT.
+    """
+
+    DEBOUNCE = 0.5  # seconds
+
+    def __init__(self, debounce: float = DEBOUNCE):
+        self.debounce = debounce
+        self._pending = {}  # key -> (due time, fn, args)
+        self._sequence = 0
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()  # jobs never run concurrently
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, name='tetrix-persistence', daemon=True)
+        self._thread.start()
+
+    def schedule(self, key: str, fn, *args):
+        """Run fn(*args) after the debounce window, replacing any pending job for key."""
+        with self._cond:
+            self._pending[key] = (time.monotonic() + self.debounce, fn, args)
+            self._cond.notify()
+
+    def submit(self, fn, *args):
+        """Run fn(*args) as soon as possible, never coalesced."""
+        with self._cond:
+            self._sequence += 1
+            self._pending[('job', self._sequence)] = (time.monotonic(), fn, args)
+            self._cond.notify()
+
+    def _take_due(self, everything: bool = False) -> list:
+        """Pop jobs that are due, in due order. Caller holds the condition."""
+        now = time.monotonic()
+        due = [(k, job) for k, job in self._pending.items() if everything or job[0] <= now]
+        for key, _ in due:
+            del self._pending[key]
+        return sorted((job for _, job in due), key=lambda job: job[0])
+
+    def _run(self, jobs: list):
+        """Execute jobs, reporting failures without killing the thread."""
+        with self._io_lock:
+            for _, fn, args in jobs:
+                try:
+                    fn(*args)
+                except Exception as e:
+                    print(f"Error in background save: {e}")
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                jobs = self._take_due()
+                if not jobs:
+                    wait = min(job[0] for job in self._pending.values()) - time.monotonic()
+                    self._cond.wait(max(0.0, wait))
+                    continue
+            self._run(jobs)
+
+    def flush(self):
+        """Run every pending job now on the calling thread."""
+        with self._cond:
+            jobs = self._take_due(everything=True)
+        self._run(jobs)
+
+    def close(self):
+        """Flush pending jobs and stop the worker."""
+        self.flush()
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout=2)
@@ -0,0 +1,168 @@
+"""
+Quantiles module for Tetrix.
+Streaming quantile sketches that summarize every game ever played in a
+few kilobytes.
+"""
+
+import math
+import random
+import struct
+from array import array
+from typing import Dict, Optional
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch (Karnin, Lang, Liberty).
+
+    Items live in a stack of compactors, an item at height h stands for
+    2**h original values. When the sketch is full a compactor sorts itself
+    and promotes every other item one level up. Updates are amortized O(1),
+    memory is O(k) and rank errors stay around 1.7 / k of the total.
+    Two sketches merge by concatenating their compactors.
+    """
+
+    K = 200
+    C = 2.0 / 3.0
+
+    def __init__(self, k: int = K, seed: Optional[int] = None):
+        self.k = k
+        self.n = 0
+        self.compactors = []
+        self.size = 0
+        self.max_size = 0
+        self._rng = random.Random(seed)
+        self._grow()
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self.compactors) - height - 1
+        return int(math.ceil(self.k * self.C ** depth)) + 1
+
+    def _grow(self):
+        self.compactors.append([])
+        self.max_size = sum(self._capacity(h) for h in range(len(self.compactors)))
+
+    def update(self, value: float):
+        """Add one value."""
+        self.compactors[0].append(value)
+        self.n += 1
+        self.size += 1
+        if self.size >= self.max_size:
+            self._compress()
+
+    def _compact(self, height: int):
+        """Promote every other item of a full compactor to the next level."""
+        items = self.compactors[height]
+        items.sort()
+        # Keep the odd item out at this level
+        leftover = [items.pop()] if len(items) % 2 else []
+        offset = self._rng.randrange(2)
+        if height + 1 >= len(self.compactors):
+            self._grow()
+        self.compactors[height + 1].extend(items[offset::2])
+        self.compactors[height] = leftover
+
+    def _compress(self):
+        for height in range(len(self.compactors)):
+            if len(self.compactors[height]) >= self._capacity(height):
+                self._compact(height)
+                self.size = sum(len(c) for c in self.compactors)
+                if self.size < self.max_size:
+                    break
+
+    def merge(self, other: 'KLLSketch'):
+        """Fold another sketch into this one."""
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for height, items in enumerate(other.compactors):
+            self.compactors[height].extend(items)
+        self.n += other.n
+        self.size = sum(len(c) for c in self.compactors)
+        while self.size >= self.max_size:
+            self._compress()
+
+    def rank(self, value: float) -> int:
+        """Estimated number of values strictly below value."""
+        return sum(
+            sum(1 for item in items if item < value) << height
+            for height, items in enumerate(self.compactors)
+        )
+
+    def fraction_below(self, value: float) -> Optional[float]:
+        """Estimated fraction of values strictly below value, None when empty."""
+        if self.n == 0:
+            return None
+        # Compaction keeps the total weight equal to n
+        return self.rank(value) / self.n
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated value at quantile q (0..1), None when empty."""
+        weighted = sorted(
+            (item, 1 << height)
+            for height, items in enumerate(self.compactors)
+            for item in items
+        )
+        if not weighted:
+            return None
+        target = q * sum(weight for _, weight in weighted)
+        seen = 0
+        for item, weight in weighted:
+            seen += weight
+            if seen >= target:
+                return item
+        return weighted[-1][0]
+
+
+# File layout (little endian):
+#   header: magic b'TXQS', u16 version, u16 sketch count
+#   sketch: u8 name length, name, u16 k, u64 n, u16 compactor count
+#   compactor: u32 item count, f64 items
+MAGIC = b'TXQS'
+VERSION = 1
+_HEADER = struct.Struct('<4sHH')
+_SKETCH = struct.Struct('<HQH')
+_COUNT = struct.Struct('<I')
+
+
+def dump_sketches(sketches: Dict[str, KLLSketch]) -> bytes:
+    """Serialize named sketches."""
+    parts = [_HEADER.pack(MAGIC, VERSION, len(sketches))]
+    for name, sketch in sketches.items():
+        encoded = name.encode('utf-8')
+        parts.append(bytes([len(encoded)]) + encoded)
+        parts.append(_SKETCH.pack(sketch.k, sketch.n, len(sketch.compactors)))
+        for items in sketch.compactors:
+            parts.append(_COUNT.pack(len(items)))
+            parts.append(array('d', items).tobytes())
+    return b''.join(parts)
+
+
+def load_sketches(data: bytes) -> Dict[str, KLLSketch]:
+    """Deserialize sketches written by dump_sketches."""
+    magic, version, count = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a Tetrix sketch file (v{VERSION})")
+    offset = _HEADER.size
+
+    sketches = {}
+    for _ in range(count):
+        name_len = data[offset]
+        name = data[offset + 1:offset + 1 + name_len].decode('utf-8')
+        offset += 1 + name_len
+        k, n, heights = _SKETCH.unpack_from(data, offset)
+        offset += _SKETCH.size
+
+        sketch = KLLSketch(k)
+        sketch.n = n
+        sketch.compactors = []
+        for _ in range(heights):
+            (length,) = _COUNT.unpack_from(data, offset)
+            offset += _COUNT.size
+            items = array('d')
+            items.frombytes(data[offset:offset + length * items.itemsize])
+            offset += length * items.itemsize
+            sketch.compactors.append(items.tolist())
+        sketch.size = sum(len(c) for c in sketch.compactors)
+        sketch.max_size = sum(sketch._capacity(h) for h in range(len(sketch.compactors)))
+        sketches[name] = sketch
+    return sketches
@@ -68,29 +68,63 @@ class Renderer:
         }
     }
 
+    BOARD_AREA = (300, 600)  # screen space for the board, left of the UI panel
+    MIN_BLOCK_SIZE = 12  # boards too large for the area at this size scroll
+
     def __init__(self, screen: pygame.Surface, settings, block_size: int = 30):
         self.screen = screen
         self.settings = settings
+        self.default_block_size = block_size
         self.block_size = block_size
         self.board_offset = (50, 50)
+        # Cells drawn: first column, first row, columns, rows, set by follow()
+        self.viewport = (0, 0, Board.WIDTH, Board.HEIGHT)
 
         # Load theme from settings
         self.current_theme_name = self.settings.get('theme')
         self._apply_theme(self.current_theme_name)
 
-        # Initialize fonts
-        try:
-            self.font_title = pygame.font.Font(None, 60)
-            self.font_label = pygame.font.Font(None, 36)
-            self.font_value = pygame.font.Font(None, 48)
-        except:
-            self.font_title = pygame.font.SysFont('Arial', 60, bold=True)
-            self.font_label = pygame.font.SysFont('Arial', 30)
-            self.font_value = pygame.font.SysFont('Arial', 40, bold=True)
+        # Fonts are only needed in game, loaded on first use to keep startup short
+        self._fonts = None
 
         # Animation manager
         self.anim_manager = AnimationManager()
 
+    def _load_fonts(self):
+        """Load the in-game fonts."""
+        try:
+            self._fonts = {
+                'title': pygame.font.Font(None, 60),
+                'label': pygame.font.Font(None, 36),
+                'value': pygame.font.Font(None, 48),
+                'stats': pygame.font.Font(None, 32)
+            }
+        except:
+            self._fonts = {
+                'title': pygame.font.SysFont('Arial', 60, bold=True),
+                'label': pygame.font.SysFont('Arial', 30),
+                'value': pygame.font.SysFont('Arial', 40, bold=True),
+                'stats': pygame.font.SysFont('Arial', 28)
+            }
+
+    def _font(self, name):
+        """Get an in-game font, loading the set on first use."""
+        if self._fonts is None:
+            self._load_fonts()
+        return self._fonts[name]
+
+    @property
+    def font_title(self):
+        return self._font('title')
+
+    @property
+    def font_label(self):
+        return self._font('label')
+
+    @property
+    def font_value(self):
+        return self._font('value')
+
     def _apply_theme(self, theme_name):
         """Apply the selected theme colors."""
         theme = self.THEMES[theme_name]
@@ -131,31 +165,66 @@ class Renderer:
         mid_color = tuple(min(255, c + 30) for c in color)
         pygame.draw.rect(self.screen, mid_color, gloss_rect)
 
+    def follow(self, board: Board, piece: Optional[Piece] = None, ghost: Optional[Piece] = None):
+        """
+        Fit the board to the board area: blocks shrink down to
+        MIN_BLOCK_SIZE, past that the viewport shows the part of the board
+        around piece, with its landing spot (ghost) in view when they fit.
+        Boards that fit are drawn whole.
+        """
+        area_w, area_h = self.BOARD_AREA
+        self.block_size = max(self.MIN_BLOCK_SIZE,
+                              min(self.default_block_size, area_w // board.WIDTH, area_h // board.HEIGHT))
+        cols = min(board.WIDTH, area_w // self.block_size)
+        rows = min(board.HEIGHT, area_h // self.block_size)
+        x0 = y0 = 0
+        if piece is not None:
+            cells = piece.get_positions()
+            xs = [x for x, _ in cells]
+            ys = [y for _, y in cells]
+            x0 = (min(xs) + max(xs) + 1 - cols) // 2
+            # A row above the piece, two below where it lands, the piece wins
+            bottom = max(y for _, y in ghost.get_positions()) if ghost else max(ys)
+            y0 = min(min(ys) - 1, bottom + 3 - rows)
+        x0 = max(0, min(x0, board.WIDTH - cols))
+        y0 = max(0, min(y0, board.HEIGHT - rows))
+        self.viewport = (x0, y0, cols, rows)
+
+    def board_origin(self) -> tuple:
+        """Screen position of the board's first cell, off screen when scrolled."""
+        x0, y0, _, _ = self.viewport
+        return (self.board_offset[0] - x0 * self.block_size, self.board_offset[1] - y0 * self.block_size)
+
+    def board_rect(self) -> pygame.Rect:
+        """Screen area of the visible cells."""
+        _, _, cols, rows = self.viewport
+        return pygame.Rect(self.board_offset, (cols * self.block_size, rows * self.block_size))
+
     def draw_board(self, board: Board, shake_offset: tuple = (0, 0)):
-        """Draw the game board with grid and locked pieces."""
+        """Draw the game board with grid and locked pieces, the cells in the viewport."""
         offset_x, offset_y = shake_offset
+        x0, y0, cols, rows = self.viewport
 
-        board_rect = pygame.Rect(
-            self.board_offset[0] + offset_x,
-            self.board_offset[1] + offset_y,
-            board.WIDTH * self.block_size,
-            board.HEIGHT * self.block_size
-        )
+        board_rect = self.board_rect().move(offset_x, offset_y)
         pygame.draw.rect(self.screen, (20, 20, 35) if self.current_theme_name == 'NEON' else self.COLOR_PANEL, board_rect)
         pygame.draw.rect(self.screen, self.COLOR_TEXT, board_rect, 2)
 
-        for x in range(board.WIDTH):
-            start = (self.board_offset[0] + offset_x + x * self.block_size, self.board_offset[1] + offset_y)
-            end = (self.board_offset[0] + offset_x + x * self.block_size, self.board_offset[1] + offset_y + board.HEIGHT * self.block_size)
+        for x in range(cols):
+            start = (board_rect.x + x * self.block_size, board_rect.y)
+            end = (board_rect.x + x * self.block_size, board_rect.bottom)
             pygame.draw.line(self.screen, self.COLOR_GRID, start, end, 1)
 
-        for y in range(board.HEIGHT):
-            start = (self.board_offset[0] + offset_x, self.board_offset[1] + offset_y + y * self.block_size)
-            end = (self.board_offset[0] + offset_x + board.WIDTH * self.block_size, self.board_offset[1] + offset_y + y * self.block_size)
+        for y in range(rows):
+            start = (board_rect.x, board_rect.y + y * self.block_size)
+            end = (board_rect.right, board_rect.y + y * self.block_size)
             pygame.draw.line(self.screen, self.COLOR_GRID, start, end, 1)
 
-        for y, row in enumerate(board.grid):
-            for x, val in enumerate(row):
+        for y in range(y0, y0 + rows):
+            row = board.grid[y]
+            if 1 not in row:
+                continue
+            for x in range(x0, x0 + cols):
+                val = row[x]
                 if val:
                     color = board.colors[y][x]
                     # If color is missing or we want to enforce theme colors for retro
@@ -170,21 +239,24 @@ class Renderer:
                          elif not color:
                              color = (128, 128, 128)
 
-                    draw_x = self.board_offset[0] + offset_x + x * self.block_size
-                    draw_y = self.board_offset[1] + offset_y + y * self.block_size
+                    draw_x = board_rect.x + (x - x0) * self.block_size
+                    draw_y = board_rect.y + (y - y0) * self.block_size
                     self._draw_block(draw_x, draw_y, color)
 
     def draw_piece(self, piece: Piece, offset_x: int = 0, offset_y: int = 0, ghost: bool = False, shake_offset: tuple = (0, 0)):
         """Draw a piece."""
         color = self.PIECE_COLORS.get(piece.shape_type, piece.color)
         shake_x, shake_y = shake_offset
+        x0, y0, cols, rows = self.viewport
 
         for x, y in piece.get_positions():
-            draw_x = self.board_offset[0] + shake_x + (x + offset_x) * self.block_size
-            draw_y = self.board_offset[1] + shake_y + (y + offset_y) * self.block_size
-
-            if draw_y < self.board_offset[1] + shake_y:
+            x += offset_x - x0
+            y += offset_y - y0
+            # Cells above the board or outside the viewport
+            if not (0 <= x < cols and 0 <= y < rows):
                 continue
+            draw_x = self.board_offset[0] + shake_x + x * self.block_size
+            draw_y = self.board_offset[1] + shake_y + y * self.block_size
 
             self._draw_block(draw_x, draw_y, color, ghost=ghost)
 
@@ -220,6 +292,40 @@ class Renderer:
 
         self._draw_piece_preview(next_piece, panel_x + 100, 535, small=True)
 
+    def draw_opponent(self, remote, x: int, y: int, block_size: int = 15):
+        """Draw the versus opponent's board, score and state."""
+        label_surf = self.font_label.render("OPPONENT", True, self.COLOR_TEXT_WHITE)
+        self.screen.blit(label_surf, (x, y - 40))
+
+        board_rect = pygame.Rect(x, y, remote.width * block_size, remote.height * block_size)
+        pygame.draw.rect(self.screen, self.COLOR_PANEL, board_rect)
+        pygame.draw.rect(self.screen, self.COLOR_TEXT, board_rect, 2)
+
+        # Only cell occupancy is synced, stack cells share one color
+        stack_color = (128, 128, 128)
+        for row in range(remote.height):
+            if not remote.rows[row]:
+                continue
+            for col in range(remote.width):
+                if remote.is_filled(col, row):
+                    rect = pygame.Rect(x + col * block_size, y + row * block_size, block_size, block_size)
+                    pygame.draw.rect(self.screen, stack_color, rect)
+                    pygame.draw.rect(self.screen, self.COLOR_GRID, rect, 1)
+
+        if remote.piece:
+            color = self.PIECE_COLORS.get(remote.piece[0], stack_color)
+            for col, row in remote.piece_cells():
+                if 0 <= row < remote.height:
+                    rect = pygame.Rect(x + col * block_size, y + row * block_size, block_size, block_size)
+                    pygame.draw.rect(self.screen, color, rect)
+
+        score_surf = self.font_label.render(str(remote.score), True, self.COLOR_TEXT)
+        self.screen.blit(score_surf, (x, board_rect.bottom + 10))
+
+        if not remote.alive:
+            ko_surf = self.font_value.render("K.O.", True, self.COLOR_TEXT)
+            self.screen.blit(ko_surf, ko_surf.get_rect(center=board_rect.center))
+
     def _draw_piece_preview(self, piece: Piece, x: int, y: int, small: bool = False):
         """Helper method to draw a piece preview box."""
         box_size = 90 if small else 150
@@ -274,6 +380,13 @@ class Renderer:
         val_rect_text = val_surf.get_rect(center=val_rect.center)
         self.screen.blit(val_surf, val_rect_text)
 
+    def get_high_score_rank(self, scoring: Scoring) -> Optional[int]:
+        """Get the top 10 position of the current score, or None if not ranked."""
+        for i, entry in enumerate(scoring.scores_list):
+            if entry['score'] == scoring.score:
+                return i + 1
+        return None
+
     def draw_game_over(self, scoring: Scoring, game_time: float):
         """Draw game over overlay with statistics and high score feedback."""
         overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
@@ -284,13 +397,8 @@ class Renderer:
         y_pos = 100
 
         # Check if new high score
-        is_new_high_score = False
-        rank_position = None
-        for i, entry in enumerate(scoring.scores_list):
-            if entry['score'] == scoring.score:
-                is_new_high_score = True
-                rank_position = i + 1
-                break
+        rank_position = self.get_high_score_rank(scoring)
+        is_new_high_score = rank_position is not None
 
         # Game Over title
         go_surf = self.font_title.render("GAME OVER", True, self.COLOR_TEXT)
@@ -318,7 +426,7 @@ class Renderer:
             y_pos += 50
 
         # Game Statistics
-        stats_font = pygame.font.Font(None, 32)
+        stats_font = self._font('stats')
 
         # Format game time
         minutes = int(game_time // 60)
@@ -332,6 +440,10 @@ class Renderer:
             time_text
         ]
 
+        percentile = scoring.get_percentile(scoring.score)
+        if percentile is not None:
+            stats.append(f"Better than {percentile:.0f}% of games")
+
         for stat in stats:
             stat_surf = stats_font.render(stat, True, self.COLOR_TEXT_WHITE)
             stat_rect = stat_surf.get_rect(center=(center_x, y_pos))
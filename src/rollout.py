@@ -0,0 +1,300 @@
+"""
+Rollout module for Tetrix.
+Monte Carlo placement decisions: every candidate placement is scored by
+playing many short random or greedy futures on copies of the board.
+
+Rollouts run on a bitboard, one int per row with bit x set for a filled
+column, so copying a board is copying a short list of ints and a drop, a
+lock or a line clear are a few integer operations per row. The budget is
+a number of rollouts or a time limit per move, and the rollouts of a move
+can be spread over worker processes.
+
+    python -m src.rollout --games 5 --ms 50 --workers 4
+"""
+
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .autoplay import DEFAULT_WEIGHTS, SHAPES, HeuristicBot, placements
+from .board import Board
+from .piece import Piece
+from .rotation import RotationSystem
+
+TOP_OUT = -10.0  # value of a rollout that tops out, in lines
+
+_tables: Dict[int, Dict[str, list]] = {}
+
+
+def piece_masks(shape: str, rotation: int, x: int) -> Tuple[Tuple[int, int], ...]:
+    """The rows of a piece at column x as (row offset, bit mask) pairs, top first."""
+    piece = Piece(shape)
+    for _ in range(rotation):
+        piece.rotate()
+    rows = {}
+    for y, row in enumerate(piece.shape):
+        for cx, filled in enumerate(row):
+            if filled:
+                rows[y] = rows.get(y, 0) | 1 << (x + cx)
+    return tuple(sorted(rows.items()))
+
+
+def placement_table(width: int) -> Dict[str, list]:
+    """
+    For every shape, each distinct (rotation, x) on an open board of this
+    width with its piece_masks().
+    """
+    table = _tables.get(width)
+    if table is not None:
+        return table
+    table = {}
+    for shape in SHAPES:
+        entries = []
+        seen = set()
+        for rotation in range(4):
+            cells = Piece(shape)
+            for _ in range(rotation):
+                cells.rotate()
+            columns = [x for row in cells.shape for x, filled in enumerate(row) if filled]
+            for x in range(-min(columns), width - max(columns)):
+                masks = piece_masks(shape, rotation, x)
+                top = masks[0][0]
+                key = tuple((cy - top, mask) for cy, mask in masks)
+                if key not in seen:
+                    seen.add(key)
+                    entries.append((rotation, x, masks))
+        table[shape] = entries
+    _tables[width] = table
+    return table
+
+
+def board_rows(board: Board) -> List[int]:
+    """The board as one bit mask per row, top row first."""
+    return [sum(1 << x for x, filled in enumerate(row) if filled) for row in board.grid]
+
+
+def drop(rows: List[int], masks: Sequence[Tuple[int, int]]) -> Optional[int]:
+    """Landing offset of a piece dropped from the top, None if it doesn't fit there."""
+    height = len(rows)
+
+    def fits(y):
+        for cy, mask in masks:
+            row = y + cy
+            if row >= height or (row >= 0 and rows[row] & mask):
+                return False
+        return True
+
+    if not fits(0):
+        return None
+    y = 0
+    while fits(y + 1):
+        y += 1
+    return y
+
+
+def lock(rows: List[int], masks: Sequence[Tuple[int, int]], y: int, full: int) -> Tuple[List[int], int]:
+    """A copy of rows with the piece locked at y and full rows cleared, and the lines cleared."""
+    rows = rows[:]
+    for cy, mask in masks:
+        if y + cy >= 0:
+            rows[y + cy] |= mask
+    kept = [row for row in rows if row != full]
+    cleared = len(rows) - len(kept)
+    if cleared:
+        kept[:0] = [0] * cleared
+    return kept, cleared
+
+
+def features(rows: List[int], width: int, cleared: int) -> Dict[str, int]:
+    """The HeuristicBot features of a bitboard, after a lock that cleared lines."""
+    height = len(rows)
+    heights = [0] * width
+    seen = 0
+    holes = 0
+    for y, row in enumerate(rows):
+        new = row & ~seen
+        while new:
+            bit = new & -new
+            heights[bit.bit_length() - 1] = height - y
+            new ^= bit
+        holes += (seen & ~row).bit_count()
+        seen |= row
+
+    wells = 0
+    for x, h in enumerate(heights):
+        left = heights[x - 1] if x > 0 else height
+        right = heights[x + 1] if x < width - 1 else height
+        if left > h and right > h:
+            wells += min(left, right) - h
+    return {
+        'height': sum(heights),
+        'lines': cleared,
+        'holes': holes,
+        'bumpiness': sum(abs(a - b) for a, b in zip(heights, heights[1:])),
+        'wells': wells,
+    }
+
+
+def _step(rows, width, full, shape, policy, weights, rng):
+    """Place one piece by the rollout policy, None on top out."""
+    best = None
+    best_value = None
+    entries = placement_table(width)[shape]
+    if policy == 'random':
+        entries = rng.sample(entries, len(entries))
+    for _, _, masks in entries:
+        y = drop(rows, masks)
+        if y is None:
+            continue
+        after, cleared = lock(rows, masks, y, full)
+        if policy == 'random':
+            return after, cleared
+        value = sum(weights[name] * v for name, v in features(after, width, cleared).items())
+        if best_value is None or value > best_value:
+            best, best_value = (after, cleared), value
+    return best
+
+
+def rollout_values(rows: List[int], width: int, candidates: List[Tuple[int, int]], shape: str,
+                   next_shape: Optional[str], rollouts: int = 0, deadline: float = 0.0,
+                   depth: int = 8, policy: str = 'greedy', weights: Optional[Dict[str, float]] = None,
+                   seed: int = 0) -> List[Tuple[float, int]]:
+    """
+    Total value and rollout count of each candidate placement of shape.
+    Runs rollouts per candidate, or round robin until the deadline
+    (a time.time() value), at least one each.
+    """
+    weights = weights or DEFAULT_WEIGHTS
+    rng = random.Random(seed)
+    full = (1 << width) - 1
+
+    # The candidate's own lock is the same in every rollout
+    roots = []
+    for rotation, x in candidates:
+        masks = piece_masks(shape, rotation, x)
+        y = drop(rows, masks)
+        roots.append(lock(rows, masks, y, full) if y is not None else None)
+
+    totals = [0.0] * len(candidates)
+    counts = [0] * len(candidates)
+    done = 0
+    while True:
+        for i, root in enumerate(roots):
+            if root is None:
+                totals[i], counts[i] = TOP_OUT, 1
+                continue
+            board, value = root
+            for step in range(depth):
+                piece = next_shape if step == 0 and next_shape else rng.choice(SHAPES)
+                placed = _step(board, width, full, piece, policy, weights, rng)
+                if placed is None:
+                    value += TOP_OUT
+                    break
+                board, cleared = placed
+                value += cleared
+            totals[i] += value
+            counts[i] += 1
+        done += 1
+        if (deadline and time.time() >= deadline) or (not deadline and done >= rollouts):
+            return list(zip(totals, counts))
+
+
+class MonteCarloBot:
+    """
+    Chooses the placement whose rollouts clear the most lines on average.
+
+    Only the best `candidates` placements by the heuristic are rolled out,
+    so the budget goes to the choices worth comparing. Give either
+    rollouts (per candidate) or ms (per move); workers > 1 spreads the
+    rollouts of each move over that many processes.
+    """
+
+    def __init__(self, rollouts: int = 16, ms: Optional[float] = None, depth: int = 4,
+                 policy: str = 'greedy', candidates: int = 6, workers: int = 1,
+                 weights: Optional[Dict[str, float]] = None, seed: int = 0):
+        if policy not in ('greedy', 'random'):
+            raise ValueError("Rollout policy must be 'greedy' or 'random'")
+        self.rollouts = rollouts
+        self.ms = ms
+        self.depth = depth
+        self.policy = policy
+        self.candidates = candidates
+        self.workers = workers
+        self.heuristic = HeuristicBot(weights)
+        self.rng = random.Random(seed)
+        self._pool = None
+        if workers > 1:
+            self._pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+
+    def choose(self, board: Board, piece: Piece, next_piece: Optional[Piece] = None,
+               system: Optional[RotationSystem] = None) -> Optional[Tuple[int, int]]:
+        # This move must be reachable with the game's system, the futures try every landing
+        options = placements(board, piece, system)
+        if not options:
+            return None
+        options.sort(key=lambda p: self.heuristic.score(board, piece, *p), reverse=True)
+        options = options[:self.candidates]
+        if len(options) == 1:
+            return options[0]
+
+        deadline = time.time() + self.ms / 1000 if self.ms else 0.0
+        args = (board_rows(board), board.WIDTH, options, piece.shape_type,
+                next_piece.shape_type if next_piece else None)
+        options_kw = {'depth': self.depth, 'policy': self.policy, 'weights': self.heuristic.weights}
+        if self._pool:
+            # Each worker runs its share with its own seed, the totals add up
+            share = max(1, -(-self.rollouts // self.workers))
+            futures = [
+                self._pool.submit(rollout_values, *args, rollouts=share, deadline=deadline,
+                                  seed=self.rng.randrange(2 ** 31), **options_kw)
+                for _ in range(self.workers)
+            ]
+            results = [future.result() for future in futures]
+            values = [sum(t for t, _ in r) / sum(n for _, n in r) for r in zip(*results)]
+        else:
+            results = rollout_values(*args, rollouts=self.rollouts, deadline=deadline,
+                                     seed=self.rng.randrange(2 ** 31), **options_kw)
+            values = [total / count for total, count in results]
+
+        # Ties keep the heuristic's order
+        best = max(range(len(options)), key=lambda i: (values[i], -i))
+        return options[best]
+
+    def close(self):
+        if self._pool:
+            self._pool.shutdown()
+            self._pool = None
+
+
+def main():
+    import argparse
+    from .autoplay import Simulation
+
+    parser = argparse.ArgumentParser(description='Play seeded games with Monte Carlo placement decisions')
+    parser.add_argument('--games', type=int, default=3)
+    parser.add_argument('--max-pieces', type=int, default=200)
+    parser.add_argument('--rollouts', type=int, default=16, help='rollouts per candidate placement')
+    parser.add_argument('--ms', type=float, help='time budget per move instead of a rollout count')
+    parser.add_argument('--depth', type=int, default=4, help='pieces played per rollout')
+    parser.add_argument('--policy', choices=('greedy', 'random'), default='greedy')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    bot = MonteCarloBot(args.rollouts, args.ms, args.depth, args.policy,
+                        workers=args.workers, seed=args.seed)
+    try:
+        for seed in range(args.seed, args.seed + args.games):
+            start = time.perf_counter()
+            game = Simulation(seed).play(bot, args.max_pieces)
+            elapsed = time.perf_counter() - start
+            print(f"seed {seed}: {game.pieces} pieces, {game.scoring.lines_cleared} lines, "
+                  f"score {game.scoring.score}, {elapsed / max(game.pieces, 1) * 1000:.1f} ms/move", flush=True)
+    finally:
+        bot.close()
+
+if __name__ == '__main__':
+    main()
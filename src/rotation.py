@@ -0,0 +1,178 @@
+"""
+Rotation module for Tetrix.
+Rotation systems as data: for every piece, rotation state and direction,
+the position offsets to try, in order, until the rotated piece fits.
+
+Pieces keep the 4x4 matrix states of Piece.rotate(), the states that
+snapshots, spectating and versus exchange. A system whose pieces turn
+around another center (SRS, ARS) has the difference folded into its
+offsets when its tables are built, so trying a rotation is a table lookup
+and a Board.fits() per offset, and the piece is only touched once one
+fits.
+
+    simple  turn in the matrix, else one cell left, else one cell right
+    srs     Super Rotation System, the guideline kicks
+    ars     ARS-like: pieces stay on the bottom of their box, I, S and Z
+            have two states, kicks one cell right, then left, I never kicks
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .board import Board
+from .piece import Piece
+
+Cells = Tuple[Tuple[int, int], ...]
+
+# SRS kicks by (from, to) state, 0 = spawn, 1 = R, 2 = 2, 3 = L, y up as published
+SRS_KICKS = {
+    (0, 1): [(0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2)],
+    (1, 0): [(0, 0), (1, 0), (1, -1), (0, 2), (1, 2)],
+    (1, 2): [(0, 0), (1, 0), (1, -1), (0, 2), (1, 2)],
+    (2, 1): [(0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2)],
+    (2, 3): [(0, 0), (1, 0), (1, 1), (0, -2), (1, -2)],
+    (3, 2): [(0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)],
+    (3, 0): [(0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)],
+    (0, 3): [(0, 0), (1, 0), (1, 1), (0, -2), (1, -2)],
+}
+SRS_I_KICKS = {
+    (0, 1): [(0, 0), (-2, 0), (1, 0), (-2, -1), (1, 2)],
+    (1, 0): [(0, 0), (2, 0), (-1, 0), (2, 1), (-1, -2)],
+    (1, 2): [(0, 0), (-1, 0), (2, 0), (-1, 2), (2, -1)],
+    (2, 1): [(0, 0), (1, 0), (-2, 0), (1, -2), (-2, 1)],
+    (2, 3): [(0, 0), (2, 0), (-1, 0), (2, 1), (-1, -2)],
+    (3, 2): [(0, 0), (-2, 0), (1, 0), (-2, -1), (1, 2)],
+    (3, 0): [(0, 0), (1, 0), (-2, 0), (1, -2), (-2, 1)],
+    (0, 3): [(0, 0), (-1, 0), (2, 0), (-1, 2), (2, -1)],
+}
+
+
+def _turn(cells: Sequence[Tuple[int, int]], size: int, turns: int) -> Cells:
+    """Cells turned clockwise inside a size x size box."""
+    for _ in range(turns % 4):
+        cells = [(size - 1 - y, x) for x, y in cells]
+    return tuple(sorted(cells))
+
+
+def _on_bottom(cells: Sequence[Tuple[int, int]], size: int) -> Cells:
+    """Cells moved down to rest on the bottom of their box."""
+    dy = size - 1 - max(y for _, y in cells)
+    return tuple(sorted((x, y + dy) for x, y in cells))
+
+
+def _matrix_states(shape: str) -> List[Tuple[tuple, Cells]]:
+    """The four Piece.rotate() matrices of a shape, with their cells."""
+    piece = Piece(shape)
+    states = []
+    for _ in range(4):
+        matrix = tuple(tuple(row) for row in piece.shape)
+        cells = tuple(sorted((x, y) for y, row in enumerate(matrix) for x, filled in enumerate(row) if filled))
+        states.append((matrix, cells))
+        piece.rotate()
+    return states
+
+
+def _srs_cells(shape: str, spawn: Cells, state: int) -> Cells:
+    if shape == 'O':
+        return spawn
+    return _turn(spawn, 4 if shape == 'I' else 3, state)
+
+
+def _ars_cells(shape: str, spawn: Cells, state: int) -> Cells:
+    if shape == 'O':
+        return spawn
+    if shape == 'I':
+        return _turn(spawn, 4, state % 2)
+    if shape in 'SZ':
+        state %= 2
+    return _on_bottom(_turn(spawn, 3, state), 3)
+
+
+def _srs_kicks(shape: str, start: int, end: int) -> List[Tuple[int, int]]:
+    if shape == 'O':
+        return [(0, 0)]
+    table = SRS_I_KICKS if shape == 'I' else SRS_KICKS
+    return [(dx, -dy) for dx, dy in table[start, end]]
+
+
+def _ars_kicks(shape: str, start: int, end: int) -> List[Tuple[int, int]]:
+    if shape in 'IO':
+        return [(0, 0)]
+    return [(0, 0), (1, 0), (-1, 0)]
+
+
+class RotationSystem:
+    """
+    Precomputed rotations of every piece. state_cells(shape, spawn, state)
+    places each state in the system's own box, kicks(shape, start, end)
+    lists the offsets to try for a turn; None for either keeps
+    Piece.rotate()'s.
+    """
+
+    def __init__(self, name: str, state_cells=None, kicks=None):
+        self.name = name
+        # (shape, state, direction) -> (new state, matrix, cells, offsets)
+        self.table: Dict[Tuple[str, int, int], tuple] = {}
+        self._cells: Dict[Tuple[str, int], Cells] = {}
+        for shape in Piece.SHAPES:
+            states = _matrix_states(shape)
+            spawn = states[0][1]
+            # How far the system's state sits from the matrix state
+            shifts = []
+            for state, (_, matrix_cells) in enumerate(states):
+                self._cells[shape, state] = matrix_cells
+                target = state_cells(shape, spawn, state) if state_cells else matrix_cells
+                shift = (target[0][0] - matrix_cells[0][0], target[0][1] - matrix_cells[0][1])
+                if tuple((x + shift[0], y + shift[1]) for x, y in matrix_cells) != target:
+                    raise ValueError(f"{name}: state {state} of {shape} is not a turn of its spawn state")
+                shifts.append(shift)
+
+            for state in range(4):
+                for direction in (1, -1):
+                    end = (state + direction) % 4
+                    base = kicks(shape, state, end) if kicks else [(0, 0), (-1, 0), (1, 0)]
+                    sx, sy = shifts[end][0] - shifts[state][0], shifts[end][1] - shifts[state][1]
+                    offsets = tuple((dx + sx, dy + sy) for dx, dy in base)
+                    self.table[shape, state, direction] = (end, states[end][0], states[end][1], offsets)
+
+    def cells(self, shape: str, state: int) -> Cells:
+        """The cells of a state, as offsets from the piece position."""
+        return self._cells[shape, state]
+
+    def try_rotate(self, board: Board, shape: str, state: int, x: int, y: int,
+                   direction: int = 1) -> Optional[Tuple[int, int, int]]:
+        """The (state, x, y) a turn ends in, None if no offset fits. Nothing is modified."""
+        end, _, cells, offsets = self.table[shape, state, direction]
+        for dx, dy in offsets:
+            if board.fits(cells, x + dx, y + dy):
+                return end, x + dx, y + dy
+        return None
+
+    def rotate(self, board: Board, piece: Piece, direction: int = 1) -> bool:
+        """Turn piece clockwise (1) or counterclockwise (-1) if it fits somewhere."""
+        end, matrix, cells, offsets = self.table[piece.shape_type, piece.rotation, direction]
+        x, y = piece.position
+        for dx, dy in offsets:
+            if board.fits(cells, x + dx, y + dy):
+                # Matrices are shared between pieces, tuples so none is changed in place
+                piece.shape = matrix
+                piece.rotation = end
+                piece.position = [x + dx, y + dy]
+                return True
+        return False
+
+
+SYSTEMS = {
+    'simple': RotationSystem('simple'),
+    'srs': RotationSystem('srs', _srs_cells, _srs_kicks),
+    'ars': RotationSystem('ars', _ars_cells, _ars_kicks),
+}
+DEFAULT = 'simple'
+
+
+def get_system(name: Optional[str]) -> RotationSystem:
+    """The rotation system called name, the default one for an unknown name."""
+    system = SYSTEMS.get(name or DEFAULT)
+    if system is None:
+        print(f"Error: unknown rotation system {name!r}, using {DEFAULT}")
+        system = SYSTEMS[DEFAULT]
+    return system
@@ -0,0 +1,171 @@
+"""
+Score database module for Tetrix.
+Stores every finished game in a local SQLite database.
+"""
+
+import os
+import json
+import sqlite3
+from datetime import datetime
+from typing import List, Optional
+
+class ScoreDatabase:
+    """
+    Append-only history of finished games with indexed leaderboard queries.
+    """
+
+    DB_FILE = os.path.join('data', 'scores.db')
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS games (
+            id INTEGER PRIMARY KEY,
+            score INTEGER NOT NULL,
+            level INTEGER NOT NULL,
+            lines INTEGER NOT NULL,
+            duration REAL NOT NULL,
+            seed INTEGER,
+            played_at TEXT NOT NULL,
+            day TEXT NOT NULL,
+            source TEXT,
+            submission TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_games_score ON games (score DESC);
+        CREATE INDEX IF NOT EXISTS idx_games_level_score ON games (level, score DESC);
+        CREATE INDEX IF NOT EXISTS idx_games_day_score ON games (day, score DESC);
+    """
+
+    def __init__(self, path: str = DB_FILE):
+        self.path = path
+        if path != ':memory:':
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL turns each insert into a cheap append to the log
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self._migrate()
+        self.conn.commit()
+
+    def _migrate(self):
+        """Add columns missing from databases created by older versions."""
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(games)")}
+        if 'source' not in columns:
+            self.conn.execute("ALTER TABLE games ADD COLUMN source TEXT")
+        if 'submission' not in columns:
+            self.conn.execute("ALTER TABLE games ADD COLUMN submission TEXT")
+
+    def add_game(self, score: int, level: int, lines: int, duration: float = 0.0,
+                 seed: Optional[int] = None, played_at: Optional[datetime] = None) -> dict:
+        """Record a finished game and return it as a leaderboard entry."""
+        played_at = played_at or datetime.now()
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO games (score, level, lines, duration, seed, played_at, day) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (score, level, lines, duration, seed,
+                 played_at.strftime("%Y-%m-%d %H:%M:%S"), played_at.strftime("%Y-%m-%d"))
+            )
+        return self.make_entry(score, level, lines, duration, played_at)
+
+    def add_games(self, games: List[tuple]):
+        """
+        Record many games in one transaction. Each game is
+        (score, level, lines, duration, seed, played_at, source, submission),
+        submission being the id a client sent the game with, or None.
+        """
+        rows = [
+            (score, level, lines, duration, seed,
+             played_at.strftime("%Y-%m-%d %H:%M:%S"), played_at.strftime("%Y-%m-%d"), source, submission)
+            for score, level, lines, duration, seed, played_at, source, submission in games
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO games (score, level, lines, duration, seed, played_at, day, source, submission) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def submission_ids(self) -> List[str]:
+        """Ids of every game submitted with one."""
+        return [row[0] for row in self.conn.execute(
+            "SELECT submission FROM games WHERE submission IS NOT NULL")]
+
+    def iter_games(self):
+        """Iterate (score, level, lines, played_at, source) of every game, best first."""
+        for score, level, lines, played_at, source in self.conn.execute(
+                "SELECT score, level, lines, played_at, source FROM games ORDER BY score DESC"):
+            yield score, level, lines, datetime.strptime(played_at, "%Y-%m-%d %H:%M:%S"), source
+
+    def iter_totals(self):
+        """Iterate (score, lines, duration) of every game, in insertion order."""
+        yield from self.conn.execute("SELECT score, lines, duration FROM games ORDER BY id")
+
+    @staticmethod
+    def make_entry(score, level, lines, duration, played_at: datetime) -> dict:
+        """Build the entry format used by Scoring.scores_list."""
+        return {
+            'score': score,
+            'level': level,
+            'lines': lines,
+            'duration': duration,
+            'date': played_at.strftime("%Y-%m-%d %H:%M")
+        }
+
+    def top(self, n: int = 10, level: Optional[int] = None, day: Optional[str] = None) -> List[dict]:
+        """Get the n best games overall, for one level, or for one day (YYYY-MM-DD)."""
+        query = "SELECT score, level, lines, duration, played_at FROM games"
+        params = []
+        if level is not None:
+            query += " WHERE level = ?"
+            params.append(level)
+        elif day is not None:
+            query += " WHERE day = ?"
+            params.append(day)
+        query += " ORDER BY score DESC LIMIT ?"
+        params.append(n)
+        return [
+            self.make_entry(score, level, lines, duration, datetime.strptime(played_at, "%Y-%m-%d %H:%M:%S"))
+            for score, level, lines, duration, played_at in self.conn.execute(query, params)
+        ]
+
+    def count(self) -> int:
+        """Get the number of recorded games."""
+        return self.conn.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    def import_legacy_json(self, path: str) -> int:
+        """Import a legacy high_scores.json top list into an empty database."""
+        if self.count() > 0 or not os.path.exists(path):
+            return 0
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError, OSError) as e:
+            print(f"Error reading legacy high scores: {e}")
+            return 0
+
+        # Support both old format (dict) and list format
+        if isinstance(data, dict):
+            data = [{'score': data.get('top_score', 0)}]
+
+        rows = []
+        for entry in data:
+            try:
+                played_at = datetime.strptime(entry.get('date', ''), "%Y-%m-%d %H:%M")
+            except ValueError:
+                played_at = datetime.fromtimestamp(0)
+            rows.append((entry.get('score', 0), entry.get('level', 1), 0, 0.0, None,
+                         played_at.strftime("%Y-%m-%d %H:%M:%S"), played_at.strftime("%Y-%m-%d")))
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO games (score, level, lines, duration, seed, played_at, day) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
@@ -4,8 +4,13 @@ Handles score calculation, level progression, and high score persistence.
 """
 
 import os
-import json
+import time
+import struct
 from datetime import datetime
+from typing import Optional
+from .score_db import ScoreDatabase
+from .quantiles import KLLSketch, dump_sketches, load_sketches
+from .persistence import write_bytes_atomic
 
 class Scoring:
     """
@@ -23,14 +28,28 @@ class Scoring:
     # Lines needed to advance to next level
     LINES_PER_LEVEL = 10
     
-    HIGH_SCORE_FILE = os.path.join('data', 'high_scores.json')
+    HIGH_SCORE_FILE = os.path.join('data', 'high_scores.json')  # Legacy top 10, imported once
+    TOP_SCORES = 10
 
-    def __init__(self):
+    # Quantile sketches of every game ever recorded
+    SKETCH_FILE = os.path.join('data', 'score_sketches.bin')
+    SKETCHED = ('score', 'lines', 'duration')
+
+    def __init__(self, db: ScoreDatabase = None, persistence=None, sketch_file: Optional[str] = SKETCH_FILE):
         self.score = 0
         self.level = 1
         self.lines_cleared = 0
+        self.seed = None  # Seed of the piece generator, recorded with the game
+        self.start_time = time.time()
+        self._saved = False  # Current game already recorded
+        self.db = db if db is not None else ScoreDatabase()
+        self.persistence = persistence  # Optional PersistenceService for the inserts
+        self.leaderboard = None  # Optional LeaderboardClient, set by Game
         self.scores_list = self._load_scores()
+        self.scores_version = 0  # Bumped whenever scores_list changes
         self.high_score = self.scores_list[0]['score'] if self.scores_list else 0
+        self.sketch_file = sketch_file
+        self.sketches = self._load_sketches()
         self.combo = 0  # Track consecutive line clears
         self.last_level = 1  # Track level changes
 
@@ -99,7 +118,7 @@ class Scoring:
         # Speed increases with level, minimum 0.1 seconds
         return max(1.0 - (self.level - 1) * 0.05, 0.1)
 
-    def reset(self):
+    def reset(self, seed: int = None):
         """Reset scoring for a new game."""
         self.save_high_score() # Save current score to list before reset
         self.score = 0
@@ -107,53 +126,90 @@ class Scoring:
         self.lines_cleared = 0
         self.combo = 0
         self.last_level = 1
-        self.scores_list = self._load_scores()
+        self.seed = seed
+        self.start_time = time.time()
+        self._saved = False
+        # scores_list is kept up to date by save_high_score, no reload needed
         self.high_score = self.scores_list[0]['score'] if self.scores_list else 0
 
     def _load_scores(self) -> list:
-        """Load the top scores list from disk."""
-        # Ensure data directory exists
-        if not os.path.exists('data'):
-            os.makedirs('data')
+        """Query the top scores list from the database."""
+        self.db.import_legacy_json(self.HIGH_SCORE_FILE)
+        return self.db.top(self.TOP_SCORES)
 
-        if os.path.exists(self.HIGH_SCORE_FILE):
+    def _load_sketches(self) -> dict:
+        """Load the quantile sketches, rebuilding them from the history if missing."""
+        if self.sketch_file and os.path.exists(self.sketch_file):
             try:
-                with open(self.HIGH_SCORE_FILE, 'r') as f:
-                    data = json.load(f)
-                    # Support both old format (dict) and new format (list)
-                    if isinstance(data, dict):
-                        return [{'score': data.get('top_score', 0), 'date': 'Legacy'}]
-                    return data
-            except json.JSONDecodeError as e:
-                print(f"Error decoding high scores JSON: {e}")
-                return []
-            except (IOError, OSError) as e:
-                print(f"Error reading high scores file: {e}")
-                return []
-        return []
-
-    def save_high_score(self):
-        """Save the current score to the top scores list on disk."""
-        if self.score <= 0:
+                with open(self.sketch_file, 'rb') as f:
+                    sketches = load_sketches(f.read())
+                if all(name in sketches for name in self.SKETCHED):
+                    return sketches
+            except (OSError, ValueError, struct.error) as e:
+                print(f"Error loading score sketches: {e}")
+
+        # One pass over the history, only when the sketch file is missing
+        sketches = {name: KLLSketch() for name in self.SKETCHED}
+        for game in self.db.iter_totals():
+            for name, value in zip(self.SKETCHED, game):
+                sketches[name].update(value)
+        if sketches['score'].n:
+            self._write_sketches(dump_sketches(sketches))
+        return sketches
+
+    def _write_sketches(self, data: bytes):
+        """Write serialized sketches atomically, unless they are kept in memory only."""
+        if not self.sketch_file:
             return
+        try:
+            write_bytes_atomic(self.sketch_file, data)
+        except Exception as e:
+            print(f"Error saving score sketches: {e}")
 
-        if not os.path.exists('data'):
-            os.makedirs('data')
-            
-        # Add current score
-        new_entry = {
-            'score': self.score,
-            'date': datetime.now().strftime("%Y-%m-%d %H:%M"),
-            'level': self.level
-        }
-        
-        self.scores_list.append(new_entry)
-        # Sort by score descending and keep top 10
-        self.scores_list.sort(key=lambda x: x['score'], reverse=True)
-        self.scores_list = self.scores_list[:10]
-        
+    def get_percentile(self, score: int) -> Optional[float]:
+        """Percentage of recorded games with a lower score, None before any game."""
+        fraction = self.sketches['score'].fraction_below(score)
+        return None if fraction is None else fraction * 100
+
+    def _write_game(self, game):
+        """Insert a finished game into the database."""
         try:
-            with open(self.HIGH_SCORE_FILE, 'w') as f:
-                json.dump(self.scores_list, f)
+            self.db.add_game(*game)
         except Exception as e:
-            print(f"Error saving high scores: {e}")
\ No newline at end of file
+            print(f"Error saving high scores: {e}")
+
+    def save_high_score(self):
+        """Record the current game in the score history, once per game."""
+        if self.score <= 0 or self._saved:
+            return
+        self._saved = True
+
+        played_at = datetime.now()
+        duration = time.time() - self.start_time
+        game = (self.score, self.level, self.lines_cleared, duration, self.seed, played_at)
+        if self.persistence:
+            self.persistence.submit(self._write_game, game)
+        else:
+            self._write_game(game)
+
+        new_entry = ScoreDatabase.make_entry(
+            self.score, self.level, self.lines_cleared, duration, played_at
+        )
+        if self.leaderboard:
+            self.leaderboard.submit(new_entry)
+
+        for name, value in zip(self.SKETCHED, (self.score, self.lines_cleared, duration)):
+            self.sketches[name].update(value)
+        data = dump_sketches(self.sketches)
+        if self.persistence:
+            self.persistence.schedule('sketches', self._write_sketches, data)
+        else:
+            self._write_sketches(data)
+
+        # Update the cached top list in place of re-querying
+        if len(self.scores_list) < self.TOP_SCORES or self.score > self.scores_list[-1]['score']:
+            self.scores_list.append(new_entry)
+            # Sort by score descending and keep top 10
+            self.scores_list.sort(key=lambda x: x['score'], reverse=True)
+            self.scores_list = self.scores_list[:self.TOP_SCORES]
+            self.scores_version += 1
@@ -5,6 +5,7 @@ Handles persistence of game configuration (themes, audio, etc).
 
 import os
 import json
+from .persistence import write_json_atomic
 
 class Settings:
     """
@@ -16,10 +17,18 @@ class Settings:
     DEFAULTS = {
         'theme': 'NEON',
         'sound_volume': 1.0,
-        'music_volume': 0.5
+        'music_volume': 0.5,
+        'key_bindings': {},  # action name -> list of pygame key names
+        'rotation_system': 'simple',  # simple, srs or ars, see rotation.py
+        'leaderboard_host': None,  # shared leaderboard server, disabled when None
+        'leaderboard_port': 8765,
+        'kiosk_name': None,
+        'telemetry': True  # gameplay event log under data/telemetry
     }
 
-    def __init__(self):
+    def __init__(self, persistence=None):
+        # Optional PersistenceService, saves are synchronous without one
+        self.persistence = persistence
         self.config = self._load_settings()
 
     def _load_settings(self):
@@ -37,13 +46,18 @@ class Settings:
         return self.DEFAULTS.copy()
 
     def save_settings(self):
-        """Save current settings to disk."""
-        if not os.path.exists('data'):
-            os.makedirs('data')
-            
+        """Save current settings to disk, in the background when possible."""
+        snapshot = dict(self.config)
+        if self.persistence:
+            # Coalesces bursts like theme preview steps into one write
+            self.persistence.schedule('settings', self._write_settings, snapshot)
+        else:
+            self._write_settings(snapshot)
+
+    def _write_settings(self, config):
+        """Write a settings snapshot atomically."""
         try:
-            with open(self.SETTINGS_FILE, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            write_json_atomic(self.SETTINGS_FILE, config, indent=4)
         except Exception as e:
             print(f"Error saving settings: {e}")
 
@@ -0,0 +1,183 @@
+"""
+Snapshot module for Tetrix.
+Compact binary snapshots of an in-progress game, used to resume it on the
+next launch. A snapshot holds everything needed to continue the game
+deterministically, so it can also serve as a replay keyframe.
+"""
+
+import os
+import random
+import struct
+import time
+from array import array
+
+from .board import Board
+from .piece import Piece
+from .persistence import write_bytes_atomic
+
+SNAPSHOT_FILE = os.path.join('data', 'snapshot.bin')
+
+MAGIC = b'TXSV'
+VERSION = 2
+
+PIECE_TYPES = list(Piece.SHAPES)
+NO_PIECE = 255
+
+# Layout (little endian), every field fixed size except the board cells:
+#   header: magic, u16 version, u16 board width, u16 board height (u8 in v1)
+#   state:  current piece type, rotation, x, y; next piece type; held piece
+#           type (255 = none); can_hold; pending line clear;
+#           score, level, lines, combo, last level, seed;
+#           game time (s), scoring duration (s), drop timer (ms)
+#   rng:    u32 version, 625 x u32 Mersenne Twister state, u8 has gauss, f64 gauss
+#   board:  width * height u8 cells, 0 = empty, 1 + piece type, or garbage
+_HEADER = struct.Struct('<4sHHH')
+_HEADERS = {1: struct.Struct('<4sHBB'), VERSION: _HEADER}  # every version restore_game reads
+_STATE = struct.Struct('<BBhhBBBB QHIHHq ddd')
+_RNG = struct.Struct('<I')
+_RNG_STATE_WORDS = 625
+_GAUSS = struct.Struct('<Bd')
+
+SNAPSHOT_SIZE_FIXED = _HEADER.size + _STATE.size + _RNG.size + _RNG_STATE_WORDS * 4 + _GAUSS.size
+
+COLOR_CODES = {color: PIECE_TYPES.index(shape) + 1 for shape, color in Piece.COLORS.items()}
+GARBAGE_CODE = len(PIECE_TYPES) + 1
+COLOR_CODES[Board.GARBAGE_COLOR] = GARBAGE_CODE
+CODE_COLORS = {code: color for color, code in COLOR_CODES.items()}
+
+
+def dump_game(game) -> bytes:
+    """Encode the in-progress game of a Game."""
+    piece = game.current_piece
+    scoring = game.scoring
+    board = game.board
+
+    parts = [
+        _HEADER.pack(MAGIC, VERSION, board.WIDTH, board.HEIGHT),
+        _STATE.pack(
+            PIECE_TYPES.index(piece.shape_type), piece.rotation, piece.position[0], piece.position[1],
+            PIECE_TYPES.index(game.next_piece.shape_type),
+            PIECE_TYPES.index(game.held_piece) if game.held_piece else NO_PIECE,
+            game.can_hold, game._pending_clear,
+            scoring.score, scoring.level, scoring.lines_cleared, scoring.combo, scoring.last_level,
+            game.seed,
+            game.game_time, time.time() - scoring.start_time, game.drop_timer
+        )
+    ]
+
+    rng_version, rng_state, gauss = game.rng.getstate()
+    parts.append(_RNG.pack(rng_version))
+    parts.append(array('I', rng_state).tobytes())
+    parts.append(_GAUSS.pack(gauss is not None, gauss or 0.0))
+
+    cells = bytearray(board.WIDTH * board.HEIGHT)
+    i = 0
+    for row, colors in zip(board.grid, board.colors):
+        for filled, color in zip(row, colors):
+            if filled:
+                cells[i] = COLOR_CODES.get(tuple(color), 1)
+            i += 1
+    parts.append(bytes(cells))
+    return b''.join(parts)
+
+
+def restore_game(game, data: bytes):
+    """
+    Load a snapshot into a Game.
+    Raises ValueError (or struct.error) on an unusable snapshot, leaving the game untouched.
+    """
+    if len(data) < SNAPSHOT_SIZE_FIXED - _HEADER.size + min(h.size for h in _HEADERS.values()):
+        raise ValueError("Snapshot is truncated")
+    magic, version = struct.unpack_from('<4sH', data, 0)
+    header = _HEADERS.get(version)
+    if magic != MAGIC or header is None:
+        raise ValueError(f"Not a Tetrix snapshot (v{VERSION})")
+    _, _, width, height = header.unpack_from(data, 0)
+    if len(data) != SNAPSHOT_SIZE_FIXED - _HEADER.size + header.size + width * height:
+        raise ValueError("Snapshot is truncated")
+    if not width or not height:
+        raise ValueError(f"Snapshot is for a {width}x{height} board")
+
+    offset = header.size
+    (shape, rotation, x, y, next_shape, held, can_hold, pending_clear,
+     score, level, lines, combo, last_level, seed,
+     game_time, duration, drop_timer) = _STATE.unpack_from(data, offset)
+    offset += _STATE.size
+
+    (rng_version,) = _RNG.unpack_from(data, offset)
+    offset += _RNG.size
+    rng_state = array('I')
+    rng_state.frombytes(data[offset:offset + _RNG_STATE_WORDS * 4])
+    offset += _RNG_STATE_WORDS * 4
+    has_gauss, gauss = _GAUSS.unpack_from(data, offset)
+    offset += _GAUSS.size
+    rng = random.Random()
+    rng.setstate((rng_version, tuple(rng_state), gauss if has_gauss else None))
+
+    board = Board(width, height)
+    for i, code in enumerate(data[offset:offset + width * height]):
+        if code:
+            row, col = divmod(i, width)
+            board.grid[row][col] = 1
+            board.colors[row][col] = CODE_COLORS[code]
+
+    piece = Piece(PIECE_TYPES[shape])
+    for _ in range(rotation):
+        piece.rotate()
+    piece.position = [x, y]
+    next_piece = Piece(PIECE_TYPES[next_shape])
+    held_piece = PIECE_TYPES[held] if held != NO_PIECE else None
+
+    # Nothing is modified until the whole snapshot is decoded
+    game.board = board
+    game.current_piece = piece
+    game.next_piece = next_piece
+    game.held_piece = held_piece
+    game.can_hold = bool(can_hold)
+    game._pending_clear = bool(pending_clear)
+    game.seed = seed
+    game.rng = rng
+    game.game_time = game_time
+    game.drop_timer = drop_timer
+
+    scoring = game.scoring
+    scoring.reset(seed=seed)
+    scoring.score = score
+    scoring.level = level
+    scoring.lines_cleared = lines
+    scoring.combo = combo
+    scoring.last_level = last_level
+    scoring.start_time = time.time() - duration
+    scoring.high_score = max(scoring.high_score, score)
+
+
+def save_snapshot(data: bytes, path: str = SNAPSHOT_FILE):
+    """Write a snapshot atomically."""
+    try:
+        write_bytes_atomic(path, data)
+    except OSError as e:
+        print(f"Error saving snapshot: {e}")
+
+
+def discard_snapshot(path: str = SNAPSHOT_FILE):
+    """Remove a saved snapshot once its game is over."""
+    try:
+        if os.path.exists(path):
+            os.remove(path)
+    except OSError as e:
+        print(f"Error removing snapshot: {e}")
+
+
+def take_snapshot(path: str = SNAPSHOT_FILE):
+    """Read and remove a saved snapshot, None if there is none."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        # A snapshot is resumed once, a crash must not bring back a stale game
+        os.remove(path)
+        return data
+    except OSError as e:
+        print(f"Error loading snapshot: {e}")
+        return None
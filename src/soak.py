@@ -0,0 +1,282 @@
+"""
+Soak test module for Tetrix.
+Plays many headless games across worker processes and reports throughput
+and memory over time, to catch leaks before they reach always-on kiosks.
+
+    python -m src.soak --games 2000 --workers 4 --bot heuristic
+
+Every worker plays its share of seeded games through Board, Piece and
+Scoring with one long-lived Scoring, so finished games go through the
+score database and sketches as they do in the game. Each lock also feeds
+an AnimationManager the effects Game would start. Workers send a sample
+every interval: games and pieces played, resident memory, and with
+tracemalloc the source lines whose allocations grew the most since the
+first interval. tracemalloc slows play down severalfold, skip it with
+--no-tracemalloc for throughput figures.
+"""
+
+import argparse
+import multiprocessing
+import os
+import queue
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from .autoplay import HeuristicBot, RandomBot, Simulation
+from .rollout import MonteCarloBot
+from .scoring import Scoring
+from .score_db import ScoreDatabase
+
+BOTS = {'heuristic': HeuristicBot, 'random': RandomBot, 'montecarlo': MonteCarloBot}
+TOP_ALLOCATORS = 5
+
+
+def rss_kb() -> int:
+    """Resident set size of this process in KB, peak RSS where /proc is missing."""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == 'darwin' else peak
+    except ImportError:
+        return 0
+
+
+class _Effects:
+    """Starts the effects Game starts on each lock, and ages them like frames would."""
+
+    def __init__(self):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # once per worker otherwise
+        from .animations import AnimationManager
+        self.manager = AnimationManager()
+
+    def on_lock(self, simulation, cleared, score_info):
+        manager = self.manager
+        manager.update()
+        if not cleared:
+            return
+        board = simulation.board
+        manager.add_line_clear(cleared, score_info['is_tetris'],
+                               colors=[board.colors[y] for y in cleared], board_width=board.WIDTH)
+        if score_info['is_tetris']:
+            manager.add_screen_shake(intensity=10)
+        if score_info['combo'] > 1:
+            manager.add_combo(score_info['combo'], 300, 250)
+        if score_info['points'] > 0:
+            manager.add_floating_text(f"+{score_info['points']}", 300, 300)
+        if score_info['leveled_up']:
+            manager.add_level_up(simulation.scoring.level)
+
+
+# Allocations by the import machinery and tracemalloc itself are not the game's
+_NOISE = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+]
+
+
+def _snapshot():
+    return tracemalloc.take_snapshot().filter_traces(_NOISE)
+
+
+def _top_allocators(snapshot, baseline) -> List[list]:
+    stats = snapshot.compare_to(baseline, 'lineno')
+    return [
+        [str(stat.traceback[0]), round(stat.size_diff / 1024, 1), stat.count_diff]
+        for stat in stats[:TOP_ALLOCATORS]
+    ]
+
+
+def _worker(index: int, seeds: List[int], options: dict, samples):
+    """Play the given seeds, putting samples on the queue."""
+    trace = options['tracemalloc']
+    if trace:
+        tracemalloc.start()
+    workdir = options['workdir']
+    scoring = Scoring(db=ScoreDatabase(os.path.join(workdir, f'scores-{index}.db')),
+                      sketch_file=os.path.join(workdir, f'sketches-{index}.bin'))
+    bot = BOTS[options['bot']]()
+    effects = _Effects() if options['effects'] else None
+    baseline = None  # taken at the first interval, once caches and lazy imports settled
+
+    start = time.perf_counter()
+    games = pieces = lines = 0
+
+    def sample(final: bool = False) -> dict:
+        nonlocal baseline
+        top = []
+        if trace and games + pieces:
+            if baseline is None:
+                baseline = _snapshot()
+            else:
+                top = _top_allocators(_snapshot(), baseline)
+        return {
+            'worker': index,
+            'time': time.perf_counter() - start,
+            'games': games,
+            'pieces': pieces,
+            'lines': lines,
+            'rss_kb': rss_kb(),
+            'top': top,
+            'final': final
+        }
+
+    samples.put(sample())
+    next_sample = start + options['interval']
+    for seed in seeds:
+        simulation = Simulation(seed, scoring, effects.on_lock if effects else None)
+        # A piece at a time, long games still report on time
+        while not simulation.over and simulation.pieces != options['max_pieces']:
+            simulation.play(bot, simulation.pieces + 1)
+            pieces += 1
+            if time.perf_counter() >= next_sample:
+                samples.put(sample())
+                next_sample = time.perf_counter() + options['interval']
+        games += 1
+        lines += scoring.lines_cleared
+
+    scoring.save_high_score()  # The last game, the next reset would have saved it
+    samples.put(sample(final=True))
+
+
+class SoakReport:
+    """
+    Collects worker samples into throughput and memory growth figures.
+    """
+
+    def __init__(self):
+        self.first: Dict[int, dict] = {}
+        self.last: Dict[int, dict] = {}
+
+    def add(self, sample: dict):
+        self.first.setdefault(sample['worker'], sample)
+        self.last[sample['worker']] = sample
+
+    def totals(self) -> dict:
+        elapsed = max((s['time'] for s in self.last.values()), default=0.0)
+        games = sum(s['games'] for s in self.last.values())
+        pieces = sum(s['pieces'] for s in self.last.values())
+        return {
+            'seconds': round(elapsed, 2),
+            'games': games,
+            'pieces': pieces,
+            'lines': sum(s['lines'] for s in self.last.values()),
+            'games_per_second': round(games / elapsed, 2) if elapsed else 0.0,
+            'pieces_per_second': round(pieces / elapsed, 1) if elapsed else 0.0,
+        }
+
+    def rss_growth(self) -> Dict[int, dict]:
+        return {
+            worker: {'start_kb': self.first[worker]['rss_kb'], 'end_kb': last['rss_kb'],
+                     'growth_kb': last['rss_kb'] - self.first[worker]['rss_kb']}
+            for worker, last in sorted(self.last.items())
+        }
+
+    def progress_line(self) -> str:
+        t = self.totals()
+        rss = ' '.join(f"{s['rss_kb'] // 1024}M" for _, s in sorted(self.last.items()))
+        return (f"{t['seconds']:>8.1f}s {t['games']:>7} games {t['games_per_second']:>8.2f}/s "
+                f"{t['pieces_per_second']:>10.1f} pieces/s  rss {rss}")
+
+    def report(self) -> str:
+        t = self.totals()
+        lines = [
+            f"{t['games']} games, {t['pieces']} pieces, {t['lines']} lines in {t['seconds']:.1f}s",
+            f"{t['games_per_second']:.2f} games/s, {t['pieces_per_second']:.1f} pieces/s",
+            "",
+            f"{'WORKER':<8}{'RSS START':>12}{'RSS END':>12}{'GROWTH':>12}",
+        ]
+        for worker, rss in self.rss_growth().items():
+            lines.append(f"{worker:<8}{rss['start_kb']:>10}KB{rss['end_kb']:>10}KB{rss['growth_kb']:>+10}KB")
+        for worker, last in sorted(self.last.items()):
+            if last['top']:
+                lines.append("")
+                lines.append(f"Worker {worker} allocation growth since the first interval:")
+                for where, size_kb, count in last['top']:
+                    lines.append(f"  {size_kb:>+10.1f}KB {count:>+8} blocks  {where}")
+        return "\n".join(lines)
+
+
+def run_soak(games: int, workers: int, bot: str = 'heuristic', max_pieces: Optional[int] = 1000,
+             interval: float = 5.0, trace: bool = True, effects: bool = True, seed: int = 0,
+             progress=None) -> SoakReport:
+    """Play games across worker processes, calling progress(report) as samples arrive."""
+    workers = max(1, min(workers, games))
+    report = SoakReport()
+    with tempfile.TemporaryDirectory(prefix='tetrix-soak-') as workdir:
+        options = {'bot': bot, 'max_pieces': max_pieces, 'interval': interval,
+                   'tracemalloc': trace, 'effects': effects, 'workdir': workdir}
+        # Spawned, not forked, workers never inherit a lock held by another thread
+        context = multiprocessing.get_context('spawn')
+        samples = context.Queue()
+        processes = [
+            context.Process(target=_worker, name=f'tetrix-soak-{i}',
+                                    args=(i, list(range(seed + i, seed + games, workers)), options, samples))
+            for i in range(workers)
+        ]
+        for process in processes:
+            process.start()
+
+        running = set(range(workers))
+        while running:
+            try:
+                sample = samples.get(timeout=1.0)
+            except queue.Empty:
+                for i, process in enumerate(processes):
+                    if i in running and not process.is_alive():
+                        print(f"Error: soak worker {i} exited with code {process.exitcode}")
+                        running.discard(i)
+                continue
+            report.add(sample)
+            if sample['final']:
+                running.discard(sample['worker'])
+            elif progress:
+                progress(report)
+
+        for process in processes:
+            process.join()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Tetrix headless soak test')
+    parser.add_argument('--games', type=int, default=100, help='games to play in total')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='worker processes')
+    parser.add_argument('--bot', choices=sorted(BOTS), default='heuristic', help='who plays the games')
+    parser.add_argument('--max-pieces', type=int, default=1000,
+                        help='end a game after this many pieces, 0 plays until top out')
+    parser.add_argument('--interval', type=float, default=5.0, help='seconds between samples')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first game')
+    parser.add_argument('--no-tracemalloc', action='store_true', help='skip allocation tracking, it slows play')
+    parser.add_argument('--no-effects', action='store_true', help='skip feeding the animation manager')
+    parser.add_argument('--json', action='store_true', help='print the summary as JSON')
+    args = parser.parse_args()
+
+    report = run_soak(
+        args.games, args.workers, args.bot, args.max_pieces or None, args.interval,
+        trace=not args.no_tracemalloc, effects=not args.no_effects, seed=args.seed,
+        progress=None if args.json else lambda r: print(r.progress_line(), flush=True)
+    )
+    if args.json:
+        import json
+        print(json.dumps({
+            'totals': report.totals(),
+            'rss': report.rss_growth(),
+            'top_allocators': {worker: s['top'] for worker, s in report.last.items()}
+        }, indent=2))
+    else:
+        print()
+        print(report.report())
+
+if __name__ == '__main__':
+    main()
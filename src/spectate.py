@@ -0,0 +1,386 @@
+"""
+Spectate module for Tetrix.
+Broadcasts a running game to many spectators on the local network.
+
+The game encodes each frame's changes once and the server writes the same
+bytes to every viewer. Changed rows come from the board's row versions,
+so a frame costs the rows that changed, not the whole board. A keyframe with the full board goes out every
+KEYFRAME_INTERVAL frames; viewers that join late start from the latest
+keyframe and the deltas that followed it. A viewer that cannot keep up
+only gets keyframes until its backlog drains.
+
+Broadcast with `python main.py --broadcast 7800`, watch with
+`python -m src.spectate HOST:7800`.
+"""
+
+import asyncio
+import queue
+import struct
+import threading
+from typing import List, Optional, Tuple
+
+from .board import Board
+from .piece import Piece
+from .snapshot import PIECE_TYPES, NO_PIECE, COLOR_CODES, CODE_COLORS
+
+KEYFRAME = 1
+DELTA = 2
+
+GAME_OVER = 2  # GameState.GAME_OVER, without importing the game
+
+_FRAME = struct.Struct('<BI')  # kind, payload length
+# sequence, game state, paused, piece type, rotation, x, y, next, held,
+# score, level, lines, game time, board width, board height, changed rows;
+# then per changed row its u16 index and one cell code per column (as snapshots)
+_STATE = struct.Struct('<IBBBBhhBBQHIfHHH')
+_ROW = struct.Struct('<H')
+
+
+class FrameEncoder:
+    """
+    Turns game frames into keyframes and deltas, remembering what was sent.
+    """
+
+    KEYFRAME_INTERVAL = 120  # frames
+
+    def __init__(self):
+        self.sequence = 0
+        self.frames_since_key = None
+        self._board = None  # board last sent, a new one needs a keyframe
+        self._version = 0  # its version when last sent
+        self._state = None
+
+    @staticmethod
+    def _row(board: Board, y: int) -> bytes:
+        """Cell codes of a row, as snapshots store them."""
+        return bytes(COLOR_CODES.get(tuple(color), 1) if filled else 0
+                     for filled, color in zip(board.grid[y], board.colors[y]))
+
+    def encode(self, game) -> Optional[Tuple[int, bytes]]:
+        """Encode a frame, None when nothing changed and no keyframe is due."""
+        board = game.board
+        piece = game.current_piece
+        state = (
+            game.state, game.paused,
+            PIECE_TYPES.index(piece.shape_type), piece.rotation, piece.position[0], piece.position[1],
+            PIECE_TYPES.index(game.next_piece.shape_type),
+            PIECE_TYPES.index(game.held_piece) if game.held_piece else NO_PIECE,
+            game.scoring.score, game.scoring.level, game.scoring.lines_cleared,
+            int(game.game_time)  # whole seconds, so the clock alone never forces a frame
+        )
+
+        key = (self.frames_since_key is None or self.frames_since_key + 1 >= self.KEYFRAME_INTERVAL
+               or board is not self._board)
+        if key:
+            changed = range(board.HEIGHT)
+            self.frames_since_key = 0
+        else:
+            since = self._version
+            changed = [y for y, v in enumerate(board.row_versions) if v > since] if board.version != since else []
+            self.frames_since_key += 1
+            if not changed and state == self._state:
+                return None
+
+        self._board = board
+        self._version = board.version
+        self._state = state
+        self.sequence += 1
+
+        parts = [_STATE.pack(self.sequence, *state, board.WIDTH, board.HEIGHT, len(changed))]
+        for y in changed:
+            parts.append(_ROW.pack(y))
+            parts.append(self._row(board, y))
+        payload = b''.join(parts)
+        kind = KEYFRAME if key else DELTA
+        return kind, _FRAME.pack(kind, len(payload)) + payload
+
+
+class _Viewer:
+    """A connected spectator."""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.keyframes_only = False
+
+    def backlog(self) -> int:
+        return self.writer.transport.get_write_buffer_size()
+
+
+class BroadcastServer:
+    """
+    Fans encoded frames out to every spectator from its own event loop thread.
+    """
+
+    HIGH_WATER = 64 * 1024  # backlog that drops a viewer to keyframes only
+    LOW_WATER = 8 * 1024  # backlog under which deltas resume at a keyframe
+    MAX_BACKLOG = 1024 * 1024  # backlog that disconnects a viewer
+
+    def __init__(self, host: str = '0.0.0.0', port: int = 7800):
+        self.encoder = FrameEncoder()
+        self.viewers: List[_Viewer] = []
+        self._keyframe = None
+        self._since_key = []  # deltas after the latest keyframe, for late joiners
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='tetrix-broadcast', daemon=True)
+        self._thread.start()
+
+        async def start():
+            return await asyncio.start_server(self._accept, host, port)
+
+        self._server = asyncio.run_coroutine_threadsafe(start(), self._loop).result()
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def _accept(self, reader, writer):
+        """Send a new viewer the current picture, then follow the stream."""
+        if self._keyframe:
+            writer.write(self._keyframe)
+            for frame in self._since_key:
+                writer.write(frame)
+        viewer = _Viewer(writer)
+        self.viewers.append(viewer)
+        try:
+            # Viewers never send anything, wait for them to leave
+            await reader.read()
+        except ConnectionError:
+            pass
+        finally:
+            if viewer in self.viewers:
+                self.viewers.remove(viewer)
+            writer.close()
+
+    def publish(self, game):
+        """Encode the game's current frame, called once per frame by the game loop."""
+        encoded = self.encoder.encode(game)
+        if encoded:
+            self._loop.call_soon_threadsafe(self._fan_out, *encoded)
+
+    def _fan_out(self, kind: int, frame: bytes):
+        """Write one encoded frame to every viewer."""
+        if kind == KEYFRAME:
+            self._keyframe = frame
+            self._since_key = []
+        else:
+            self._since_key.append(frame)
+
+        for viewer in list(self.viewers):
+            backlog = viewer.backlog()
+            if backlog > self.MAX_BACKLOG:
+                self.viewers.remove(viewer)
+                viewer.writer.transport.abort()
+                continue
+            if viewer.keyframes_only:
+                if kind != KEYFRAME:
+                    continue
+                if backlog < self.LOW_WATER:
+                    viewer.keyframes_only = False
+            elif backlog > self.HIGH_WATER:
+                # Deltas would only pile up, resync from a later keyframe
+                viewer.keyframes_only = True
+                if kind != KEYFRAME:
+                    continue
+            viewer.writer.write(frame)
+
+    def close(self):
+        """Disconnect every viewer and stop the server thread."""
+        if self._loop.is_closed():
+            return
+
+        async def shutdown():
+            self._server.close()
+            for viewer in self.viewers:
+                viewer.writer.close()
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._loop.stop()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop)
+        self._thread.join(timeout=2)
+        if not self._thread.is_alive():
+            self._loop.close()
+
+
+class _ScoreView:
+    """The scoring fields the Renderer reads."""
+
+    def __init__(self):
+        self.score = 0
+        self.high_score = 0
+        self.level = 1
+        self.lines_cleared = 0
+        self.scores_list = []
+
+    def get_percentile(self, score):
+        return None
+
+
+class SpectatorView:
+    """
+    Game state rebuilt from broadcast frames, in the shapes Renderer draws.
+    """
+
+    def __init__(self):
+        self.board = Board()
+        self.current_piece = None
+        self.next_piece = None
+        self.held_piece = None
+        self.scoring = _ScoreView()
+        self.state = 0
+        self.paused = False
+        self.game_time = 0.0
+        self.sequence = 0
+        self.synced = False  # a keyframe has been applied
+
+    def apply(self, kind: int, payload: bytes):
+        """Apply a keyframe or delta, ignoring deltas until the first keyframe."""
+        if kind != KEYFRAME and not self.synced:
+            return
+        (sequence, self.state, paused, shape, rotation, x, y, next_shape, held,
+         score, level, lines, self.game_time, width, height, count) = _STATE.unpack_from(payload, 0)
+        if kind == KEYFRAME:
+            self.synced = True
+            if (width, height) != (self.board.WIDTH, self.board.HEIGHT):
+                self.board = Board(width, height)
+        self.sequence = sequence
+        self.paused = bool(paused)
+
+        piece = Piece(PIECE_TYPES[shape])
+        for _ in range(rotation):
+            piece.rotate()
+        piece.position = [x, y]
+        self.current_piece = piece
+        self.next_piece = Piece(PIECE_TYPES[next_shape])
+        self.held_piece = PIECE_TYPES[held] if held != NO_PIECE else None
+
+        scoring = self.scoring
+        scoring.score, scoring.level, scoring.lines_cleared = score, level, lines
+        scoring.high_score = max(scoring.high_score, score)
+
+        offset = _STATE.size
+        for _ in range(count):
+            (row,) = _ROW.unpack_from(payload, offset)
+            offset += _ROW.size
+            cells = payload[offset:offset + width]
+            offset += width
+            if row < self.board.HEIGHT:
+                self.board.grid[row] = [1 if code else 0 for code in cells]
+                self.board.colors[row] = [CODE_COLORS.get(code) for code in cells]
+
+
+class SpectatorClient:
+    """
+    Receives broadcast frames on a background thread.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.inbox = queue.SimpleQueue()
+        self.connected = threading.Event()
+        self._writer = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='tetrix-spectate', daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._receive(host, port), self._loop)
+
+    async def _receive(self, host: str, port: int):
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+        except OSError as e:
+            print(f"Error connecting to broadcast: {e}")
+            self.inbox.put(None)
+            return
+        # The loop only holds its tasks weakly, the writer keeps this one reachable
+        self._writer = writer
+        self.connected.set()
+        try:
+            while True:
+                kind, length = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+                self.inbox.put((kind, await reader.readexactly(length)))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.connected.clear()
+            self.inbox.put(None)  # End of stream
+            self._writer = None
+            writer.close()
+
+    def poll(self) -> list:
+        """Get frames received since the last poll, None marks the end of the stream."""
+        frames = []
+        while True:
+            try:
+                frames.append(self.inbox.get_nowait())
+            except queue.Empty:
+                return frames
+
+    def close(self):
+        if self._loop.is_closed():
+            return
+
+        async def shutdown():
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._loop.stop()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop)
+        self._thread.join(timeout=2)
+        if not self._thread.is_alive():
+            self._loop.close()
+
+
+def watch(host: str, port: int):
+    """Open a window showing a broadcast game."""
+    import pygame
+    from .renderer import Renderer
+    from .settings import Settings
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((600, 700))
+    pygame.display.set_caption(f'Tetrix - watching {host}:{port}')
+    clock = pygame.time.Clock()
+    renderer = Renderer(screen, Settings())
+    view = SpectatorView()
+    client = SpectatorClient(host, port)
+
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+
+        for frame in client.poll():
+            if frame is None:
+                running = False
+                break
+            view.apply(*frame)
+
+        screen.fill(renderer.COLOR_BG)
+        renderer.follow(view.board, view.current_piece if view.synced else None)
+        renderer.draw_board(view.board)
+        if view.synced:
+            renderer.draw_piece(view.current_piece)
+            renderer.draw_ui(view.scoring, view.next_piece, view.held_piece)
+            if view.paused:
+                renderer.draw_pause()
+            if view.state == GAME_OVER:
+                renderer.draw_game_over(view.scoring, view.game_time)
+        pygame.display.flip()
+        clock.tick(60)
+
+    client.close()
+    pygame.quit()
+
+
+def main():
+    import sys
+    if len(sys.argv) != 2 or ':' not in sys.argv[1]:
+        print("Usage: python -m src.spectate HOST:PORT")
+        sys.exit(1)
+    host, _, port = sys.argv[1].rpartition(':')
+    watch(host, int(port))
+
+if __name__ == '__main__':
+    main()
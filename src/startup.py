@@ -0,0 +1,151 @@
+"""
+Startup timing for Tetrix.
+Records milestones from process start to the first presented frame, and
+optionally the import time of every module.
+"""
+
+import os
+import sys
+import time
+from typing import Dict, List, Tuple
+
+
+def _process_uptime() -> float:
+    """Seconds since the process started, 0 when the platform cannot tell."""
+    try:
+        with open('/proc/self/stat') as f:
+            # Fields after the command name, starttime is field 22 of the full line
+            fields = f.read().rsplit(')', 1)[1].split()
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - int(fields[19]) / os.sysconf('SC_CLK_TCK'))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0.0
+
+
+class StartupTimer:
+    """
+    Collects named startup milestones relative to process start.
+    """
+
+    BUDGET_MS = 500  # cold-start budget for process start to first frame
+
+    def __init__(self):
+        self.start = time.perf_counter() - _process_uptime()
+        self.marks: List[Tuple[str, float]] = [('startup module imported', time.perf_counter())]
+
+    def mark(self, name: str):
+        """Record a milestone. Safe to call from loader threads."""
+        self.marks.append((name, time.perf_counter()))
+
+    def elapsed_ms(self, name: str) -> float:
+        """Milliseconds from process start to a milestone, -1 if not reached."""
+        for mark, t in self.marks:
+            if mark == name:
+                return (t - self.start) * 1000
+        return -1.0
+
+    def report(self) -> str:
+        """Format the milestones as a timeline."""
+        lines = [f"{'MILESTONE':<32}{'AT (ms)':>10}{'STEP (ms)':>11}"]
+        previous = self.start
+        for name, t in sorted(self.marks, key=lambda m: m[1]):
+            lines.append(f"{name:<32}{(t - self.start) * 1000:>10.1f}{(t - previous) * 1000:>11.1f}")
+            previous = t
+
+        first_frame = self.elapsed_ms('first frame')
+        if first_frame >= 0:
+            status = 'OK' if first_frame <= self.BUDGET_MS else 'OVER BUDGET'
+            lines.append(f"first frame {first_frame:.1f} ms / budget {self.BUDGET_MS} ms: {status}")
+        return "\n".join(lines)
+
+
+class _TimedLoader:
+    """Wraps a module loader to time the module's execution."""
+
+    def __init__(self, loader, profiler: 'ImportProfiler'):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        # Extension modules do their real work here
+        self._profiler._enter(spec.name)
+        try:
+            return self._loader.create_module(spec)
+        finally:
+            self._profiler._exit()
+
+    def exec_module(self, module):
+        self._profiler._enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit()
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class ImportProfiler:
+    """
+    Records how long each module takes to import, only while installed.
+
+    Self time excludes the modules a module imports, cumulative time
+    includes them.
+    """
+
+    def __init__(self):
+        self.times: Dict[str, List[float]] = {}  # module -> [self, cumulative] seconds
+        self._stack = []  # [module, start, time spent in children]
+        self._finding = False
+
+    def install(self):
+        """Start profiling imports that happen from now on."""
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path=None, target=None):
+        if self._finding:
+            return None
+        self._finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                        spec.loader = _TimedLoader(spec.loader, self)
+                    return spec
+            return None
+        finally:
+            self._finding = False
+
+    def _enter(self, name: str):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit(self):
+        name, start, children = self._stack.pop()
+        total = time.perf_counter() - start
+        if self._stack:
+            self._stack[-1][2] += total
+        entry = self.times.setdefault(name, [0.0, 0.0])
+        entry[0] += total - children
+        entry[1] += total
+
+    def report(self, limit: int = 25) -> str:
+        """Format the slowest imports by cumulative time."""
+        lines = [f"{'MODULE':<40}{'SELF (ms)':>11}{'CUMUL (ms)':>12}"]
+        ranked = sorted(self.times.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (own, cumulative) in ranked[:limit]:
+            lines.append(f"{name:<40}{own * 1000:>11.1f}{cumulative * 1000:>12.1f}")
+        total = sum(own for own, _ in self.times.values())
+        lines.append(f"{len(self.times)} modules imported in {total * 1000:.1f} ms")
+        return "\n".join(lines)
+
+
+# Created on first import, as early as possible in the process
+timer = StartupTimer()
@@ -0,0 +1,307 @@
+"""
+Telemetry module for Tetrix.
+Append-only, compressed columnar log of gameplay events, plus a streaming
+analyzer for logs collected from many machines.
+
+Analyze logs with:
+    python -m src.telemetry data/telemetry/*.tlog
+"""
+
+import os
+import sys
+import socket
+import struct
+import time
+import zlib
+from array import array
+from datetime import datetime
+from typing import Iterator, Optional
+
+GAME_START = 0
+PIECE_LOCK = 1
+LINE_CLEAR = 2
+HOLD = 3
+LEVEL_UP = 4
+GAME_END = 5
+GAME_RESUME = 6
+
+EVENT_NAMES = ['GAME_START', 'PIECE_LOCK', 'LINE_CLEAR', 'HOLD', 'LEVEL_UP', 'GAME_END', 'GAME_RESUME']
+
+PIECE_TYPES = 'IOTSZJL'
+
+
+class TelemetryLog:
+    """
+    Buffers events column by column and appends them as compressed blocks.
+
+    Record columns: time (ms, epoch), event, game number, a, b.
+        GAME_START  a = seed        b = 0
+        PIECE_LOCK  a = piece index b = 0
+        LINE_CLEAR  a = lines       b = combo
+        HOLD        a = piece index b = 0
+        LEVEL_UP    a = new level   b = 0
+        GAME_END    a = score       b = lines cleared
+        GAME_RESUME a = seed        b = ms played before the previous run quit
+
+    File layout (little endian):
+        header: magic b'TXTL', u16 version, u16 machine name length, name
+        blocks: u32 record count, u32 payload length, zlib payload
+        payload: time deltas (i64), events (u8), games (u32), a (i64), b (i64)
+    """
+
+    MAGIC = b'TXTL'
+    VERSION = 1
+    DIRECTORY = os.path.join('data', 'telemetry')
+    BLOCK_RECORDS = 4096
+    COLUMNS = ('q', 'B', 'I', 'q', 'q')
+
+    FILE_HEADER = struct.Struct('<4sHH')
+    BLOCK_HEADER = struct.Struct('<II')
+
+    def __init__(self, directory: str = DIRECTORY, machine: Optional[str] = None, persistence=None):
+        self.machine = machine or socket.gethostname()
+        self.persistence = persistence  # Optional PersistenceService for block writes
+        self.path = os.path.join(
+            directory, f"{self.machine}-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.tlog"
+        )
+        self.game = 0
+        self._game_open = False
+        self._new_columns()
+
+    def _new_columns(self):
+        self.columns = [array(code) for code in self.COLUMNS]
+
+    def record(self, event: int, a: int = 0, b: int = 0):
+        """Buffer one event, writing a block when the buffer is full."""
+        times, events, games, col_a, col_b = self.columns
+        times.append(int(time.time() * 1000))
+        events.append(event)
+        games.append(self.game)
+        col_a.append(a)
+        col_b.append(b)
+        if len(times) >= self.BLOCK_RECORDS:
+            self.flush()
+
+    def game_start(self, seed: int = 0):
+        self.game += 1
+        self._game_open = True
+        self.record(GAME_START, seed or 0)
+
+    def game_resume(self, seed: int, played_ms: int):
+        """Continue a game suspended by the previous run, its GAME_START is in that run's log."""
+        self.game += 1
+        self._game_open = True
+        self.record(GAME_RESUME, seed, played_ms)
+
+    def piece_lock(self, shape_type: str):
+        self.record(PIECE_LOCK, PIECE_TYPES.find(shape_type))
+
+    def line_clear(self, lines: int, combo: int):
+        self.record(LINE_CLEAR, lines, combo)
+
+    def hold(self, shape_type: str):
+        self.record(HOLD, PIECE_TYPES.find(shape_type))
+
+    def level_up(self, level: int):
+        self.record(LEVEL_UP, level)
+
+    def game_end(self, score: int, lines: int):
+        """Record the end of the current game, once, and write its block."""
+        if self._game_open:
+            self._game_open = False
+            self.record(GAME_END, score, lines)
+            self.flush()
+
+    def flush(self):
+        """Hand the buffered records to the writer."""
+        if not self.columns[0]:
+            return
+        columns = self.columns
+        self._new_columns()
+        if self.persistence:
+            self.persistence.submit(self._write_block, columns)
+        else:
+            self._write_block(columns)
+
+    def _write_block(self, columns):
+        """Encode and append one block."""
+        try:
+            self._append(columns)
+        except OSError as e:
+            print(f"Error writing telemetry: {e}")
+
+    def _append(self, columns):
+        times = columns[0]
+        deltas = array('q', [times[0]])
+        deltas.extend(times[i] - times[i - 1] for i in range(1, len(times)))
+        payload = zlib.compress(b''.join(c.tobytes() for c in [deltas] + columns[1:]), 6)
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        is_new = not os.path.exists(self.path)
+        with open(self.path, 'ab') as f:
+            if is_new:
+                name = self.machine.encode('utf-8')
+                f.write(self.FILE_HEADER.pack(self.MAGIC, self.VERSION, len(name)) + name)
+            f.write(self.BLOCK_HEADER.pack(len(times), len(payload)) + payload)
+
+
+def read_blocks(path: str) -> Iterator[tuple]:
+    """Yield (machine, columns) for each block of a log, one block in memory at a time."""
+    with open(path, 'rb') as f:
+        magic, version, name_len = TelemetryLog.FILE_HEADER.unpack(f.read(TelemetryLog.FILE_HEADER.size))
+        if magic != TelemetryLog.MAGIC or version != TelemetryLog.VERSION:
+            raise ValueError(f"Not a Tetrix telemetry log (v{TelemetryLog.VERSION}): {path}")
+        machine = f.read(name_len).decode('utf-8')
+
+        while True:
+            header = f.read(TelemetryLog.BLOCK_HEADER.size)
+            if len(header) < TelemetryLog.BLOCK_HEADER.size:
+                return  # End of file, or a block cut off by a crash
+            count, length = TelemetryLog.BLOCK_HEADER.unpack(header)
+            data = f.read(length)
+            if len(data) < length:
+                return
+            payload = memoryview(zlib.decompress(data))
+
+            columns = []
+            offset = 0
+            for code in TelemetryLog.COLUMNS:
+                column = array(code)
+                size = column.itemsize * count
+                column.frombytes(payload[offset:offset + size])
+                offset += size
+                columns.append(column)
+
+            # Undo the time delta encoding
+            times = columns[0]
+            for i in range(1, count):
+                times[i] += times[i - 1]
+            yield machine, columns
+
+
+class TelemetryAnalyzer:
+    """
+    Streams records from any number of logs into aggregate statistics.
+    Memory is bounded by one block plus one open game per machine log,
+    and the ids of games that span logs.
+
+    A game suspended at quit is left open at the end of its log and goes
+    on under GAME_RESUME in the next run's log. Both parts are joined by
+    machine and seed, so the game counts once whatever order the logs are
+    read in, and its level times keep counting from its real start.
+    """
+
+    LEVEL_BUCKET_S = 15  # histogram bucket width for time to reach a level
+
+    def __init__(self):
+        self.records = 0
+        self.games = 0
+        self.pieces = 0
+        self.lines = 0
+        self.clears = 0
+        self.tetrises = 0
+        self.combo_clears = 0
+        self.holds = 0
+        self.play_ms = 0
+        self.level_times = {}  # level -> {bucket: count}
+        # (path, game) -> [level clock origin, last event, segment start, (machine, seed), resumed]
+        self._open = {}
+        self._spanning = set()  # (machine, seed) of counted games that span logs
+
+    def add_log(self, path: str):
+        """Feed one log file."""
+        for machine, columns in read_blocks(path):
+            self._add_block(path, machine, columns)
+        # Games without a GAME_END (crash, kill, suspend) still count up to their last event
+        for key in [k for k in self._open if k[0] == path]:
+            self._end_game(self._open.pop(key), finished=False)
+
+    def _end_game(self, state: list, finished: bool):
+        _, last, segment, game_id, resumed = state
+        self.play_ms += max(0, last - segment)
+        if (resumed or not finished) and game_id[1]:
+            # Part of a game split over logs, count it with the first part read
+            if game_id in self._spanning:
+                return
+            self._spanning.add(game_id)
+        self.games += 1
+
+    def _add_block(self, path: str, machine: str, columns):
+        times, events, games, col_a, col_b = columns
+        self.records += len(times)
+        for t, event, game, a, b in zip(times, events, games, col_a, col_b):
+            key = (path, game)
+            if event == GAME_START:
+                self._open[key] = [t, t, t, (machine, a), False]
+                continue
+            if event == GAME_RESUME:
+                # Levels are timed from the game's start, b ms of play before now
+                self._open[key] = [t - b, t, t, (machine, a), True]
+                continue
+            state = self._open.get(key)
+            if state is None:
+                continue  # Game started in a block lost to truncation
+            state[1] = t
+
+            if event == PIECE_LOCK:
+                self.pieces += 1
+            elif event == LINE_CLEAR:
+                self.clears += 1
+                self.lines += a
+                if a == 4:
+                    self.tetrises += 1
+                if b > 1:
+                    self.combo_clears += 1
+            elif event == HOLD:
+                self.holds += 1
+            elif event == LEVEL_UP:
+                bucket = int((t - state[0]) / 1000 // self.LEVEL_BUCKET_S)
+                histogram = self.level_times.setdefault(a, {})
+                histogram[bucket] = histogram.get(bucket, 0) + 1
+            elif event == GAME_END:
+                del self._open[key]
+                self._end_game(state, finished=True)
+
+    def summary(self) -> dict:
+        """Get the aggregate statistics."""
+        play_s = self.play_ms / 1000
+        levels = {}
+        for level, histogram in sorted(self.level_times.items()):
+            total = sum(histogram.values())
+            # Median from the bucket histogram
+            seen = 0
+            median = 0
+            for bucket in sorted(histogram):
+                seen += histogram[bucket]
+                if seen * 2 >= total:
+                    median = (bucket + 0.5) * self.LEVEL_BUCKET_S
+                    break
+            levels[level] = {'games': total, 'median_seconds': median}
+
+        return {
+            'records': self.records,
+            'games': self.games,
+            'play_seconds': round(play_s, 1),
+            'pieces_per_second': round(self.pieces / play_s, 3) if play_s else 0.0,
+            'lines_per_minute': round(self.lines * 60 / play_s, 3) if play_s else 0.0,
+            'tetris_rate': round(self.tetrises / self.clears, 4) if self.clears else 0.0,
+            'combo_rate': round(self.combo_clears / self.clears, 4) if self.clears else 0.0,
+            'holds_per_game': round(self.holds / self.games, 2) if self.games else 0.0,
+            'time_to_level': levels
+        }
+
+
+def main(paths):
+    import json
+    analyzer = TelemetryAnalyzer()
+    for path in paths:
+        try:
+            analyzer.add_log(path)
+        except (OSError, ValueError, zlib.error) as e:
+            print(f"Skipping {path}: {e}", file=sys.stderr)
+    print(json.dumps(analyzer.summary(), indent=2))
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
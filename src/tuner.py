@@ -0,0 +1,216 @@
+"""
+Tuner module for Tetrix.
+Evolves the HeuristicBot board evaluation weights with a genetic algorithm.
+
+Every candidate plays the same fixed set of seeded headless games, so
+fitness differences come from the weights alone. Games are spread over a
+process pool one (candidate, seed) pair at a time, which keeps every core
+busy and makes a generation scale with the number of workers. The
+population is checkpointed after each generation and a run resumes from
+its checkpoint.
+
+    python -m src.tuner --generations 30 --workers 8 --checkpoint data/tuner.json
+
+Each generation the worst 30% of the population is replaced by offspring:
+two parents won by tournament are crossed as their fitness weighted
+average, then occasionally mutated, and weight vectors are kept at unit
+length since only their direction changes which placement wins.
+"""
+
+import math
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from .autoplay import DEFAULT_WEIGHTS, FEATURES, HeuristicBot, Simulation, memory_scoring
+from .persistence import write_json_atomic
+
+VERSION = 1
+FITNESS = ('lines', 'score')
+
+_scoring = None  # one in-memory Scoring per worker process, reset for each game
+
+
+def play(weights: Dict[str, float], seed: int, max_pieces: int, fitness: str = 'lines') -> int:
+    """Play one seeded game with the given weights, returns its fitness."""
+    global _scoring
+    if _scoring is None:
+        _scoring = memory_scoring()
+    game = Simulation(seed, _scoring).play(HeuristicBot(weights), max_pieces)
+    return game.scoring.lines_cleared if fitness == 'lines' else game.scoring.score
+
+
+def _normalized(vector: List[float]) -> List[float]:
+    length = math.sqrt(sum(v * v for v in vector))
+    return [v / length for v in vector] if length else vector
+
+
+class Tuner:
+    """
+    Genetic algorithm over unit length weight vectors, one weight per feature.
+    """
+
+    OFFSPRING = 0.3  # fraction of the population replaced each generation
+    TOURNAMENT = 0.1  # fraction of the population drawn for each tournament
+    MUTATION_RATE = 0.05
+    MUTATION_STEP = 0.2
+
+    def __init__(self, population: int = 50, games: int = 10, max_pieces: int = 500,
+                 fitness: str = 'lines', seed: int = 0, workers: int = 1,
+                 checkpoint: Optional[str] = None):
+        if fitness not in FITNESS:
+            raise ValueError(f"Fitness must be one of {FITNESS}")
+        self.size = population
+        self.seeds = list(range(seed, seed + games))
+        self.max_pieces = max_pieces
+        self.fitness = fitness
+        self.workers = workers
+        self.checkpoint = checkpoint
+        self.rng = random.Random(seed)
+        self.generation = 0
+        self.population: List[dict] = []  # {'weights': [...], 'fitness': float}
+
+    def _random_weights(self) -> List[float]:
+        return _normalized([self.rng.uniform(-1, 1) for _ in FEATURES])
+
+    def evaluate(self, candidates: List[List[float]], pool=None) -> List[float]:
+        """Mean fitness of each candidate over the seeded games."""
+        jobs = [(dict(zip(FEATURES, weights)), seed) for weights in candidates for seed in self.seeds]
+        args = ([w for w, _ in jobs], [s for _, s in jobs],
+                [self.max_pieces] * len(jobs), [self.fitness] * len(jobs))
+        results = list(pool.map(play, *args, chunksize=1) if pool else map(play, *args))
+
+        games = len(self.seeds)
+        return [sum(results[i * games:(i + 1) * games]) / games for i in range(len(candidates))]
+
+    def _tournament(self) -> dict:
+        entrants = self.rng.sample(self.population, max(2, int(self.size * self.TOURNAMENT)))
+        return max(entrants, key=lambda c: c['fitness'])
+
+    def _offspring(self) -> List[float]:
+        first = self._tournament()
+        second = self._tournament()
+        total = first['fitness'] + second['fitness']
+        share = first['fitness'] / total if total else 0.5
+        child = _normalized([share * a + (1 - share) * b for a, b in zip(first['weights'], second['weights'])])
+        if self.rng.random() < self.MUTATION_RATE:
+            i = self.rng.randrange(len(child))
+            child[i] += self.rng.uniform(-self.MUTATION_STEP, self.MUTATION_STEP)
+            child = _normalized(child)
+        return child
+
+    def step(self, pool=None):
+        """Evaluate the first population, or breed and evaluate one generation."""
+        if not self.population:
+            # The shipped weights compete too, the result is never worse than them
+            candidates = [_normalized([DEFAULT_WEIGHTS[name] for name in FEATURES])]
+            candidates += [self._random_weights() for _ in range(self.size - 1)]
+        else:
+            candidates = [self._offspring() for _ in range(max(1, int(self.size * self.OFFSPRING)))]
+        scored = [{'weights': w, 'fitness': f} for w, f in zip(candidates, self.evaluate(candidates, pool))]
+
+        # Offspring replace the weakest, survivors keep their fitness (same seeds)
+        survivors = sorted(self.population, key=lambda c: c['fitness'], reverse=True)[:self.size - len(scored)]
+        self.population = sorted(survivors + scored, key=lambda c: c['fitness'], reverse=True)
+        self.generation += 1
+        if self.checkpoint:
+            self.save(self.checkpoint)
+
+    def best(self) -> dict:
+        """The fittest candidate, weights by feature name."""
+        top = self.population[0]
+        return {'weights': dict(zip(FEATURES, top['weights'])), 'fitness': top['fitness']}
+
+    def run(self, generations: int, progress: Optional[Callable] = None):
+        """Run until the given generation count, calling progress(tuner) after each."""
+        pool = None
+        if self.workers > 1:
+            pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'))
+        try:
+            while self.generation < generations:
+                self.step(pool)
+                if progress:
+                    progress(self)
+        finally:
+            if pool:
+                pool.shutdown()
+
+    def state(self) -> dict:
+        version, internal, gauss = self.rng.getstate()
+        return {
+            'version': VERSION,
+            'features': list(FEATURES),
+            'config': {'population': self.size, 'seeds': self.seeds,
+                       'max_pieces': self.max_pieces, 'fitness': self.fitness},
+            'generation': self.generation,
+            'population': self.population,
+            'best': self.best() if self.population else None,
+            'rng': [version, list(internal), gauss],
+        }
+
+    def save(self, path: str):
+        try:
+            write_json_atomic(path, self.state(), indent=1)
+        except OSError as e:
+            print(f"Error saving tuner checkpoint: {e}")
+
+    @classmethod
+    def resume(cls, path: str, workers: int = 1) -> 'Tuner':
+        """Continue a run from its checkpoint."""
+        import json
+        with open(path, 'r') as f:
+            state = json.load(f)
+        if state.get('version') != VERSION or state.get('features') != list(FEATURES):
+            raise ValueError(f"Not a tuner checkpoint for features {', '.join(FEATURES)}")
+
+        config = state['config']
+        tuner = cls(config['population'], max_pieces=config['max_pieces'], fitness=config['fitness'],
+                    workers=workers, checkpoint=path)
+        tuner.seeds = config['seeds']
+        tuner.generation = state['generation']
+        tuner.population = state['population']
+        version, internal, gauss = state['rng']
+        tuner.rng.setstate((version, tuple(internal), gauss))
+        return tuner
+
+
+def main():
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description='Tune the autoplay bot weights')
+    parser.add_argument('--generations', type=int, default=20, help='generation to stop at')
+    parser.add_argument('--population', type=int, default=50)
+    parser.add_argument('--games', type=int, default=10, help='seeded games per candidate')
+    parser.add_argument('--max-pieces', type=int, default=500, help='pieces per game')
+    parser.add_argument('--fitness', choices=FITNESS, default='lines')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first game and the algorithm')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--checkpoint', default=os.path.join('data', 'tuner.json'),
+                        help='written after every generation')
+    parser.add_argument('--resume', action='store_true', help='continue from the checkpoint')
+    args = parser.parse_args()
+
+    if args.resume:
+        try:
+            tuner = Tuner.resume(args.checkpoint, args.workers)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error resuming from {args.checkpoint}: {e}")
+            return
+        print(f"Resuming at generation {tuner.generation}")
+    else:
+        tuner = Tuner(args.population, args.games, args.max_pieces, args.fitness,
+                      args.seed, args.workers, args.checkpoint)
+
+    def progress(t):
+        mean = sum(c['fitness'] for c in t.population) / len(t.population)
+        print(f"generation {t.generation:>4}  best {t.population[0]['fitness']:>10.1f}  mean {mean:>10.1f}",
+              flush=True)
+
+    tuner.run(args.generations, progress)
+    print(json.dumps(tuner.best(), indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+"""
+Versus module for Tetrix.
+Two-player online versus over asyncio TCP.
+
+Each player simulates their own board, so local play never waits for the
+network. What crosses the wire:
+    START       the sender started a new round
+    BOARD       changed rows as bitmasks plus the falling piece and score
+    GARBAGE     lines the sender's clears send to the receiver
+    GAME_OVER   the sender topped out or left the round
+
+Received garbage is queued and only enters the board at the next lock that
+clears nothing, a fixed input delay that both players see the same way
+regardless of latency, so no rollback is needed.
+
+Host with `python main.py --host 7777`, join with `python main.py --join HOST:7777`.
+"""
+
+import asyncio
+import queue
+import socket
+import struct
+import threading
+from typing import List, Optional, Tuple
+
+from .board import Board
+from .piece import Piece
+from .snapshot import PIECE_TYPES, NO_PIECE
+
+MSG_START = 1
+MSG_BOARD = 2
+MSG_GARBAGE = 3
+MSG_GAME_OVER = 4
+MSG_DISCONNECT = 255  # local only, the peer went away
+
+# Garbage lines sent per number of lines cleared
+GARBAGE_SENT = {1: 0, 2: 1, 3: 2, 4: 4}
+
+_FRAME = struct.Struct('<BH')  # message type, payload length
+_BOARD = struct.Struct('<BBhhIHB')  # piece type, rotation, x, y, score, lines, changed rows
+_GARBAGE = struct.Struct('<B')
+
+
+def encode_board_delta(board: Board, piece: Optional[Piece], score: int, lines: int) -> bytes:
+    """Encode the rows changed since the last call, clearing board.dirty_rows."""
+    rows = sorted(board.dirty_rows)
+    board.dirty_rows.clear()
+    mask_bytes = (board.WIDTH + 7) // 8
+
+    if piece:
+        head = _BOARD.pack(PIECE_TYPES.index(piece.shape_type), piece.rotation,
+                           piece.position[0], piece.position[1], score, lines, len(rows))
+    else:
+        head = _BOARD.pack(NO_PIECE, 0, 0, 0, score, lines, len(rows))
+
+    parts = [head]
+    for y in rows:
+        mask = 0
+        for x, filled in enumerate(board.grid[y]):
+            if filled:
+                mask |= 1 << x
+        parts.append(bytes([y]) + mask.to_bytes(mask_bytes, 'little'))
+    return b''.join(parts)
+
+
+class RemoteBoard:
+    """
+    The opponent's board as last reported, cells only.
+    """
+
+    def __init__(self, width: int = Board.WIDTH, height: int = Board.HEIGHT):
+        self.width = width
+        self.height = height
+        self.reset()
+
+    def reset(self):
+        """Clear the board for a new round."""
+        self.rows = [0] * self.height  # one bitmask per row
+        self.piece = None  # (shape type, rotation, x, y)
+        self.score = 0
+        self.lines = 0
+        self.alive = True
+
+    def apply_delta(self, payload: bytes):
+        """Apply a BOARD message."""
+        shape, rotation, x, y, self.score, self.lines, count = _BOARD.unpack_from(payload, 0)
+        self.piece = (PIECE_TYPES[shape], rotation, x, y) if shape != NO_PIECE else None
+
+        mask_bytes = (self.width + 7) // 8
+        offset = _BOARD.size
+        for _ in range(count):
+            row = payload[offset]
+            if row < self.height:
+                self.rows[row] = int.from_bytes(payload[offset + 1:offset + 1 + mask_bytes], 'little')
+            offset += 1 + mask_bytes
+
+    def is_filled(self, x: int, y: int) -> bool:
+        return bool(self.rows[y] >> x & 1)
+
+    def piece_cells(self) -> List[Tuple[int, int]]:
+        """Board cells covered by the opponent's falling piece."""
+        if not self.piece:
+            return []
+        shape, rotation, x, y = self.piece
+        piece = Piece(shape)
+        for _ in range(rotation):
+            piece.rotate()
+        piece.position = [x, y]
+        return piece.get_positions()
+
+
+class VersusConnection:
+    """
+    Connection to the other player, run on its own event loop thread.
+
+    send() and poll() are safe to call from the game loop and never block.
+    """
+
+    CONNECT_RETRY = 1.0  # seconds
+
+    def __init__(self):
+        self.inbox = queue.SimpleQueue()
+        self.connected = threading.Event()
+        self.port = None
+        self._writer = None
+        self._server = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='tetrix-versus', daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def host(cls, port: int, bind: str = '0.0.0.0') -> 'VersusConnection':
+        """Wait for the other player on port (0 picks a free one)."""
+        connection = cls()
+
+        async def start():
+            connection._server = await asyncio.start_server(connection._accept, bind, port)
+            connection.port = connection._server.sockets[0].getsockname()[1]
+
+        asyncio.run_coroutine_threadsafe(start(), connection._loop).result()
+        return connection
+
+    @classmethod
+    def join(cls, host: str, port: int) -> 'VersusConnection':
+        """Connect to a hosting player, retrying until they are up."""
+        connection = cls()
+        connection.port = port
+        asyncio.run_coroutine_threadsafe(connection._connect(host, port), connection._loop)
+        return connection
+
+    async def _accept(self, reader, writer):
+        if self._writer is not None:
+            writer.close()  # Two players only
+            return
+        await self._attach(reader, writer)
+
+    async def _connect(self, host: str, port: int):
+        while True:
+            try:
+                reader, writer = await asyncio.open_connection(host, port)
+                break
+            except OSError:
+                await asyncio.sleep(self.CONNECT_RETRY)
+        await self._attach(reader, writer)
+
+    async def _attach(self, reader, writer):
+        """Serve a connected peer until it goes away."""
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            # Small frequent messages, send them right away
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._writer = writer
+        self.connected.set()
+        try:
+            while True:
+                msg_type, length = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+                payload = await reader.readexactly(length) if length else b''
+                self.inbox.put((msg_type, payload))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writer = None
+            self.connected.clear()
+            self.inbox.put((MSG_DISCONNECT, b''))
+            writer.close()
+
+    def _write(self, frame: bytes):
+        if self._writer is not None and not self._writer.is_closing():
+            self._writer.write(frame)
+
+    def send(self, msg_type: int, payload: bytes = b''):
+        """Queue a message for the peer, dropped while not connected."""
+        frame = _FRAME.pack(msg_type, len(payload)) + payload
+        self._loop.call_soon_threadsafe(self._write, frame)
+
+    def send_start(self):
+        self.send(MSG_START)
+
+    def send_board(self, board: Board, piece: Optional[Piece], score: int, lines: int):
+        self.send(MSG_BOARD, encode_board_delta(board, piece, score, lines))
+
+    def send_garbage(self, lines: int):
+        self.send(MSG_GARBAGE, _GARBAGE.pack(lines))
+
+    def send_game_over(self):
+        self.send(MSG_GAME_OVER)
+
+    @staticmethod
+    def garbage_lines(payload: bytes) -> int:
+        return _GARBAGE.unpack(payload)[0]
+
+    def poll(self) -> List[Tuple[int, bytes]]:
+        """Get every message received since the last poll."""
+        messages = []
+        while True:
+            try:
+                messages.append(self.inbox.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def close(self):
+        """Disconnect and stop the network thread."""
+        if self._loop.is_closed():
+            return
+
+        async def shutdown():
+            if self._server:
+                self._server.close()
+            if self._writer:
+                self._writer.close()
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._loop.stop()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop)
+        self._thread.join(timeout=2)
+        if not self._thread.is_alive():
+            self._loop.close()
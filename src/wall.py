@@ -0,0 +1,268 @@
+"""
+Wall module for Tetrix.
+Renders many games at once as a grid of downscaled boards, for watching
+bot, replay or broadcast games side by side.
+
+Each tile keeps its board's locked stack on a cached layer and repaints
+only the rows whose cells changed. Blocks come from a shared atlas holding
+one small sprite per color at the wall's block size, so drawing a board
+costs one blit for the stack plus one per falling piece cell.
+
+Watch several broadcasts with `python -m src.wall HOST:PORT HOST:PORT ...`.
+"""
+
+import math
+import pygame
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .spectate import GAME_OVER
+
+STACK_COLOR = (128, 128, 128)  # filled cells without a color
+
+
+def _to_display(surface: pygame.Surface) -> pygame.Surface:
+    """Match the display's pixel format once a window exists, for fast blits."""
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return surface.convert()
+    return surface
+
+
+class BlockAtlas:
+    """
+    Block sprites for one block size, packed side by side on one surface.
+    """
+
+    def __init__(self, block_size: int):
+        self.block_size = block_size
+        self.surface = _to_display(pygame.Surface((block_size * 16, block_size)))
+        self.areas: Dict[Tuple[int, int, int], pygame.Rect] = {}
+
+    def area(self, color) -> pygame.Rect:
+        """Area of the sprite for color, drawing it on first use."""
+        color = tuple(color)
+        area = self.areas.get(color)
+        if area is None:
+            area = self._add(color)
+        return area
+
+    def _add(self, color) -> pygame.Rect:
+        size = self.block_size
+        x = len(self.areas) * size
+        if x + size > self.surface.get_width():
+            grown = _to_display(pygame.Surface((self.surface.get_width() * 2, size)))
+            grown.blit(self.surface, (0, 0))
+            self.surface = grown
+
+        area = pygame.Rect(x, 0, size, size)
+        pygame.draw.rect(self.surface, color, area)
+        # Shading scaled down from Renderer._draw_block, flat below 5 pixels
+        if size >= 5:
+            lighter = tuple(min(255, c + 100) for c in color)
+            darker = tuple(max(0, c - 80) for c in color)
+            right, bottom = x + size - 1, size - 1
+            pygame.draw.lines(self.surface, lighter, False, [(x, bottom), (x, 0), (right, 0)])
+            pygame.draw.lines(self.surface, darker, False, [(x, bottom), (right, bottom), (right, 0)])
+        if size >= 9:
+            inset = size // 4
+            mid_color = tuple(min(255, c + 30) for c in color)
+            pygame.draw.rect(self.surface, mid_color, area.inflate(-inset * 2, -inset * 2))
+
+        self.areas[color] = area
+        return area
+
+
+class _Tile:
+    """Cached stack layer of one board."""
+
+    def __init__(self, width: int, height: int, block_size: int):
+        self.layer = _to_display(pygame.Surface((width * block_size, height * block_size)))
+        self.grid_rows: List[Optional[list]] = [None] * height  # cells last painted
+        self.color_rows: List[Optional[list]] = [None] * height
+        self.label = None  # (score, rendered surface)
+
+
+class BoardWall:
+    """
+    Draws a list of games, anything with a board, current_piece and
+    scoring like Game or SpectatorView, in a grid on the renderer's screen.
+    """
+
+    GAP = 6  # pixels between tiles
+    LABEL_HEIGHT = 14  # score line under each board
+
+    def __init__(self, renderer, rect: Optional[pygame.Rect] = None):
+        self.renderer = renderer
+        self.rect = rect or renderer.screen.get_rect()
+        self.block_size = 0
+        self.columns = 0
+        self.positions: List[Tuple[int, int]] = []
+        self.tiles: List[_Tile] = []
+        self._atlases: Dict[int, BlockAtlas] = {}
+        self._layout_key = None
+        self._theme = None
+        self._font = None
+        self._overlay = None
+
+    def layout(self, count: int, board_width: int, board_height: int):
+        """Pick the column count giving the largest blocks, and place the tiles."""
+        best = (0, 1)
+        for columns in range(1, count + 1):
+            rows = math.ceil(count / columns)
+            fit_w = (self.rect.width - self.GAP * (columns + 1)) // (columns * board_width)
+            fit_h = (self.rect.height - (self.GAP + self.LABEL_HEIGHT) * rows - self.GAP) // (rows * board_height)
+            size = min(fit_w, fit_h)
+            if size > best[0]:
+                best = (size, columns)
+        self.block_size, self.columns = max(best[0], 1), best[1]
+
+        tile_w = board_width * self.block_size
+        tile_h = board_height * self.block_size + self.LABEL_HEIGHT
+        self.positions = [
+            (self.rect.x + self.GAP + (i % self.columns) * (tile_w + self.GAP),
+             self.rect.y + self.GAP + (i // self.columns) * (tile_h + self.GAP))
+            for i in range(count)
+        ]
+        self.tiles = [_Tile(board_width, board_height, self.block_size) for _ in range(count)]
+        self._layout_key = (count, board_width, board_height)
+        self._overlay = None
+
+    def atlas(self) -> BlockAtlas:
+        """The shared sprite atlas for the current block size."""
+        atlas = self._atlases.get(self.block_size)
+        if atlas is None:
+            atlas = self._atlases[self.block_size] = BlockAtlas(self.block_size)
+        return atlas
+
+    def _stack_color(self, color):
+        if self.renderer.current_theme_name == 'RETRO':
+            return self.renderer.PIECE_COLORS['T']
+        return color or STACK_COLOR
+
+    def _paint_rows(self, tile: _Tile, board) -> int:
+        """Repaint the rows of a tile's layer that changed, returns how many did."""
+        size = self.block_size
+        atlas = self.atlas()
+        empty = self.renderer.COLOR_PANEL
+        painted = 0
+        for y, (grid_row, color_row) in enumerate(zip(board.grid, board.colors)):
+            if tile.grid_rows[y] == grid_row and tile.color_rows[y] == color_row:
+                continue
+            tile.grid_rows[y] = list(grid_row)
+            tile.color_rows[y] = list(color_row)
+            painted += 1
+
+            tile.layer.fill(empty, (0, y * size, tile.layer.get_width(), size))
+            tile.layer.blits([
+                (atlas.surface, (x * size, y * size), atlas.area(self._stack_color(color)))
+                for x, (filled, color) in enumerate(zip(grid_row, color_row)) if filled
+            ], doreturn=False)
+        return painted
+
+    def _label(self, tile: _Tile, score: int) -> pygame.Surface:
+        if tile.label is None or tile.label[0] != score:
+            if self._font is None:
+                self._font = pygame.font.Font(None, self.LABEL_HEIGHT + 4)
+            tile.label = (score, self._font.render(str(score), True, self.renderer.COLOR_TEXT_WHITE))
+        return tile.label[1]
+
+    def draw(self, games: Sequence):
+        """Draw every game, laying the wall out again when the games change shape."""
+        if not games:
+            return
+        board = games[0].board
+        if self._layout_key != (len(games), board.WIDTH, board.HEIGHT):
+            self.layout(len(games), board.WIDTH, board.HEIGHT)
+        if self._theme != self.renderer.current_theme_name:
+            # Theme colors are baked into the layers and sprites
+            self._theme = self.renderer.current_theme_name
+            self._atlases.clear()
+            for tile in self.tiles:
+                tile.grid_rows = [None] * len(tile.grid_rows)
+                tile.label = None
+
+        size = self.block_size
+        atlas = self.atlas()
+        screen = self.renderer.screen
+        blits = []
+        game_over = []
+        layout_size = self._layout_key[1:]
+        for game, tile, (x, y) in zip(games, self.tiles, self.positions):
+            if (game.board.WIDTH, game.board.HEIGHT) != layout_size:
+                continue  # Mixed board sizes are not laid out, skip the odd one
+            self._paint_rows(tile, game.board)
+            blits.append((tile.layer, (x, y)))
+
+            piece = game.current_piece
+            if piece is not None:
+                area = atlas.area(self.renderer.PIECE_COLORS.get(piece.shape_type, piece.color))
+                for col, row in piece.get_positions():
+                    if row >= 0:
+                        blits.append((atlas.surface, (x + col * size, y + row * size), area))
+
+            scoring = getattr(game, 'scoring', None)
+            if scoring is not None:
+                blits.append((self._label(tile, scoring.score), (x, y + tile.layer.get_height() + 1)))
+            if getattr(game, 'state', None) == GAME_OVER:
+                game_over.append((x, y))
+        screen.blits(blits, doreturn=False)
+
+        if game_over:
+            if self._overlay is None:
+                self._overlay = pygame.Surface(self.tiles[0].layer.get_size(), pygame.SRCALPHA)
+                self._overlay.fill((0, 0, 0, 160))
+            screen.blits([(self._overlay, position) for position in game_over], doreturn=False)
+
+
+def watch_many(addresses: List[Tuple[str, int]], width: int = 1280, height: int = 720):
+    """Open a window showing several broadcast games at once."""
+    from .renderer import Renderer
+    from .settings import Settings
+    from .spectate import SpectatorClient, SpectatorView
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((width, height))
+    pygame.display.set_caption(f'Tetrix - watching {len(addresses)} games')
+    clock = pygame.time.Clock()
+    renderer = Renderer(screen, Settings())
+    wall = BoardWall(renderer)
+    views = [SpectatorView() for _ in addresses]
+    clients = [SpectatorClient(host, port) for host, port in addresses]
+
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+
+        for client, view in zip(clients, views):
+            for frame in client.poll():
+                if frame is not None:  # A finished stream keeps its last picture
+                    view.apply(*frame)
+
+        screen.fill(renderer.COLOR_BG)
+        wall.draw(views)
+        pygame.display.flip()
+        clock.tick(60)
+
+    for client in clients:
+        client.close()
+    pygame.quit()
+
+
+def main():
+    import sys
+    addresses = []
+    for arg in sys.argv[1:]:
+        host, _, port = arg.rpartition(':')
+        if not host or not port.isdigit():
+            addresses = []
+            break
+        addresses.append((host, int(port)))
+    if not addresses:
+        print("Usage: python -m src.wall HOST:PORT [HOST:PORT ...]")
+        sys.exit(1)
+    watch_many(addresses)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Tests for the asset archive.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import tempfile
+import unittest
+import wave
+from array import array
+from src.assets import AssetArchive, pack, pcm_name
+
+class TestAssetArchive(unittest.TestCase):
+
+    def test_pack_and_read(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, 'sounds'))
+            os.makedirs(os.path.join(tmp, 'images'))
+            with open(os.path.join(tmp, 'sounds', 'a.wav'), 'wb') as f:
+                f.write(b'RIFF-a')
+            with open(os.path.join(tmp, 'images', 'b.png'), 'wb') as f:
+                f.write(b'\x89PNG-b')
+            with open(os.path.join(tmp, 'images', '.gitkeep'), 'wb') as f:
+                f.write(b'')
+
+            out = os.path.join(tmp, 'assets.pak')
+            self.assertEqual(pack(tmp, out), 2)
+
+            archive = AssetArchive(out)
+            self.assertEqual(bytes(archive.get('sounds/a.wav')), b'RIFF-a')
+            self.assertEqual(archive.open('images/b.png').read(), b'\x89PNG-b')
+            self.assertNotIn('images/.gitkeep', archive)
+            self.assertIsNone(archive.get('sounds/missing.wav'))
+
+    def test_wav_samples_packed_raw(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, 'sounds'))
+            with wave.open(os.path.join(tmp, 'sounds', 'beep.wav'), 'wb') as w:
+                w.setnchannels(1)
+                w.setsampwidth(2)
+                w.setframerate(44100)
+                w.writeframes(array('h', [1, -2, 300]).tobytes())
+            with wave.open(os.path.join(tmp, 'sounds', 'slow.wav'), 'wb') as w:
+                w.setnchannels(1)
+                w.setsampwidth(2)
+                w.setframerate(22050)
+                w.writeframes(b'\0\0')
+
+            out = os.path.join(tmp, 'assets.pak')
+            self.assertEqual(pack(tmp, out), 2)
+            archive = AssetArchive(out)
+            # Mono doubled to the mixer's stereo, read straight from the mapping
+            samples = archive.get(pcm_name('sounds/beep.wav'))
+            self.assertIsInstance(samples, memoryview)
+            self.assertEqual(list(array('h', bytes(samples))), [1, 1, -2, -2, 300, 300])
+            # Other rates stay WAV only
+            self.assertIsNone(archive.get('sounds/slow.pcm'))
+            self.assertIn('sounds/slow.wav', archive)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Tests for bots and headless simulations.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from src.board import Board
+from src.piece import Piece
+from src.autoplay import (evaluate, placements, drop_cells, HeuristicBot, RandomBot,
+                          Simulation)
+
+class TestAutoplay(unittest.TestCase):
+
+    def test_evaluate_features(self):
+        board = Board()
+        # Bottom row full but for column 9, a hole under column 1
+        board.grid[19] = [1] * 9 + [0]
+        board.grid[18][0] = 1
+        board.grid[17][1] = 1
+        features = evaluate(board.grid, [])
+        self.assertEqual(features['lines'], 0)
+        self.assertEqual(features['holes'], 1)
+        self.assertEqual(features['height'], 2 + 3 + 7)
+
+        # A vertical I in the last column clears the bottom row
+        cells, distance = drop_cells(board, Piece('I'), 1, 7)
+        self.assertEqual(distance, 16)
+        features = evaluate(board.grid, cells)
+        self.assertEqual(features['lines'], 1)
+        self.assertEqual(features['holes'], 1)
+        self.assertEqual(features['height'], 1 + 2 + 3)
+
+    def test_placements_cover_every_column(self):
+        board = Board()
+        # The O looks the same in every rotation: 9 distinct placements
+        self.assertEqual(len(placements(board, Piece('O'))), 9)
+        # Flat and upright I: 7 + 10
+        self.assertEqual(len(placements(board, Piece('I'))), 17)
+
+    def test_seeded_games_replay_and_bot_clears_lines(self):
+        first = Simulation(42).play(RandomBot(1))
+        second = Simulation(42).play(RandomBot(1))
+        self.assertTrue(first.over)
+        self.assertEqual((first.pieces, first.scoring.score), (second.pieces, second.scoring.score))
+
+        game = Simulation(42).play(HeuristicBot(), max_pieces=100)
+        self.assertEqual(game.pieces, 100)
+        self.assertFalse(game.over)
+        self.assertGreater(game.scoring.lines_cleared, 20)
+
+if __name__ == '__main__':
+    unittest.main()
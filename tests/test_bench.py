@@ -0,0 +1,39 @@
+"""
+Tests for the benchmark suite.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from src.bench import measure, compare, make_board, copy_board, FILLS
+
+def run(results):
+    return {'results': {name: {'ns': ns, 'median_ns': ns, 'loops': 1} for name, ns in results.items()}}
+
+class TestBench(unittest.TestCase):
+
+    def test_regressions_over_threshold_are_flagged(self):
+        baseline = run({'a': 100.0, 'b': 100.0, 'c': 100.0})
+        current = run({'a': 105.0, 'b': 130.0, 'd': 50.0})
+        changes = {c['name']: c for c in compare(baseline, current, threshold=0.10)}
+
+        self.assertEqual(set(changes), {'a', 'b'})  # only benchmarks in both runs
+        self.assertFalse(changes['a']['regression'])
+        self.assertTrue(changes['b']['regression'])
+        self.assertAlmostEqual(changes['b']['change'], 0.3)
+
+    def test_prepared_state_is_fresh_per_call(self):
+        board = make_board('half')
+        self.assertEqual(sum(map(any, board.grid)), FILLS['half'])
+        cleared = []
+        result = measure(lambda b: cleared.append(b.clear_lines()), lambda: copy_board(board),
+                         min_time=0.001, repeat=2)
+        self.assertGreater(result['ns'], 0)
+        # Boards with holes in every row never clear, the original is untouched
+        self.assertEqual(set(cleared), {0})
+        self.assertEqual(sum(map(any, board.grid)), FILLS['half'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import unittest
-from src.board import Board
+from src.board import Board, parse_size
 from src.piece import Piece
 
 class TestBoard(unittest.TestCase):
@@ -48,5 +48,59 @@ class TestBoard(unittest.TestCase):
         # Check if line was cleared
         self.assertEqual(board.grid[Board.HEIGHT - 1], [0] * Board.WIDTH)
 
+    def test_row_versions(self):
+        board = Board()
+        piece = Piece('O')
+        piece.position = [0, 18]
+        board.place_piece(piece)
+        self.assertEqual(board.version, 1)
+        self.assertEqual([y for y, v in enumerate(board.row_versions) if v], [18, 19])
+        for x in range(Board.WIDTH):
+            board.grid[Board.HEIGHT - 1][x] = 1
+        board.clear_lines()
+        # Everything above the cleared row moved down
+        self.assertEqual(board.row_versions, [2] * Board.HEIGHT)
+
+    def test_add_garbage(self):
+        board = Board()
+        self.assertTrue(board.add_garbage(2, hole=3))
+        self.assertEqual(board.grid[Board.HEIGHT - 1][3], 0)
+        self.assertEqual(sum(board.grid[Board.HEIGHT - 2]), Board.WIDTH - 1)
+
+        # Blocks pushed out of the top end the game
+        board.grid[0][0] = 1
+        self.assertFalse(board.add_garbage(1, hole=0))
+
+    def test_custom_size(self):
+        board = Board(40, 400)
+        self.assertEqual((len(board.grid), len(board.grid[0])), (400, 40))
+        self.assertEqual(board.spawn_position(), [18, 0])
+        self.assertEqual((Board.WIDTH, Board.HEIGHT), (10, 20))
+
+        board.grid[399] = [1] * 40
+        board.grid[398][5] = 1
+        self.assertEqual(board.get_filled_lines(), [399])
+        self.assertEqual(board.clear_lines(), 1)
+        self.assertEqual(board.grid[399][5], 1)
+
+        self.assertEqual(parse_size('40x400'), (40, 400))
+        with self.assertRaises(ValueError):
+            parse_size('40')
+        with self.assertRaises(ValueError):
+            parse_size('2x20')
+
+    def test_drop_distance(self):
+        board = Board()
+        piece = Piece('T')
+        piece.position = [0, 0]
+        ghost = piece.clone()
+        while board.is_valid_position(ghost, 0, 1):
+            ghost.move(0, 1)
+        self.assertEqual(board.drop_distance(piece), ghost.position[1])
+
+        # Lands on a cell under its right arm
+        board.grid[10][2] = 1
+        self.assertEqual(board.drop_distance(piece), 8)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+Tests for the bot control API.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from types import SimpleNamespace
+from src.board import Board
+from src.piece import Piece
+from src.input_handler import Action
+from src.rotation import get_system
+from src.autoplay import HeuristicBot, Simulation, memory_scoring
+from src.control import (BotController, Placement, observe, placement_actions, play,
+                         to_actions)
+
+class TestControl(unittest.TestCase):
+
+    def make_game(self):
+        piece = Piece('T')
+        piece.position = [3, 0]
+        return SimpleNamespace(board=Board(), current_piece=piece, next_piece=Piece('I'),
+                               held_piece=None, can_hold=True, pieces=4, scoring=memory_scoring(),
+                               rotation=get_system('srs'))
+
+    def test_observation_is_a_copy(self):
+        game = self.make_game()
+        observation = observe(game)
+        self.assertEqual((observation.width, observation.height), (Board.WIDTH, Board.HEIGHT))
+        self.assertEqual((observation.piece, observation.rotation, observation.x), ('T', 0, 3))
+        self.assertEqual(observation.cells, game.current_piece.get_positions())
+        self.assertEqual(observation.next_piece, 'I')
+        self.assertEqual(observation.pieces, 4)
+        self.assertEqual(observation.rotation_system, 'srs')
+        observation.grid[19][0] = 1
+        self.assertEqual(game.board.grid[19][0], 0)
+
+    def test_placement_rotates_then_shifts_and_drops(self):
+        observation = observe(self.make_game())
+        self.assertEqual(placement_actions(observation, Placement(2, 0)), {Action.ROTATE: 2})
+        self.assertEqual(placement_actions(observation, Placement(0, 0)),
+                         {Action.MOVE_LEFT: 3, Action.DROP: 1})
+        self.assertEqual(placement_actions(observation, Placement(0, 3)), {Action.DROP: 1})
+        # A rotation that did not happen is not retried
+        self.assertEqual(placement_actions(observation, Placement(1, 5), rotated=True),
+                         {Action.MOVE_RIGHT: 2, Action.DROP: 1})
+        self.assertEqual(placement_actions(observation, Placement(1, 5, hold=True)), {Action.HOLD: 1})
+
+    def test_to_actions(self):
+        self.assertEqual(to_actions(None), {})
+        self.assertEqual(to_actions(Action.DROP), {Action.DROP: 1})
+        self.assertEqual(to_actions([Action.MOVE_LEFT, Action.MOVE_LEFT, Action.ROTATE]),
+                         {Action.MOVE_LEFT: 2, Action.ROTATE: 1})
+        self.assertEqual(to_actions({Action.MOVE_DOWN: 0, Action.DROP: 1}), {Action.DROP: 1})
+
+    def test_game_plays_like_the_simulation(self):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        results = play(BotController(HeuristicBot()), games=1, max_pieces=60, seed=3)
+        simulation = Simulation(3).play(HeuristicBot(), 60)
+        self.assertEqual(results[0]['pieces'], 60)
+        self.assertEqual(results[0]['lines'], simulation.scoring.lines_cleared)
+
+    def test_bot_lists_placements_with_the_game_system(self):
+        class Stub:
+            def choose(self, board, piece, next_piece, system=None):
+                self.system = system
+                return (0, 3)
+
+        stub = Stub()
+        self.assertEqual(BotController(stub).act(observe(self.make_game())), Placement(0, 3))
+        self.assertIs(stub.system, get_system('srs'))
+
+    def test_bot_reaches_its_placements_with_srs(self):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        reached = {}
+
+        class Recorder(BotController):
+            def act(self, observation):
+                result = super().act(observation)
+                # The last tick of each piece is the one it drops on
+                reached[observation.pieces] = (result.rotation, observation.rotation,
+                                               observation.rotation_system)
+                return result
+
+        results = play(Recorder(HeuristicBot()), games=1, max_pieces=60, seed=3, rotation_system='srs')
+        self.assertEqual(results[0]['pieces'], 60)
+        self.assertEqual(len(reached), 60)
+        for wanted, rotation, system in reached.values():
+            self.assertEqual(system, 'srs')
+            # Placements listed with the game's system are reached by its rotations
+            self.assertEqual(wanted, rotation)
+
+if __name__ == '__main__':
+    unittest.main()
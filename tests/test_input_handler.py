@@ -0,0 +1,85 @@
+"""
+Tests for InputHandler class.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+import pygame
+from src.input_handler import InputHandler, Action
+
+def key_down(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+def key_up(key):
+    return pygame.event.Event(pygame.KEYUP, key=key)
+
+class TestInputHandler(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pygame.init()
+
+    def test_tap_shorter_than_frame(self):
+        handler = InputHandler()
+        handler.handle_events([key_down(pygame.K_LEFT)], now=100)
+        handler.handle_events([key_up(pygame.K_LEFT)], now=105)
+        handler.update(now=116)
+        self.assertEqual(handler.get_count(Action.MOVE_LEFT), 1)
+        self.assertFalse(handler.is_action_pressed(Action.MOVE_LEFT))
+
+        handler.update(now=133)
+        self.assertEqual(handler.get_actions(), {})
+
+    def test_das_and_arr(self):
+        handler = InputHandler(das=200, arr=50)
+        handler.handle_events([key_down(pygame.K_RIGHT)], now=0)
+        handler.update(now=10)
+        self.assertEqual(handler.get_count(Action.MOVE_RIGHT), 1)
+        handler.update(now=199)
+        self.assertEqual(handler.get_count(Action.MOVE_RIGHT), 0)
+        # DAS fires at 200, then repeats at 250 and 300
+        handler.update(now=300)
+        self.assertEqual(handler.get_count(Action.MOVE_RIGHT), 3)
+
+    def test_zero_arr_shifts_to_wall(self):
+        handler = InputHandler(das=100, arr=0)
+        handler.handle_events([key_down(pygame.K_LEFT)], now=0)
+        handler.update(now=0)
+        handler.update(now=120)
+        self.assertEqual(handler.get_count(Action.MOVE_LEFT), InputHandler.INSTANT)
+        handler.update(now=136)
+        self.assertEqual(handler.get_count(Action.MOVE_LEFT), InputHandler.INSTANT)
+
+    def test_long_hold_keeps_repeat_rate(self):
+        handler = InputHandler()
+        handler.handle_events([key_down(pygame.K_DOWN)], now=0)
+        handler.update(now=50000)
+        # Past a thousand soft drops, frames still get 0 or 1 of them
+        counts = []
+        for now in range(50016, 50116, 16):
+            handler.update(now=now)
+            counts.append(handler.get_count(Action.MOVE_DOWN))
+        self.assertEqual(counts, [0, 0, 0, 1, 0, 0, 1])
+
+    def test_last_direction_wins(self):
+        handler = InputHandler()
+        handler.handle_events([key_down(pygame.K_LEFT)], now=0)
+        handler.update(now=0)
+        handler.handle_events([key_down(pygame.K_RIGHT)], now=10)
+        handler.update(now=500)
+        self.assertEqual(handler.get_count(Action.MOVE_LEFT), 0)
+        self.assertGreater(handler.get_count(Action.MOVE_RIGHT), 0)
+
+    def test_custom_bindings(self):
+        bindings = InputHandler.parse_bindings({'ROTATE': ['x']})
+        handler = InputHandler(bindings)
+        handler.handle_events([key_down(pygame.K_UP), key_down(pygame.K_x)], now=0)
+        handler.update(now=0)
+        self.assertEqual(handler.get_actions(), {Action.ROTATE: 1})
+
+if __name__ == '__main__':
+    unittest.main()
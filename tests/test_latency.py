@@ -0,0 +1,50 @@
+"""
+Tests for latency instrumentation.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import json
+import subprocess
+import tempfile
+import unittest
+from src.input_handler import Action
+from src.latency import LatencyHistogram, LatencyTracker
+
+class TestLatency(unittest.TestCase):
+
+    def test_histogram_percentiles(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 101):
+            histogram.add(ms)
+        self.assertEqual(histogram.count, 100)
+        self.assertAlmostEqual(histogram.percentile(50), 50.5)
+        self.assertEqual(histogram.percentile(100), 100)
+
+    def test_tracker_closes_samples_on_present(self):
+        tracker = LatencyTracker()
+        tracker.applied({Action.ROTATE: 1.000})
+        tracker.presented(now=1.010)
+        tracker.presented(now=2.000)  # nothing pending, no new sample
+        summary = tracker.summary()
+        self.assertEqual(summary['ROTATE']['count'], 1)
+        self.assertAlmostEqual(summary['ROTATE']['max'], 10.0, places=2)
+
+    def test_synthetic_benchmark_leaves_player_data_alone(self):
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, 'data'))
+            with open(os.path.join(tmp, 'data', 'settings.json'), 'w') as f:
+                json.dump({'telemetry': True}, f)
+            # Drops every frame, the game tops out and restarts
+            code = ("from src.latency import run_synthetic_benchmark; "
+                    "assert run_synthetic_benchmark(150, 1)")
+            env = dict(os.environ, PYTHONPATH=root, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy')
+            result = subprocess.run([sys.executable, '-c', code], cwd=tmp, env=env, capture_output=True)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertEqual(sorted(os.listdir(os.path.join(tmp, 'data'))), ['settings.json'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Tests for the leaderboard server and client over loopback.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import asyncio
+import json
+import tempfile
+import time
+import unittest
+from src.leaderboard import LeaderboardServer, LeaderboardClient
+
+async def request(port, *messages):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    responses = []
+    for message in messages:
+        writer.write(json.dumps(message).encode() + b'\n')
+        await writer.drain()
+        responses.append(json.loads(await reader.readline()))
+    writer.close()
+    return responses
+
+class TestLeaderboard(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'leaderboard.db')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_submit_top_and_rank(self):
+        async def scenario():
+            server = LeaderboardServer(self.db_path, port=0)
+            await server.start()
+            submits = [{'op': 'submit', 'score': s, 'level': 1, 'lines': 0} for s in (300, 1200, 800)]
+            responses = await asyncio.gather(*(request(server.port, m) for m in submits))
+            top, rank = await request(server.port, {'op': 'top', 'n': 2}, {'op': 'rank', 'score': 900})
+            await server.stop()
+            return responses, top, rank, server.db.count()
+
+        responses, top, rank, stored = asyncio.run(scenario())
+        self.assertTrue(all(r[0]['ok'] for r in responses))
+        self.assertEqual([e['score'] for e in top['scores']], [1200, 800])
+        self.assertEqual((rank['rank'], rank['total']), (2, 3))
+        self.assertEqual(stored, 3)
+
+    def test_submitted_date_and_duplicate_ids(self):
+        async def scenario():
+            server = LeaderboardServer(self.db_path, port=0)
+            await server.start()
+            game = {'op': 'submit', 'score': 700, 'level': 2, 'lines': 9,
+                    'date': '2024-05-01 18:30', 'id': 'a1'}
+            first, resent = await request(server.port, game, game)
+            late = (await request(server.port, {'op': 'submit', 'score': 100, 'date': 'yesterday'}))[0]
+            top = (await request(server.port, {'op': 'top', 'n': 5}))[0]
+            await server.stop()
+            return first, resent, late, top, server.db.count()
+
+        first, resent, late, top, stored = asyncio.run(scenario())
+        self.assertTrue(first['ok'] and resent['ok'] and late['ok'])
+        self.assertTrue(resent.get('duplicate'))
+        self.assertEqual(stored, 2)
+        self.assertEqual(top['scores'][0]['date'], '2024-05-01 18:30')
+
+        # Ids survive a server restart
+        async def restart():
+            server = LeaderboardServer(self.db_path, port=0)
+            await server.start()
+            again = await request(server.port, {'op': 'submit', 'score': 700, 'id': 'a1'})
+            await server.stop()
+            return again[0], server.db.count()
+
+        again, stored = asyncio.run(restart())
+        self.assertTrue(again.get('duplicate'))
+        self.assertEqual(stored, 2)
+
+    def test_malformed_requests_get_errors(self):
+        async def scenario():
+            server = LeaderboardServer(self.db_path, port=0)
+            await server.start()
+            replies = await request(server.port, [1], "x", {'op': 'submit', 'score': 'high'},
+                                    {'op': 'rank', 'score': 10})
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            writer.write(b'{"op": "top", "pad": "' + b'x' * 100000 + b'"}\n')
+            await writer.drain()
+            too_long = json.loads(await reader.readline())
+            writer.close()
+            await server.stop()
+            return replies, too_long
+
+        replies, too_long = asyncio.run(scenario())
+        self.assertEqual([r['ok'] for r in replies], [False, False, False, True])
+        self.assertFalse(too_long['ok'])
+
+    def test_client_queues_while_offline(self):
+        queue_file = os.path.join(self.tmp.name, 'queue.json')
+        client = LeaderboardClient('127.0.0.1', 1, queue_file=queue_file)
+        client.submit({'score': 500, 'level': 2, 'lines': 12})
+        time.sleep(0.3)
+        client.close()
+        with open(queue_file) as f:
+            queued = json.load(f)
+        self.assertEqual([e['score'] for e in queued], [500])
+        self.assertTrue(queued[0]['id'])
+
+if __name__ == '__main__':
+    unittest.main()
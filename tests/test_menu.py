@@ -0,0 +1,100 @@
+"""
+Tests for the cached menu screens.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from types import SimpleNamespace
+import pygame
+from src.autoplay import memory_scoring
+from src.menu import MainMenu
+from src.renderer import Renderer
+
+class TestMainMenu(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pygame.init()
+
+    def setUp(self):
+        screen = pygame.display.set_mode((600, 700))
+        settings = SimpleNamespace(get=lambda key: 'NEON', set=lambda key, value: None)
+        self.renderer = Renderer(screen, settings)
+        self.scoring = memory_scoring()
+        self.menu = MainMenu(screen, self.renderer, self.scoring, SimpleNamespace(play=lambda name: None))
+
+        # Count the builds of every cached screen
+        self.builds = {'MAIN': 0, 'SCORES': 0, 'THEMES': 0}
+        for name, method in (('MAIN', '_build_main_menu'), ('SCORES', '_build_high_scores'),
+                             ('THEMES', '_build_themes')):
+            build = getattr(self.menu, method)
+            setattr(self.menu, method, self.counting(name, build))
+
+    def counting(self, name, build):
+        def wrapper(surface):
+            self.builds[name] += 1
+            build(surface)
+        return wrapper
+
+    def draw(self, state, frames=3):
+        self.menu.menu_state = state
+        for _ in range(frames):
+            self.menu.draw()
+
+    def test_unchanged_frames_reuse_layers(self):
+        self.draw('MAIN')
+        self.menu.selected_index = 2  # The highlight is drawn over the layer
+        self.draw('MAIN')
+        self.draw('SCORES')
+        self.draw('THEMES')
+        self.assertEqual(self.builds, {'MAIN': 1, 'SCORES': 1, 'THEMES': 1})
+        # Labels are rendered once, however often they are drawn
+        labels = len(self.menu._text_cache)
+        self.draw('MAIN')
+        self.assertEqual(len(self.menu._text_cache), labels)
+
+    def test_theme_change_rebuilds_every_screen_once(self):
+        for state in ('MAIN', 'SCORES', 'THEMES'):
+            self.draw(state)
+        self.renderer.set_theme('RETRO')
+        for state in ('MAIN', 'SCORES', 'THEMES'):
+            self.draw(state)
+        self.assertEqual(self.builds, {'MAIN': 2, 'SCORES': 2, 'THEMES': 2})
+        # Moving the theme highlight only rebuilds the themes screen
+        self.menu.selected_theme_index = 1
+        for state in ('MAIN', 'SCORES', 'THEMES'):
+            self.draw(state)
+        self.assertEqual(self.builds, {'MAIN': 2, 'SCORES': 2, 'THEMES': 3})
+
+    def test_new_high_score_rebuilds_score_screens(self):
+        self.draw('MAIN')
+        self.draw('SCORES')
+        self.draw('THEMES')
+        self.scoring.score = 1200
+        self.scoring.add_score(0)  # Updates high_score like a game in progress
+        self.scoring.save_high_score()
+        self.assertEqual(self.scoring.scores_version, 1)
+        self.draw('MAIN')
+        self.draw('SCORES')
+        self.draw('THEMES')
+        self.assertEqual(self.builds, {'MAIN': 2, 'SCORES': 2, 'THEMES': 1})
+
+        # A game below the top ten leaves the score list as it was
+        for score in range(100, 1100, 100):
+            self.scoring.reset()
+            self.scoring.score = score
+            self.scoring.save_high_score()
+        self.draw('SCORES')
+        builds = self.builds['SCORES']
+        self.scoring.reset()
+        self.scoring.score = 50
+        self.scoring.save_high_score()
+        self.draw('SCORES')
+        self.assertEqual(self.builds['SCORES'], builds)
+
+if __name__ == '__main__':
+    unittest.main()
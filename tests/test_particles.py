@@ -0,0 +1,60 @@
+"""
+Tests for the array-backed particle system.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from src import particles
+from src.particles import ParticleSystem
+
+@unittest.skipIf(particles.np is None, "NumPy is not installed")
+class TestParticleSystem(unittest.TestCase):
+
+    def test_burst_fills_buffers(self):
+        system = ParticleSystem(capacity=1000)
+        red = (255, 0, 0)
+        system.emit_lines([18, 19], board_width=10, colors=[[red] * 10, [None] * 10], per_cell=2)
+        self.assertEqual(system.count, 40)
+        self.assertTrue(system.is_active())
+
+        n = system.count
+        # Particles start inside the cell they burst from
+        self.assertTrue(((system.pos[:n, 0] >= 0) & (system.pos[:n, 0] < 10)).all())
+        self.assertTrue(((system.pos[:n, 1] >= 18) & (system.pos[:n, 1] < 20)).all())
+        self.assertTrue((system.life[:n] == system.max_life[:n]).all())
+        # Colored cells keep their color, empty ones burst white
+        colors = {system.palette[c] for c in system.color[:n].tolist()}
+        self.assertEqual(colors, {red, (255, 255, 255)})
+
+    def test_capacity_is_never_exceeded(self):
+        system = ParticleSystem(capacity=50)
+        system.emit_lines([0, 1, 2, 3], board_width=10, is_tetris=True)
+        self.assertEqual(system.count, 50)
+        system.emit_lines([5], board_width=10)
+        self.assertEqual(system.count, 50)
+
+    def test_update_moves_and_expires(self):
+        system = ParticleSystem(capacity=100)
+        system.emit_lines([10], board_width=10, per_cell=1)
+        n = system.count
+        start = system.pos[:n].copy()
+        # Half the particles expire on the next step, the rest survive compacted
+        system.life[:n:2] = 0.001
+        system.life[1:n:2] = 5.0
+        system.last_update -= 0.05
+        system.update()
+        self.assertEqual(system.count, n // 2)
+        self.assertTrue((system.life[:system.count] > 4.0).all())
+        self.assertFalse((system.pos[:system.count] == start[1:n:2]).all())
+
+        system.life[:system.count] = 0.001
+        system.last_update -= 0.05
+        system.update()
+        self.assertEqual(system.count, 0)
+        self.assertFalse(system.is_active())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+"""
+Tests for PersistenceService.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import json
+import tempfile
+import time
+import unittest
+from src.persistence import PersistenceService, write_json_atomic
+
+class TestPersistence(unittest.TestCase):
+
+    def test_schedule_coalesces_writes(self):
+        service = PersistenceService(debounce=0.05)
+        written = []
+        for value in range(5):
+            service.schedule('settings', written.append, value)
+        time.sleep(0.2)
+        self.assertEqual(written, [4])
+        service.close()
+
+    def test_flush_runs_pending_jobs(self):
+        service = PersistenceService(debounce=10)
+        written = []
+        service.schedule('settings', written.append, 'theme')
+        service.submit(written.append, 'game')
+        service.close()
+        self.assertCountEqual(written, ['theme', 'game'])
+
+    def test_write_json_atomic(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data', 'settings.json')
+            write_json_atomic(path, {'theme': 'RETRO'})
+            with open(path) as f:
+                self.assertEqual(json.load(f), {'theme': 'RETRO'})
+            self.assertEqual(os.listdir(os.path.dirname(path)), ['settings.json'])
+
+if __name__ == '__main__':
+    unittest.main()
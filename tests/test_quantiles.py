@@ -0,0 +1,56 @@
+"""
+Tests for the KLL quantile sketch and score percentiles.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import random
+import tempfile
+import unittest
+from src.quantiles import KLLSketch, dump_sketches, load_sketches
+from src.score_db import ScoreDatabase
+from src.scoring import Scoring
+
+class TestKLLSketch(unittest.TestCase):
+
+    def test_rank_error_is_small(self):
+        sketch = KLLSketch(seed=1)
+        values = list(range(100000))
+        random.Random(2).shuffle(values)
+        for value in values:
+            sketch.update(value)
+        self.assertLess(sum(len(c) for c in sketch.compactors), 1000)
+        for value in (1000, 25000, 50000, 90000):
+            self.assertAlmostEqual(sketch.fraction_below(value), value / 100000, delta=0.02)
+
+    def test_merge_and_round_trip(self):
+        a, b = KLLSketch(seed=1), KLLSketch(seed=2)
+        for value in range(5000):
+            a.update(value)
+            b.update(value + 5000)
+        a.merge(b)
+        self.assertEqual(a.n, 10000)
+
+        restored = load_sketches(dump_sketches({'score': a}))['score']
+        self.assertEqual(restored.n, 10000)
+        self.assertAlmostEqual(restored.fraction_below(5000), 0.5, delta=0.02)
+        self.assertAlmostEqual(restored.quantile(0.9), 9000, delta=200)
+
+    def test_scoring_percentile_rebuilds_from_history(self):
+        db = ScoreDatabase(':memory:')
+        for score in range(1, 101):
+            db.add_game(score * 10, 1, 0)
+        with tempfile.TemporaryDirectory() as tmp:
+            sketch_file = os.path.join(tmp, 'sketches.bin')
+            scoring = Scoring(db=db, sketch_file=sketch_file)
+            self.assertEqual(scoring.get_percentile(505), 50)
+            self.assertTrue(os.path.exists(sketch_file))
+
+            scoring.score = 2000
+            scoring.save_high_score()
+            self.assertEqual(Scoring(db=db, sketch_file=sketch_file).sketches['score'].n, 101)
+
+if __name__ == '__main__':
+    unittest.main()
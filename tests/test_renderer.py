@@ -0,0 +1,53 @@
+"""
+Tests for the renderer viewport.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import unittest
+import pygame
+from src.board import Board
+from src.piece import Piece
+from src.renderer import Renderer
+
+class TestRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.renderer = Renderer(pygame.Surface((600, 700)), {'theme': 'NEON'})
+
+    def test_standard_board_is_drawn_whole(self):
+        board = Board()
+        piece = Piece('I')
+        piece.position = [3, 15]
+        self.renderer.follow(board, piece)
+        self.assertEqual(self.renderer.block_size, 30)
+        self.assertEqual(self.renderer.viewport, (0, 0, Board.WIDTH, Board.HEIGHT))
+        self.assertEqual(self.renderer.board_origin(), self.renderer.board_offset)
+
+    def test_large_board_follows_the_piece(self):
+        board = Board(40, 400)
+        piece = Piece('T')
+        piece.position = [30, 200]
+        ghost = piece.clone()
+        ghost.position = [30, 220]
+        self.renderer.follow(board, piece, ghost)
+        x0, y0, cols, rows = self.renderer.viewport
+        self.assertEqual(self.renderer.block_size, Renderer.MIN_BLOCK_SIZE)
+        self.assertEqual((cols, rows), (25, 50))
+        # The piece and where it lands are both in view
+        for x, y in piece.get_positions() + ghost.get_positions():
+            self.assertTrue(x0 <= x < x0 + cols and y0 <= y < y0 + rows)
+
+        # Never past the board's edges
+        piece.position = [36, 397]
+        self.renderer.follow(board, piece)
+        self.assertEqual(self.renderer.viewport, (15, 350, 25, 50))
+
+        self.renderer.draw_board(board)
+        self.renderer.draw_piece(piece)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Tests for Monte Carlo rollouts.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from src.board import Board
+from src.piece import Piece
+from src.autoplay import Simulation, RandomBot, placements
+from src.rollout import board_rows, piece_masks, drop, lock, MonteCarloBot
+
+class TestRollout(unittest.TestCase):
+
+    def test_bitboard_matches_board(self):
+        game = Simulation(7)
+        bot = RandomBot(7)
+        rows = board_rows(game.board)
+        full = (1 << Board.WIDTH) - 1
+        for _ in range(30):
+            shape = game.current_piece.shape_type
+            rotation, x = bot.choose(game.board, game.current_piece)
+            masks = piece_masks(shape, rotation, x)
+            rows, cleared = lock(rows, masks, drop(rows, masks), full)
+            self.assertEqual(game.place(rotation, x), cleared)
+            self.assertEqual(rows, board_rows(game.board))
+            if game.over:
+                break
+
+    def test_rollouts_take_the_clear(self):
+        board = Board()
+        for y in (18, 19):
+            board.grid[y] = [1] * 9 + [0]
+        piece = Piece('I')
+        bot = MonteCarloBot(rollouts=4, seed=1)
+        choice = bot.choose(board, piece, Piece('O'))
+        self.assertIn(choice, placements(board, piece))
+        masks = piece_masks('I', *choice)
+        _, cleared = lock(board_rows(board), masks, drop(board_rows(board), masks), (1 << 10) - 1)
+        self.assertEqual(cleared, 2)
+
+if __name__ == '__main__':
+    unittest.main()
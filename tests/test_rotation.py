@@ -0,0 +1,125 @@
+"""
+Tests for the rotation systems.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from src.board import Board
+from src.piece import Piece
+from src.autoplay import placements
+from src.rotation import SYSTEMS, get_system
+
+def make_piece(shape, x, y):
+    piece = Piece(shape)
+    piece.position = [x, y]
+    return piece
+
+def cells(piece):
+    return sorted(map(tuple, piece.get_positions()))
+
+class TestRotation(unittest.TestCase):
+
+    def test_simple_rotates_in_place_or_kicks_one_cell(self):
+        simple = get_system('simple')
+        board = Board()
+        piece = make_piece('T', 3, 0)
+        expected = Piece('T')
+        expected.rotate()
+        self.assertTrue(simple.rotate(board, piece))
+        self.assertEqual((piece.rotation, piece.position), (1, [3, 0]))
+        self.assertEqual([list(row) for row in piece.shape], expected.shape)
+
+        # Vertical I against the right wall kicks one cell left
+        piece = make_piece('I', 7, 0)
+        piece.shape, piece.rotation = SYSTEMS['simple'].table['I', 0, 1][1], 1
+        self.assertTrue(simple.rotate(board, piece))
+        self.assertEqual(piece.position, [6, 0])
+
+        # Nowhere to go, nothing changes
+        board.grid[1] = [1] * Board.WIDTH
+        piece = make_piece('I', 3, 0)
+        self.assertFalse(simple.rotate(board, piece))
+        self.assertEqual((piece.rotation, piece.position), (0, [3, 0]))
+
+    def test_four_turns_return_to_the_start(self):
+        board = Board()
+        for name, system in SYSTEMS.items():
+            for shape in Piece.SHAPES:
+                piece = make_piece(shape, 3, 5)
+                start = cells(piece)
+                for _ in range(4):
+                    self.assertTrue(system.rotate(board, piece), (name, shape))
+                self.assertEqual(cells(piece), start, (name, shape))
+                for _ in range(4):
+                    self.assertTrue(system.rotate(board, piece, -1), (name, shape))
+                self.assertEqual(cells(piece), start, (name, shape))
+
+    def test_srs_centers_and_kicks(self):
+        srs = get_system('srs')
+        board = Board()
+        # T turns around its middle cell, O does not move
+        piece = make_piece('T', 3, 5)
+        center = [c for c in cells(piece) if c[1] == 6 and c[0] == 4]
+        srs.rotate(board, piece)
+        self.assertIn(center[0], cells(piece))
+        piece = make_piece('O', 3, 5)
+        start = cells(piece)
+        srs.rotate(board, piece)
+        self.assertEqual(cells(piece), start)
+
+        # I from spawn to R stands in its box's third column
+        piece = make_piece('I', 3, 0)
+        srs.rotate(board, piece)
+        self.assertEqual(cells(piece), [(5, 0), (5, 1), (5, 2), (5, 3)])
+        # With that column blocked, the first kick moves it two left
+        board.grid[3][5] = 1
+        piece = make_piece('I', 3, 0)
+        srs.rotate(board, piece)
+        self.assertEqual(cells(piece), [(3, 0), (3, 1), (3, 2), (3, 3)])
+
+    def test_ars_pieces_stay_down(self):
+        ars = get_system('ars')
+        board = Board()
+        piece = make_piece('T', 3, 10)
+        bottom = max(y for _, y in cells(piece))
+        for _ in range(4):
+            ars.rotate(board, piece)
+            self.assertEqual(max(y for _, y in cells(piece)), bottom)
+        # Two states for S, the second turn restores the spawn cells
+        piece = make_piece('S', 3, 10)
+        start = cells(piece)
+        ars.rotate(board, piece)
+        ars.rotate(board, piece)
+        self.assertEqual(cells(piece), start)
+
+    def test_try_rotate_changes_nothing(self):
+        board = Board()
+        piece = make_piece('J', 3, 0)
+        grid = [row[:] for row in board.grid]
+        for system in SYSTEMS.values():
+            state, x, y = system.try_rotate(board, 'J', 0, 3, 0)
+            self.assertEqual(state, 1)
+            self.assertEqual((piece.rotation, piece.position), (0, [3, 0]))
+        self.assertEqual(board.grid, grid)
+        self.assertIs(get_system('nonsense'), SYSTEMS['simple'])
+
+    def test_placements_follow_the_system(self):
+        board = Board()
+        for name, system in SYSTEMS.items():
+            found = placements(board, Piece('T'), system)
+            self.assertEqual(len(found), len(set(found)))
+            self.assertEqual({r for r, _ in found}, {0, 1, 2, 3}, name)
+        # I has two distinct orientations on an empty board whatever the system
+        self.assertEqual(len(placements(board, Piece('I'), SYSTEMS['srs'])), 17)
+
+        # Under a nearly full board only SRS kicks a vertical I up out of the way
+        for y in range(2, Board.HEIGHT):
+            board.grid[y] = [1] * Board.WIDTH
+        self.assertEqual({r for r, _ in placements(board, Piece('I'), SYSTEMS['simple'])}, {0})
+        self.assertEqual({r for r, _ in placements(board, Piece('I'), SYSTEMS['srs'])}, {0, 1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+"""
+Tests for ScoreDatabase class.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from datetime import datetime
+from src.score_db import ScoreDatabase
+
+class TestScoreDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.db = ScoreDatabase(':memory:')
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_top_scores_sorted(self):
+        for score in (300, 1200, 40, 800):
+            self.db.add_game(score, 1, 4)
+        top = self.db.top(3)
+        self.assertEqual([e['score'] for e in top], [1200, 800, 300])
+        self.assertEqual(self.db.count(), 4)
+
+    def test_top_per_level_and_day(self):
+        self.db.add_game(500, 2, 10, played_at=datetime(2026, 1, 1, 10, 0))
+        self.db.add_game(900, 3, 20, played_at=datetime(2026, 1, 2, 10, 0))
+        self.db.add_game(700, 2, 15, played_at=datetime(2026, 1, 2, 11, 0))
+
+        self.assertEqual([e['score'] for e in self.db.top(level=2)], [700, 500])
+        day = self.db.top(day='2026-01-02')
+        self.assertEqual([e['score'] for e in day], [900, 700])
+        self.assertEqual(day[0]['date'], '2026-01-02 10:00')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Tests for game snapshots.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import random
+import struct
+import subprocess
+import tempfile
+import unittest
+from types import SimpleNamespace
+from src.board import Board
+from src.piece import Piece
+from src.score_db import ScoreDatabase
+from src.scoring import Scoring
+from src.snapshot import dump_game, restore_game, SNAPSHOT_SIZE_FIXED, VERSION
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_game(self):
+        scoring = Scoring(db=ScoreDatabase(':memory:'),
+                          sketch_file=os.path.join(self.tmp.name, 'sketches.bin'))
+        return SimpleNamespace(
+            board=Board(), current_piece=Piece('I'), next_piece=Piece('O'), held_piece=None,
+            can_hold=True, _pending_clear=False, seed=7, rng=random.Random(7),
+            game_time=0.0, drop_timer=0, scoring=scoring
+        )
+
+    def test_round_trip(self):
+        game = self.make_game()
+        game.board.place_piece(Piece('T'))
+        game.board.grid[19] = [1] * Board.WIDTH
+        game.board.colors[19] = [Piece.COLORS['Z']] * Board.WIDTH
+        game.current_piece = Piece('L')
+        game.current_piece.rotate()
+        game.current_piece.position = [3, 5]
+        game.held_piece = 'S'
+        game.can_hold = False
+        game.rng.random()
+        game.scoring.score = 1234
+        game.scoring.lines_cleared = 12
+        game.scoring.level = 2
+        game.game_time = 61.5
+
+        data = dump_game(game)
+        self.assertEqual(len(data), SNAPSHOT_SIZE_FIXED + Board.WIDTH * Board.HEIGHT)
+
+        resumed = self.make_game()
+        restore_game(resumed, data)
+        self.assertEqual(resumed.board.grid, game.board.grid)
+        self.assertEqual(resumed.board.colors, game.board.colors)
+        self.assertEqual(resumed.current_piece.shape, game.current_piece.shape)
+        self.assertEqual(resumed.current_piece.position, [3, 5])
+        self.assertEqual((resumed.held_piece, resumed.can_hold), ('S', False))
+        self.assertEqual((resumed.scoring.score, resumed.scoring.level), (1234, 2))
+        self.assertEqual(resumed.game_time, 61.5)
+        # The piece sequence continues where it stopped
+        self.assertEqual(resumed.rng.random(), game.rng.random())
+
+    def test_large_board_and_v1_snapshots(self):
+        game = self.make_game()
+        game.board = Board(40, 400)
+        game.board.grid[399][39] = 1
+        game.board.colors[399][39] = Piece.COLORS['T']
+        resumed = self.make_game()
+        restore_game(resumed, dump_game(game))
+        self.assertEqual((resumed.board.WIDTH, resumed.board.HEIGHT), (40, 400))
+        self.assertEqual(resumed.board.grid[399][39], 1)
+
+        # Snapshots from before v2 have u8 board sizes
+        data = dump_game(self.make_game())
+        v1 = data[:4] + struct.pack('<HBB', 1, Board.WIDTH, Board.HEIGHT) + data[10:]
+        self.assertEqual(struct.unpack_from('<H', data, 4), (VERSION,))
+        restore_game(resumed, v1)
+        self.assertEqual((resumed.board.WIDTH, resumed.board.HEIGHT), (Board.WIDTH, Board.HEIGHT))
+
+    def test_bad_snapshot_leaves_game_untouched(self):
+        game = self.make_game()
+        data = bytearray(dump_game(game))
+        data[0:4] = b'XXXX'
+        board = game.board
+        with self.assertRaises(ValueError):
+            restore_game(game, bytes(data))
+        with self.assertRaises(ValueError):
+            restore_game(game, dump_game(game)[:-1])
+        self.assertIs(game.board, board)
+
+    def test_only_asked_games_take_the_snapshot(self):
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        env = dict(os.environ, PYTHONPATH=root, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data', 'snapshot.bin')
+            os.makedirs(os.path.dirname(path))
+            with open(path, 'wb') as f:
+                f.write(b'suspended game')
+            for resume, kept in ((False, True), (True, False)):
+                code = f"from src.game import Game; Game(resume={resume}).close()"
+                result = subprocess.run([sys.executable, '-c', code], cwd=tmp, env=env, capture_output=True)
+                self.assertEqual(result.returncode, 0, result.stderr)
+                self.assertEqual(os.path.exists(path), kept)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,24 @@
+"""
+Tests for the soak test runner.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from src.soak import run_soak
+
+class TestSoak(unittest.TestCase):
+
+    def test_workers_report_every_game(self):
+        report = run_soak(games=3, workers=2, bot='random', max_pieces=50, interval=60,
+                          trace=False, effects=False)
+        totals = report.totals()
+        self.assertEqual(totals['games'], 3)
+        self.assertGreater(totals['pieces'], 0)
+        self.assertEqual(set(report.rss_growth()), {0, 1})
+        self.assertIn('games/s', report.report())
+
+if __name__ == '__main__':
+    unittest.main()
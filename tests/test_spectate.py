@@ -0,0 +1,125 @@
+"""
+Tests for the spectator broadcast.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import time
+import unittest
+from types import SimpleNamespace
+from src.board import Board
+from src.piece import Piece
+from src.spectate import (FrameEncoder, SpectatorView, BroadcastServer, SpectatorClient,
+                          KEYFRAME, DELTA, _Viewer)
+
+def make_game():
+    return SimpleNamespace(
+        board=Board(), current_piece=Piece('T'), next_piece=Piece('I'), held_piece=None,
+        state=1, paused=False, game_time=0.0,
+        scoring=SimpleNamespace(score=0, level=1, lines_cleared=0)
+    )
+
+def split(frame):
+    return frame[0], frame[5:]
+
+class TestSpectate(unittest.TestCase):
+
+    def test_keyframe_then_deltas(self):
+        game = make_game()
+        encoder = FrameEncoder()
+        view = SpectatorView()
+
+        kind, frame = encoder.encode(game)
+        self.assertEqual(kind, KEYFRAME)
+        view.apply(*split(frame))
+        self.assertIsNone(encoder.encode(game))  # Nothing changed
+
+        piece = Piece('O')
+        piece.position = [0, 18]
+        game.board.place_piece(piece)
+        game.scoring.score = 50
+        kind, frame = encoder.encode(game)
+        self.assertEqual(kind, DELTA)
+        self.assertLess(len(frame), 80)  # Two changed rows, not the whole board
+        view.apply(*split(frame))
+        self.assertEqual(view.board.grid, game.board.grid)
+        self.assertEqual(view.board.colors[18][1], Piece.COLORS['O'])
+        self.assertEqual(view.scoring.score, 50)
+
+    def test_deltas_follow_row_versions(self):
+        game = make_game()
+        game.board = Board(40, 400)
+        encoder = FrameEncoder()
+        view = SpectatorView()
+        view.apply(*split(encoder.encode(game)[1]))
+
+        piece = Piece('I')
+        piece.position = [0, 398]
+        game.board.place_piece(piece)
+        game.board.dirty_rows.clear()  # Versus syncs first and consumes the dirty rows
+        kind, frame = encoder.encode(game)
+        self.assertEqual(kind, DELTA)
+        self.assertLess(len(frame), 100)  # One row of 40 cells
+        view.apply(*split(frame))
+        self.assertEqual(view.board.grid, game.board.grid)
+
+        # A new game's board is sent whole
+        game.board = Board(40, 400)
+        self.assertEqual(encoder.encode(game)[0], KEYFRAME)
+
+    def test_late_joiner_gets_keyframe(self):
+        game = make_game()
+        server = BroadcastServer('127.0.0.1', 0)
+        try:
+            server.publish(game)
+            game.scoring.score = 10
+            server.publish(game)
+            time.sleep(0.1)
+
+            client = SpectatorClient('127.0.0.1', server.port)
+            view = SpectatorView()
+            deadline = time.time() + 5
+            while view.scoring.score != 10 and time.time() < deadline:
+                for frame in client.poll():
+                    view.apply(*frame)
+                time.sleep(0.01)
+            client.close()
+            self.assertTrue(view.synced)
+            self.assertEqual(view.scoring.score, 10)
+        finally:
+            server.close()
+
+    def test_slow_viewer_gets_keyframes_only(self):
+        class FakeWriter:
+            def __init__(self):
+                self.frames = []
+                self.transport = SimpleNamespace(get_write_buffer_size=lambda: self.buffered)
+                self.buffered = 0
+
+            def write(self, frame):
+                self.frames.append(frame)
+
+        server = BroadcastServer('127.0.0.1', 0)
+        try:
+            writer = FakeWriter()
+            server.viewers.append(_Viewer(writer))
+
+            writer.buffered = server.HIGH_WATER + 1
+            server._fan_out(DELTA, b'delta')
+            server._fan_out(KEYFRAME, b'key')
+            self.assertEqual(writer.frames, [b'key'])
+
+            # Deltas resume at the first keyframe after the backlog drains
+            writer.buffered = 0
+            server._fan_out(DELTA, b'delta')
+            server._fan_out(KEYFRAME, b'key2')
+            server._fan_out(DELTA, b'delta2')
+            self.assertEqual(writer.frames, [b'key', b'key2', b'delta2'])
+            server.viewers.clear()
+        finally:
+            server.close()
+
+if __name__ == '__main__':
+    unittest.main()
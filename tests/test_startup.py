@@ -0,0 +1,37 @@
+"""
+Tests for startup costs.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import subprocess
+import unittest
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+class TestStartup(unittest.TestCase):
+
+    def test_board_and_piece_do_not_import_pygame(self):
+        # Headless tools only pay for the game logic
+        code = ("import sys; import src.board, src.piece; "
+                "sys.exit(1 if 'pygame' in sys.modules else 0)")
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT)
+        self.assertEqual(result.returncode, 0)
+
+    def test_import_profiler_times_modules(self):
+        from src.startup import ImportProfiler
+        sys.modules.pop('xml.dom.minidom', None)
+        profiler = ImportProfiler()
+        profiler.install()
+        try:
+            import xml.dom.minidom  # noqa: F401
+        finally:
+            profiler.uninstall()
+        self.assertIn('xml.dom.minidom', profiler.times)
+        own, cumulative = profiler.times['xml.dom.minidom']
+        self.assertGreaterEqual(cumulative, own)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests for the telemetry log and analyzer.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import tempfile
+import unittest
+from src.telemetry import TelemetryLog, TelemetryAnalyzer, read_blocks, PIECE_LOCK
+
+class TestTelemetry(unittest.TestCase):
+
+    def test_blocks_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log = TelemetryLog(tmp, machine='kiosk-1')
+            log.BLOCK_RECORDS = 3
+            log.game_start(seed=42)
+            for shape in 'ITO':
+                log.piece_lock(shape)
+            log.game_end(score=300, lines=1)
+
+            blocks = list(read_blocks(log.path))
+            self.assertEqual([len(columns[0]) for _, columns in blocks], [3, 2])
+            self.assertEqual(blocks[0][0], 'kiosk-1')
+            events = [e for _, columns in blocks for e in columns[1]]
+            self.assertEqual(events.count(PIECE_LOCK), 3)
+            times = [t for _, columns in blocks for t in columns[0]]
+            self.assertEqual(times, sorted(times))
+
+    def test_analyzer_aggregates_games(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log = TelemetryLog(tmp, machine='kiosk-1')
+            for _ in range(2):
+                log.game_start()
+                log.piece_lock('I')
+                log.line_clear(4, 1)
+                log.line_clear(1, 2)
+                log.level_up(2)
+            log.game_end(score=1000, lines=5)
+            log.flush()
+
+            analyzer = TelemetryAnalyzer()
+            analyzer.add_log(log.path)
+            summary = analyzer.summary()
+            # The first game never ended, it is still counted
+            self.assertEqual(summary['games'], 2)
+            self.assertEqual(analyzer.lines, 10)
+            self.assertEqual(summary['tetris_rate'], 0.5)
+            self.assertEqual(summary['combo_rate'], 0.5)
+            self.assertEqual(summary['time_to_level'][2]['games'], 2)
+
+    def test_suspended_game_counts_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            first = TelemetryLog(os.path.join(tmp, 'a'), machine='kiosk-1')
+            first.game_start(seed=7)
+            first.piece_lock('T')
+            first.flush()  # Quit mid-game, suspended
+
+            second = TelemetryLog(os.path.join(tmp, 'b'), machine='kiosk-1')
+            second.game_resume(seed=7, played_ms=50000)
+            second.level_up(2)
+            second.game_end(score=500, lines=10)
+
+            for paths in ([first.path, second.path], [second.path, first.path]):
+                analyzer = TelemetryAnalyzer()
+                for path in paths:
+                    analyzer.add_log(path)
+                summary = analyzer.summary()
+                self.assertEqual(summary['games'], 1)
+                self.assertEqual(analyzer.pieces, 1)
+                # Level 2 came 50 s into the game, not at the resume
+                self.assertEqual(analyzer.level_times[2], {3: 1})
+
+if __name__ == '__main__':
+    unittest.main()
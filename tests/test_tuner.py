@@ -0,0 +1,38 @@
+"""
+Tests for the bot weight tuner.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import tempfile
+import unittest
+from src.tuner import Tuner
+
+class TestTuner(unittest.TestCase):
+
+    def make(self, checkpoint=None):
+        return Tuner(population=6, games=2, max_pieces=40, seed=3, checkpoint=checkpoint)
+
+    def test_resumed_run_matches_uninterrupted_run(self):
+        straight = self.make()
+        straight.run(3)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'tuner.json')
+            first = self.make(checkpoint=path)
+            first.run(2)
+            resumed = Tuner.resume(path)
+            self.assertEqual(resumed.generation, 2)
+            resumed.run(3)
+
+        self.assertEqual(resumed.population, straight.population)
+        self.assertEqual(len(straight.population), 6)
+        # Survivors are kept, the best can only improve
+        fitness = [c['fitness'] for c in straight.population]
+        self.assertEqual(fitness, sorted(fitness, reverse=True))
+        self.assertGreater(straight.best()['fitness'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Tests for online versus.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import time
+import unittest
+from src.board import Board
+from src.piece import Piece
+from src.versus import (VersusConnection, RemoteBoard, encode_board_delta,
+                        MSG_BOARD, MSG_GARBAGE, MSG_DISCONNECT)
+
+class TestVersus(unittest.TestCase):
+
+    def test_delta_sends_only_changed_rows(self):
+        board = Board()
+        remote = RemoteBoard()
+        piece = Piece('O')
+        piece.position = [0, 18]
+        board.place_piece(piece)
+
+        payload = encode_board_delta(board, piece, 120, 3)
+        # Header plus two rows of one index byte and a 2 byte mask
+        self.assertEqual(len(payload), 13 + 2 * 3)
+        self.assertEqual(board.dirty_rows, set())
+
+        remote.apply_delta(payload)
+        self.assertTrue(remote.is_filled(1, 18))
+        self.assertFalse(remote.is_filled(0, 18))
+        self.assertEqual((remote.score, remote.lines), (120, 3))
+        self.assertEqual(sorted(remote.piece_cells()), sorted(piece.get_positions()))
+
+        # Nothing changed, only the header goes out
+        self.assertEqual(len(encode_board_delta(board, piece, 120, 3)), 13)
+
+    def wait_for(self, connection, count):
+        messages = []
+        deadline = time.time() + 5
+        while len(messages) < count and time.time() < deadline:
+            messages += connection.poll()
+            time.sleep(0.01)
+        return messages
+
+    def test_loopback_exchange(self):
+        host = VersusConnection.host(0, bind='127.0.0.1')
+        guest = VersusConnection.join('127.0.0.1', host.port)
+        try:
+            self.assertTrue(host.connected.wait(5))
+            self.assertTrue(guest.connected.wait(5))
+
+            guest.send_garbage(4)
+            host.send_board(Board(), None, 0, 0)
+            (msg_type, payload), = self.wait_for(host, 1)
+            self.assertEqual((msg_type, VersusConnection.garbage_lines(payload)), (MSG_GARBAGE, 4))
+            self.assertEqual(self.wait_for(guest, 1)[0][0], MSG_BOARD)
+
+            guest.close()
+            self.assertEqual(self.wait_for(host, 1)[0][0], MSG_DISCONNECT)
+        finally:
+            host.close()
+            guest.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Tests for the multi-board wall.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from types import SimpleNamespace
+import pygame
+from src.board import Board
+from src.piece import Piece
+from src.renderer import Renderer
+from src.wall import BoardWall
+
+def make_game(score=0):
+    return SimpleNamespace(board=Board(), current_piece=Piece('T'),
+                           scoring=SimpleNamespace(score=score), state=1)
+
+class TestBoardWall(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pygame.init()
+
+    def setUp(self):
+        self.screen = pygame.Surface((1280, 720))
+        self.wall = BoardWall(Renderer(self.screen, SimpleNamespace(get=lambda key: 'NEON')))
+
+    def test_layout_fits_every_board(self):
+        for count in (1, 16, 64):
+            self.wall.layout(count, Board.WIDTH, Board.HEIGHT)
+            self.assertEqual(len(self.wall.positions), count)
+            size = self.wall.block_size
+            for x, y in self.wall.positions:
+                self.assertLessEqual(x + Board.WIDTH * size, 1280)
+                self.assertLessEqual(y + Board.HEIGHT * size + BoardWall.LABEL_HEIGHT, 720)
+        self.assertGreaterEqual(self.wall.block_size, 5)
+
+    def test_only_changed_rows_repaint(self):
+        games = [make_game(i) for i in range(16)]
+        self.wall.draw(games)
+        tile = self.wall.tiles[3]
+        self.assertEqual(self.wall._paint_rows(tile, games[3].board), 0)
+
+        piece = Piece('O')
+        piece.position = [0, 18]
+        games[3].board.place_piece(piece)
+        self.wall.draw(games)
+        self.assertEqual(self.wall._paint_rows(tile, games[3].board), 0)
+        self.assertEqual(tile.grid_rows[19][1:3], [1, 1])
+
+        # Block colors come from one sprite per color in the shared atlas
+        self.assertEqual(len(self.wall.atlas().areas), 2)
+
+    def test_odd_board_size_is_skipped(self):
+        games = [make_game(i) for i in range(4)]
+        # Same height, wider: it would paint past its tile
+        games[2].board = Board(Board.WIDTH + 4, Board.HEIGHT)
+        games[2].board.grid[19] = [1] * (Board.WIDTH + 4)
+        self.wall.draw(games)
+        self.assertEqual(self.wall.tiles[2].grid_rows, [None] * Board.HEIGHT)
+        self.assertEqual(self.wall.tiles[1].grid_rows[19], [0] * Board.WIDTH)
+
+if __name__ == '__main__':
+    unittest.main()